@@ -0,0 +1,18 @@
+# Benchmark: list and dict churn
+records = accumulator()
+i = 0
+while i < 3000:
+    label = "item" + str(i)
+    tags = [i, label, i]
+    accumulate(records, {id: i, name: label, tags: tags})
+    i = i + 1
+end
+total = 0
+for record in records:
+    tags = record.tags
+    last = tags[2]
+    total = total + record.id + last
+end
+count = len(records)
+summary = "records = " + str(count)
+print summary + " total = " + str(total)
@@ -0,0 +1,12 @@
+# Benchmark: recursive calls (function call overhead, env copies)
+function fib(n):
+    if n < 2:
+        return n
+    end
+    a = call fib(n - 1)
+    b = call fib(n - 2)
+    return a + b
+end
+
+result = call fib(16)
+print "fib(16) = " + str(result)
@@ -0,0 +1,28 @@
+# Benchmark: module import fan-out (eight modules sharing one base module)
+import m1 from "lib/mod1"
+import m2 from "lib/mod2"
+import m3 from "lib/mod3"
+import m4 from "lib/mod4"
+import m5 from "lib/mod5"
+import m6 from "lib/mod6"
+import m7 from "lib/mod7"
+import m8 from "lib/mod8"
+
+total = 0
+r = call m1(1)
+total = total + r
+r = call m2(1)
+total = total + r
+r = call m3(1)
+total = total + r
+r = call m4(1)
+total = total + r
+r = call m5(1)
+total = total + r
+r = call m6(1)
+total = total + r
+r = call m7(1)
+total = total + r
+r = call m8(1)
+total = total + r
+print "total = " + str(total)
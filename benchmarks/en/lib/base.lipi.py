@@ -0,0 +1,6 @@
+# Shared base module for the import fan-out benchmark
+function scale(x):
+    return x * 10
+end
+
+export scale
@@ -0,0 +1,9 @@
+# Import fan-out module 1
+import scale from "base"
+
+function m1(x):
+    y = call scale(x)
+    return y + 1
+end
+
+export m1
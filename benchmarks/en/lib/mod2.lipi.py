@@ -0,0 +1,9 @@
+# Import fan-out module 2
+import scale from "base"
+
+function m2(x):
+    y = call scale(x)
+    return y + 2
+end
+
+export m2
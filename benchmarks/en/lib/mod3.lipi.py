@@ -0,0 +1,9 @@
+# Import fan-out module 3
+import scale from "base"
+
+function m3(x):
+    y = call scale(x)
+    return y + 3
+end
+
+export m3
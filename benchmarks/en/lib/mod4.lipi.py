@@ -0,0 +1,9 @@
+# Import fan-out module 4
+import scale from "base"
+
+function m4(x):
+    y = call scale(x)
+    return y + 4
+end
+
+export m4
@@ -0,0 +1,9 @@
+# Import fan-out module 5
+import scale from "base"
+
+function m5(x):
+    y = call scale(x)
+    return y + 5
+end
+
+export m5
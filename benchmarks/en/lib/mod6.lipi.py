@@ -0,0 +1,9 @@
+# Import fan-out module 6
+import scale from "base"
+
+function m6(x):
+    y = call scale(x)
+    return y + 6
+end
+
+export m6
@@ -0,0 +1,9 @@
+# Import fan-out module 7
+import scale from "base"
+
+function m7(x):
+    y = call scale(x)
+    return y + 7
+end
+
+export m7
@@ -0,0 +1,9 @@
+# Import fan-out module 8
+import scale from "base"
+
+function m8(x):
+    y = call scale(x)
+    return y + 8
+end
+
+export m8
@@ -0,0 +1,9 @@
+# Benchmark: tight while loop (expression and statement dispatch)
+total = 0
+i = 0
+while i < 5000:
+    step = i * 2
+    total = total + step
+    i = i + 1
+end
+print "total = " + str(total)
@@ -0,0 +1,31 @@
+# Benchmark: method dispatch with inheritance
+class Shape:
+    function __init__(self, size):
+        self.size = size
+    end
+
+    function area(self):
+        return self.size * self.size
+    end
+
+    function describe(self):
+        return "shape"
+    end
+end
+
+class Square(Shape):
+    function describe(self):
+        return "square"
+    end
+end
+
+sq = Square(3)
+total = 0
+i = 0
+while i < 3000:
+    a = call sq.area()
+    kind = call sq.describe()
+    total = total + a
+    i = i + 1
+end
+print kind + " total = " + str(total)
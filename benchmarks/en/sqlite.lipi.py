@@ -0,0 +1,14 @@
+# Benchmark: SQLite bulk insert and aggregate query
+db = db_connect(":memory:", "bulk_load")
+db_query(db, "CREATE TABLE items (id INTEGER, name TEXT, price REAL)")
+rows = accumulator()
+i = 0
+while i < 5000:
+    price = i * 1.5
+    accumulate(rows, [i, "item" + str(i), price])
+    i = i + 1
+end
+count = db_insert_many(db, "INSERT INTO items VALUES (?, ?, ?)", rows)
+summary = db_query(db, "SELECT COUNT(*) AS n, SUM(price) AS total FROM items")
+db_close(db)
+print "inserted = " + str(count)
@@ -0,0 +1,11 @@
+# Benchmark: export rows to a CSV file, then stream them back as typed rows
+db = db_connect(":memory:")
+sql = "WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < 4999) SELECT i AS id, 'user' || i AS name, i * 3 AS score FROM n"
+written = db_export_csv(db, sql, "bench_stream.csv")
+db_close(db)
+total = 0
+for row in csv_iter("bench_stream.csv", {id: "int", score: "int"}):
+    total = total + row.score
+end
+summary = "rows = " + str(written)
+print summary + " total = " + str(total)
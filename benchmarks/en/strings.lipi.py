@@ -0,0 +1,8 @@
+# Benchmark: string building by repeated concatenation
+text = ""
+i = 0
+while i < 3000:
+    text = text + "line " + str(i) + "; "
+    i = i + 1
+end
+print "length = " + str(len(text))
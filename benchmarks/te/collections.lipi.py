@@ -0,0 +1,18 @@
+# బెంచ్‌మార్క్: జాబితా మరియు నిఘంటువు మార్పులు
+రికార్డులు = సంచయం()
+i = 0
+వరకు i < 3000:
+    పేరు = "అంశం" + str(i)
+    గుర్తులు = [i, పేరు, i]
+    సంచయించు(రికార్డులు, {id: i, name: పేరు, tags: గుర్తులు})
+    i = i + 1
+ముగింపు
+మొత్తం = 0
+పునరావృతం రికార్డు in రికార్డులు:
+    గుర్తులు = రికార్డు.tags
+    చివరి = గుర్తులు[2]
+    మొత్తం = మొత్తం + రికార్డు.id + చివరి
+ముగింపు
+సంఖ్య = len(రికార్డులు)
+సారాంశం = "రికార్డులు = " + str(సంఖ్య)
+చెప్పు సారాంశం + " మొత్తం = " + str(మొత్తం)
@@ -0,0 +1,12 @@
+# బెంచ్‌మార్క్: పునరావృత కాల్స్ (ఫంక్షన్ కాల్ ఖర్చు)
+పనిచేయి ఫిబ్(n):
+    యెడల n < 2:
+        రిటర్న్ n
+    ముగింపు
+    a = కాల్ ఫిబ్(n - 1)
+    b = కాల్ ఫిబ్(n - 2)
+    రిటర్న్ a + b
+ముగింపు
+
+ఫలితం = కాల్ ఫిబ్(16)
+చెప్పు "ఫిబ్(16) = " + str(ఫలితం)
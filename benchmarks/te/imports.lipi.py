@@ -0,0 +1,28 @@
+# బెంచ్‌మార్క్: మాడ్యూల్ దిగుమతి విస్తరణ (ఒకే మూల మాడ్యూల్‌ను పంచుకునే ఎనిమిది మాడ్యూల్స్)
+దిగుమతి మా1 from "lib/mod1"
+దిగుమతి మా2 from "lib/mod2"
+దిగుమతి మా3 from "lib/mod3"
+దిగుమతి మా4 from "lib/mod4"
+దిగుమతి మా5 from "lib/mod5"
+దిగుమతి మా6 from "lib/mod6"
+దిగుమతి మా7 from "lib/mod7"
+దిగుమతి మా8 from "lib/mod8"
+
+మొత్తం = 0
+r = కాల్ మా1(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా2(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా3(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా4(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా5(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా6(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా7(1)
+మొత్తం = మొత్తం + r
+r = కాల్ మా8(1)
+మొత్తం = మొత్తం + r
+చెప్పు "మొత్తం = " + str(మొత్తం)
@@ -0,0 +1,6 @@
+# దిగుమతి విస్తరణ బెంచ్‌మార్క్ కోసం ఉమ్మడి మూల మాడ్యూల్
+పనిచేయి పెంచు(x):
+    రిటర్న్ x * 10
+ముగింపు
+
+ఎగుమతి పెంచు
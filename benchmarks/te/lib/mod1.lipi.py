@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 1
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా1(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 1
+ముగింపు
+
+ఎగుమతి మా1
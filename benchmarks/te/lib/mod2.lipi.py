@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 2
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా2(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 2
+ముగింపు
+
+ఎగుమతి మా2
@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 3
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా3(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 3
+ముగింపు
+
+ఎగుమతి మా3
@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 4
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా4(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 4
+ముగింపు
+
+ఎగుమతి మా4
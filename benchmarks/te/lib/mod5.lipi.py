@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 5
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా5(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 5
+ముగింపు
+
+ఎగుమతి మా5
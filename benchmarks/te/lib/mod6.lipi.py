@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 6
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా6(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 6
+ముగింపు
+
+ఎగుమతి మా6
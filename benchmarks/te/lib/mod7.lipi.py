@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 7
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా7(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 7
+ముగింపు
+
+ఎగుమతి మా7
@@ -0,0 +1,9 @@
+# దిగుమతి విస్తరణ మాడ్యూల్ 8
+దిగుమతి పెంచు from "base"
+
+పనిచేయి మా8(x):
+    y = కాల్ పెంచు(x)
+    రిటర్న్ y + 8
+ముగింపు
+
+ఎగుమతి మా8
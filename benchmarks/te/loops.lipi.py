@@ -0,0 +1,9 @@
+# బెంచ్‌మార్క్: బిగుతైన వరకు లూప్
+మొత్తం = 0
+i = 0
+వరకు i < 5000:
+    అడుగు = i * 2
+    మొత్తం = మొత్తం + అడుగు
+    i = i + 1
+ముగింపు
+చెప్పు "మొత్తం = " + str(మొత్తం)
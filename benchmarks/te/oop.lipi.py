@@ -0,0 +1,31 @@
+# బెంచ్‌మార్క్: వారసత్వంతో మెథడ్ పంపకం
+క్లాస్ ఆకారం:
+    పనిచేయి __init__(స్వీయ, పరిమాణం):
+        స్వీయ.పరిమాణం = పరిమాణం
+    ముగింపు
+
+    పనిచేయి వైశాల్యం(స్వీయ):
+        రిటర్న్ స్వీయ.పరిమాణం * స్వీయ.పరిమాణం
+    ముగింపు
+
+    పనిచేయి వివరణ(స్వీయ):
+        రిటర్న్ "ఆకారం"
+    ముగింపు
+ముగింపు
+
+క్లాస్ చతురస్రం(ఆకారం):
+    పనిచేయి వివరణ(స్వీయ):
+        రిటర్న్ "చతురస్రం"
+    ముగింపు
+ముగింపు
+
+చ = చతురస్రం(3)
+మొత్తం = 0
+i = 0
+వరకు i < 3000:
+    వై = కాల్ చ.వైశాల్యం()
+    రకం = కాల్ చ.వివరణ()
+    మొత్తం = మొత్తం + వై
+    i = i + 1
+ముగింపు
+చెప్పు రకం + " మొత్తం = " + str(మొత్తం)
@@ -0,0 +1,14 @@
+# బెంచ్‌మార్క్: SQLite బహుళ చేర్పు మరియు సమగ్ర ప్రశ్న
+db = డేటాబేస్_కనెక్ట్(":memory:", "bulk_load")
+డేటాబేస్_ప్రశ్న(db, "CREATE TABLE items (id INTEGER, name TEXT, price REAL)")
+వరుసలు = సంచయం()
+i = 0
+వరకు i < 5000:
+    ధర = i * 1.5
+    సంచయించు(వరుసలు, [i, "అంశం" + str(i), ధర])
+    i = i + 1
+ముగింపు
+సంఖ్య = డేటాబేస్_బహుళ_చేర్పు(db, "INSERT INTO items VALUES (?, ?, ?)", వరుసలు)
+సారాంశం = డేటాబేస్_ప్రశ్న(db, "SELECT COUNT(*) AS n, SUM(price) AS total FROM items")
+డేటాబేస్_మూసివేయి(db)
+చెప్పు "చేర్చినవి = " + str(సంఖ్య)
@@ -0,0 +1,11 @@
+# బెంచ్‌మార్క్: వరుసలను CSV ఫైల్‌కు ఎగుమతి చేసి, రకాలతో తిరిగి ప్రవహింపజేయడం
+db = డేటాబేస్_కనెక్ట్(":memory:")
+sql = "WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < 4999) SELECT i AS id, 'user' || i AS name, i * 3 AS score FROM n"
+వ్రాసినవి = డేటాబేస్_ఎగుమతి_csv(db, sql, "bench_stream.csv")
+డేటాబేస్_మూసివేయి(db)
+మొత్తం = 0
+పునరావృతం వరుస in csv_ప్రవాహం("bench_stream.csv", {id: "int", score: "int"}):
+    మొత్తం = మొత్తం + వరుస.score
+ముగింపు
+సారాంశం = "వరుసలు = " + str(వ్రాసినవి)
+చెప్పు సారాంశం + " మొత్తం = " + str(మొత్తం)
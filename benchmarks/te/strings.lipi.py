@@ -0,0 +1,8 @@
+# బెంచ్‌మార్క్: పదే పదే కలపడం ద్వారా పాఠ్యం నిర్మాణం
+పాఠ్యం = ""
+i = 0
+వరకు i < 3000:
+    పాఠ్యం = పాఠ్యం + "పంక్తి " + str(i) + "; "
+    i = i + 1
+ముగింపు
+చెప్పు "పొడవు = " + str(len(పాఠ్యం))
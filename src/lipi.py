@@ -44,6 +44,33 @@ import sqlite3
 import urllib.request
 import urllib.parse
 import json
+import csv
+import re
+import itertools
+import functools
+import bisect
+import heapq
+import operator
+import array
+import io
+import pickle
+import threading
+import asyncio
+import inspect
+import ssl
+import contextvars
+import queue
+import socket
+import socketserver
+import tempfile
+import weakref
+import time
+import tracemalloc
+import multiprocessing
+import subprocess
+from collections import ChainMap, Counter, OrderedDict, deque
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # v3.0: Optional MySQL support
 try:
@@ -60,28 +87,390 @@ try:
 except ImportError:
     POSTGRES_AVAILABLE = False
 
+# v3.0: Optional NumPy backend for array()
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # ---------------------------
 # Global Runtime Environment
 # ---------------------------
-class LipiRuntime:
-    """Global runtime state for Lipi interpreter"""
+class SourceLine(str):
+    """
+    A line of Lipi source tagged with its file name and line number, so
+    profilers and tracers can attribute work to it. strip() keeps the tags,
+    which lets them survive block and function-body collection.
+    """
+    def __new__(cls, text, filename=None, lineno=None):
+        line = super().__new__(cls, text)
+        line.filename = filename
+        line.lineno = lineno
+        return line
+
+    def strip(self, chars=None):
+        stripped = str.strip(self, chars)
+        if len(stripped) == len(self):
+            return self
+        return SourceLine(stripped, self.filename, self.lineno)
+
+    def __reduce__(self):
+        return (SourceLine, (str(self), self.filename, self.lineno))
+
+
+def tag_lines(lines, filename):
+    """Tag plain source lines with filename and 1-based line numbers"""
+    return [line if isinstance(line, SourceLine) else SourceLine(line, filename, lineno)
+            for lineno, line in enumerate(lines, 1)]
+
+
+class RuntimeStats:
+    """
+    Cheap interpreter counters (lipi --stats). Enabled by setting runtime.stats;
+    when it is None every counting site is a single attribute check. Counts
+    from parallel-for worker threads are best-effort.
+    """
+    COUNTERS = ['expressions', 'statements', 'function_calls', 'method_calls', 'env_copies',
+                'module_cache_hits', 'module_cache_misses', 'db_queries', 'db_rows',
+                'http_requests', 'http_bytes', 'file_reads', 'file_writes', 'file_bytes']
+    LABELS = {
+        'en': {
+            'title': 'Runtime statistics', 'wall_seconds': 'Wall time (s)', 'cpu_seconds': 'CPU time (s)',
+            'expressions': 'Expressions evaluated', 'statements': 'Statements executed',
+            'function_calls': 'Function calls', 'method_calls': 'Method calls',
+            'env_copies': 'Environment copies', 'module_cache_hits': 'Module cache hits',
+            'module_cache_misses': 'Module cache misses', 'db_queries': 'DB queries',
+            'db_rows': 'DB rows fetched', 'http_requests': 'HTTP requests', 'http_bytes': 'HTTP bytes',
+            'file_reads': 'File reads', 'file_writes': 'File writes', 'file_bytes': 'File bytes',
+        },
+        'te': {
+            'title': 'రన్‌టైమ్ గణాంకాలు', 'wall_seconds': 'గడియార సమయం (s)', 'cpu_seconds': 'CPU సమయం (s)',
+            'expressions': 'మూల్యాంకనం చేసిన వ్యక్తీకరణలు', 'statements': 'అమలైన వాక్యాలు',
+            'function_calls': 'ఫంక్షన్ కాల్స్', 'method_calls': 'మెథడ్ కాల్స్',
+            'env_copies': 'ఎన్విరాన్‌మెంట్ కాపీలు', 'module_cache_hits': 'మాడ్యూల్ కాష్ హిట్లు',
+            'module_cache_misses': 'మాడ్యూల్ కాష్ మిస్‌లు', 'db_queries': 'డేటాబేస్ ప్రశ్నలు',
+            'db_rows': 'తెచ్చిన డేటాబేస్ వరుసలు', 'http_requests': 'HTTP అభ్యర్థనలు',
+            'http_bytes': 'HTTP బైట్లు', 'file_reads': 'ఫైల్ చదువులు', 'file_writes': 'ఫైల్ వ్రాతలు',
+            'file_bytes': 'ఫైల్ బైట్లు',
+        },
+    }
+
     def __init__(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.cpu_started = time.process_time()
+
+    def add(self, name, amount=1):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def as_dict(self):
+        data = {name: getattr(self, name) for name in self.COUNTERS}
+        data['wall_seconds'] = round(time.perf_counter() - self.started, 6)
+        data['cpu_seconds'] = round(time.process_time() - self.cpu_started, 6)
+        return data
+
+    def report(self, lang='en'):
+        labels = self.LABELS.get(lang, self.LABELS['en'])
+        data = self.as_dict()
+        out = [labels['title']]
+        for name in ['wall_seconds', 'cpu_seconds'] + self.COUNTERS:
+            out.append(f"  {labels[name]:<32} {data[name]:>14}")
+        return '\n'.join(out)
+
+
+def count_stat(name, amount=1):
+    """Add to a RuntimeStats counter of the current runtime, if stats are enabled"""
+    stats = _current_runtime.get().stats
+    if stats is not None:
+        stats.add(name, amount)
+
+
+class ModuleSourceCache:
+    """
+    Parsed module sources keyed by path, shared by every runtime in the process.
+    Entries are invalidated when the file's mtime or size changes. Only the
+    immutable source split is cached; each runtime still executes the module
+    into its own scope and keeps its own loaded_modules exports.
+    """
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, module_path):
+        """Return (lines, export_names) for a module file"""
+        stat = os.stat(module_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(module_path)
+        if entry is not None and entry[0] == version:
+            count_stat('module_cache_hits')
+            return entry[1]
+
+        count_stat('module_cache_misses')
+        with open(module_path, 'r', encoding='utf-8') as f:
+            module_code = f.read()
+        count_stat('file_reads')
+        count_stat('file_bytes', len(module_code))
+
+        # Collect export statements; keep every other line for execution
+        export_names = []
+        filtered_lines = []
+        for lineno, line in enumerate(module_code.split('\n'), 1):
+            stripped = line.strip()
+            if stripped.startswith('ఎగుమతి ') or stripped.startswith('export '):
+                export_keyword = 'ఎగుమతి ' if stripped.startswith('ఎగుమతి ') else 'export '
+                exports_str = stripped[len(export_keyword):].strip()
+                export_names.extend(name.strip() for name in exports_str.split(','))
+            else:
+                filtered_lines.append(SourceLine(line, module_path, lineno))
+
+        parsed = (tuple(filtered_lines), tuple(export_names))
+        with self._lock:
+            self._entries[module_path] = (version, parsed)
+        return parsed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+SHARED_MODULE_CACHE = ModuleSourceCache()
+DEFAULT_HTTP_TIMEOUT = 30.0  # Seconds to connect or wait for data, sync and async HTTP
+
+
+class LipiRuntime:
+    """
+    Interpreter state for one Lipi program. Each runtime has its own functions,
+    classes, modules and connections, so a host can run many isolated programs
+    concurrently. Bind a runtime with use_runtime(rt) or rt.run_source(...).
+    """
+    def __init__(self, module_cache=None, error_language=None):
         self.functions = {}  # User-defined functions
         self.python_modules = {}  # Imported Python modules
         self.modules = {}  # Imported Lipi modules
         self.exports = {}  # Module exports
         self.db_connections = {}  # Database connections
+        self.db_locks = {}  # Per-connection locks for parallel loops
         self.loaded_modules = {}  # v3.0: Track loaded module exports
         self.module_stack = []  # v3.0: Detect circular imports
         self.current_module_path = None  # v3.0: Track current module for relative imports
         self.classes = {}  # v3.0: User-defined classes
+        self.parallel_workers = 8  # Thread pool size for parallel for loops
+        self.http_timeout = DEFAULT_HTTP_TIMEOUT  # Seconds before an HTTP request gives up
+        self.event_loop = None  # asyncio loop driving await / async built-ins
+        self.error_language = error_language  # 'en' / 'te'; None uses ERROR_LANGUAGE
+        self.module_cache = module_cache or SHARED_MODULE_CACHE  # Shareable parsed modules
+        self.program_envs = weakref.WeakKeyDictionary()  # LipiProgram -> (top-level env, functions), for call()
+        self.profiler = None  # LipiProfiler while running with --profile
+        self.sampler = None  # LipiSampler while running with --sample
+        self.tracer = None  # Callback installed with set_trace()
+        self.stats = None  # RuntimeStats while running with --stats
+        self.cassette = None  # LipiCassette while running with --record / --replay
         self.whitelist_modules = [
             'math', 'json', 'datetime', 'random', 're', 'time',
             'collections', 'itertools', 'functools', 'operator'
         ]  # Safe Python modules
 
+    def get_event_loop(self):
+        """Return this runtime's asyncio event loop, creating it on first use"""
+        if self.event_loop is None or self.event_loop.is_closed():
+            self.event_loop = asyncio.new_event_loop()
+        return self.event_loop
+
+    def run_async(self, awaitable):
+        """Drive an awaitable to completion on the runtime's loop (top-level await)"""
+        if not inspect.isawaitable(awaitable):
+            return awaitable  # Awaiting a plain value just returns it
+        loop = self.get_event_loop()
+        if loop.is_running():
+            raise LipiException("await is only supported in statements of an async function body, "
+                                "not inside nested synchronous blocks")
+        return loop.run_until_complete(awaitable)
+
+    def set_trace(self, callback):
+        """
+        Install callback(event, target, value) for execution events, or None to remove it:
+          'line'      target = SourceLine about to run,   value = env
+          'call'      target = function / Class.method,   value = the call's env
+          'return'    target = function / Class.method,   value = return value (None on error)
+          'exception' target = SourceLine that raised,    value = the exception (reported once)
+        The callback runs on whichever thread executes the code.
+        """
+        if callback is not None and not callable(callback):
+            raise LipiException(get_error_message('type_error', "set_trace expects a callable or None"))
+        self.tracer = callback
+
+    def run_source(self, source, env=None, path=None):
+        """Run Lipi source text (or a list of lines) in this runtime. Returns the env."""
+        env = {} if env is None else env
+        lines = source.split('\n') if isinstance(source, str) else list(source)
+        lines = tag_lines(lines, os.path.abspath(path) if path else '<string>')
+        with use_runtime(self):
+            prev_module_path = self.current_module_path
+            if path:
+                self.current_module_path = os.path.abspath(path)
+            try:
+                execute_block(lines, env)
+            finally:
+                self.current_module_path = prev_module_path
+        return env
+
+    def close(self):
+        """Close this runtime's database connections and event loop"""
+        for conn in self.db_connections.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self.db_connections.clear()
+        self.db_locks.clear()
+        if self.event_loop is not None and not self.event_loop.is_closed():
+            self.event_loop.close()
+        self.event_loop = None
+
+
+# The runtime executing in the current thread / asyncio task. Hosts bind their
+# own with use_runtime(); everything else falls back to the process default.
+_default_runtime = LipiRuntime()
+_current_runtime = contextvars.ContextVar('lipi_runtime', default=_default_runtime)
+
+
+def get_runtime():
+    """Return the LipiRuntime bound to the current context"""
+    return _current_runtime.get()
+
+
+@contextmanager
+def use_runtime(rt):
+    """Bind rt as the current runtime for the duration of a with block"""
+    token = _current_runtime.set(rt)
+    try:
+        yield rt
+    finally:
+        _current_runtime.reset(token)
+
+
+class RuntimeProxy:
+    """Module-level `runtime` handle that forwards to the context's current runtime"""
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(_current_runtime.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(_current_runtime.get(), name, value)
+
+    def __repr__(self):
+        return f"<runtime proxy for {_current_runtime.get()!r}>"
+
+
+runtime = RuntimeProxy()
+
+
+# ---------------------------
+# SQLite Connection Profiles
+# ---------------------------
+# Named PRAGMA presets for db_connect(path, "preset") / db_connect(path, {options})
+SQLITE_PRESETS = {
+    'bulk_load': {
+        'journal_mode': 'wal',
+        'synchronous': 'off',
+        'cache_size': -262144,  # 256 MiB (negative = KiB)
+        'temp_store': 'memory',
+        'mmap_size': 268435456,
+    },
+    'read_heavy': {
+        'journal_mode': 'wal',
+        'synchronous': 'normal',
+        'cache_size': -131072,  # 128 MiB
+        'temp_store': 'memory',
+        'mmap_size': 1073741824,
+    },
+    'durable': {
+        'journal_mode': 'wal',
+        'synchronous': 'full',
+        'cache_size': -16384,  # 16 MiB
+        'temp_store': 'default',
+        'mmap_size': 0,
+    },
+}
+
+# Allowed values for enumerated PRAGMAs (PRAGMA values cannot be parameterized)
+SQLITE_PRAGMA_CHOICES = {
+    'journal_mode': ['delete', 'truncate', 'persist', 'memory', 'wal', 'off'],
+    'synchronous': ['off', 'normal', 'full', 'extra'],
+    'temp_store': ['default', 'file', 'memory'],
+}
+SQLITE_INT_PRAGMAS = ['mmap_size', 'cache_size']
+
+
+def open_sqlite_connection(db_path, options=None):
+    """
+    Open a SQLite connection and apply a performance profile.
+
+    Args:
+        db_path: Path to the database file (or ":memory:")
+        options: None, a preset name ("bulk_load", "read_heavy", "durable"),
+                 or a dict of journal_mode, synchronous, mmap_size, cache_size,
+                 temp_store, read_only and an optional base "preset"
+
+    Returns:
+        sqlite3.Connection with the requested PRAGMAs applied. The connection may be
+        used from parallel loop threads; callers serialize access with connection_lock.
+    """
+    if options is None:
+        options = {}
+    if isinstance(options, str):
+        options = {'preset': options}
+    if not isinstance(options, dict):
+        raise LipiException("db_connect options must be a preset name or an object")
+
+    # Preset first, explicit options override it
+    settings = {}
+    preset = options.get('preset')
+    if preset is not None:
+        if preset not in SQLITE_PRESETS:
+            raise LipiException(
+                f"Unknown db_connect preset: {preset} (choose from {', '.join(SQLITE_PRESETS)})")
+        settings.update(SQLITE_PRESETS[preset])
+    settings.update({k: v for k, v in options.items() if k != 'preset'})
+
+    read_only = bool(settings.pop('read_only', False))
+    if read_only and db_path in (':memory:', ''):
+        # A read-only URI would name a file in the working directory instead
+        raise LipiException("read_only needs a database file, not an in-memory or temporary database")
+
+    pragmas = []
+    for name, value in settings.items():
+        if name in SQLITE_PRAGMA_CHOICES:
+            value = str(value).lower()
+            if value not in SQLITE_PRAGMA_CHOICES[name]:
+                raise LipiException(
+                    f"Invalid {name}: {value} (choose from {', '.join(SQLITE_PRAGMA_CHOICES[name])})")
+        elif name in SQLITE_INT_PRAGMAS:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise LipiException(f"{name} must be an integer, got {value!r}")
+        else:
+            raise LipiException(f"Unknown db_connect option: {name}")
+        pragmas.append((name, value))
+
+    if read_only:
+        uri = f"file:{urllib.parse.quote(os.path.abspath(db_path))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+
+    for name, value in pragmas:
+        # Changing journal_mode needs write access; a read-only handle keeps the file's mode
+        if read_only and name == 'journal_mode':
+            continue
+        conn.execute(f"PRAGMA {name} = {value}")
 
-runtime = LipiRuntime()
+    return conn
 
 
 # ---------------------------
@@ -113,6 +502,8 @@ ERROR_MESSAGES = {
         'attribute_error': 'Attribute error',
         'index_error': 'Index out of range',
         'key_error': 'Key not found',
+        'cassette_miss': 'Cassette has no recorded result for',
+        'regex_error': 'Invalid regular expression',
     },
     'te': {
         'runtime_error': 'రన్‌టైమ్ లోపం',
@@ -134,6 +525,8 @@ ERROR_MESSAGES = {
         'attribute_error': 'ఆట్రిబ్యూట్ లోపం',
         'index_error': 'ఇండెక్స్ పరిధి దాటింది',
         'key_error': 'కీ కనుగొనబడలేదు',
+        'cassette_miss': 'క్యాసెట్‌లో నమోదైన ఫలితం లేదు',
+        'regex_error': 'చెల్లని నమూనా (regular expression)',
     }
 }
 
@@ -148,7 +541,7 @@ def get_error_message(error_key, detail=None):
     Returns:
         Formatted error message string
     """
-    lang = ERROR_LANGUAGE[0]  # Get current language from mutable list
+    lang = runtime.error_language or ERROR_LANGUAGE[0]  # Per-runtime override, else process default
     prefix = '[లోపం]' if lang == 'te' else '[Error]'
 
     # Get base message
@@ -230,6 +623,7 @@ def load_lipi_module(module_path, runtime, parent_env):
     """
     # Check if already loaded (module caching)
     if module_path in runtime.loaded_modules:
+        count_stat('module_cache_hits')
         return runtime.loaded_modules[module_path]
 
     # Check for circular imports
@@ -245,38 +639,22 @@ def load_lipi_module(module_path, runtime, parent_env):
     runtime.module_stack.append(module_path)
     prev_module_path = runtime.current_module_path
     runtime.current_module_path = module_path
+    sampler = runtime.sampler
+    if sampler is not None:
+        sampler.push(os.path.basename(module_path))
 
     try:
-        # Read module file
-        with open(module_path, 'r', encoding='utf-8') as f:
-            module_code = f.read()
+        # Parsed source (export list split out) is shared across runtimes
+        filtered_lines, temp_exports_list = runtime.module_cache.get(module_path)
 
         # Create new environment for module
         module_env = parent_env.copy()  # Inherit parent scope
+        count_stat('env_copies')
         module_exports = {}
 
-        # Split into lines
-        lines = module_code.split('\n')
-
-        # Track what to export (collect export statements first)
-        temp_exports_list = []
-        filtered_lines = []
-
-        for line in lines:
-            stripped = line.strip()
-            # Collect export statements but don't execute them
-            if stripped.startswith('ఎగుమతి ') or stripped.startswith('export '):
-                export_keyword = 'ఎగుమతి ' if stripped.startswith('ఎగుమతి ') else 'export '
-                exports_str = stripped[len(export_keyword):].strip()
-                export_names = [name.strip() for name in exports_str.split(',')]
-                temp_exports_list.extend(export_names)
-            else:
-                # Keep non-export lines for execution
-                filtered_lines.append(line)
-
         # Execute the module code (handles multi-line functions properly)
         try:
-            execute_block(filtered_lines, module_env)
+            execute_block(list(filtered_lines), module_env)
         except LipiReturnValue:
             # Returns shouldn't escape module scope
             pass
@@ -297,6 +675,8 @@ def load_lipi_module(module_path, runtime, parent_env):
 
     finally:
         # Pop from module stack
+        if sampler is not None:
+            sampler.pop()
         runtime.module_stack.pop()
         runtime.current_module_path = prev_module_path
 
@@ -402,9 +782,32 @@ def find_operator_outside_strings(expr, operator):
     return -1
 
 
+def find_top_level_operator(expr, operator):
+    """
+    Find the position of an operator outside string literals and outside
+    parentheses, brackets and braces. Returns -1 if not found.
+    """
+    depth = 0
+    string_char = None
+    for i, char in enumerate(expr):
+        if string_char:
+            if char == string_char:
+                string_char = None
+        elif char in '"\'':
+            string_char = char
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+        elif depth == 0 and expr.startswith(operator, i):
+            return i
+    return -1
+
+
 def split_arguments(args_str):
     """
-    Split function arguments by comma, respecting string boundaries and parentheses.
+    Split function arguments by comma, respecting string boundaries, parentheses,
+    brackets and braces.
     Example: 'a, "b, c", d' -> ['a', '"b, c"', 'd']
     """
     args = []
@@ -413,6 +816,7 @@ def split_arguments(args_str):
     string_char = None
     paren_depth = 0
     bracket_depth = 0
+    brace_depth = 0
 
     for i, char in enumerate(args_str):
         # Track string boundaries
@@ -434,9 +838,13 @@ def split_arguments(args_str):
                 bracket_depth += 1
             elif char == ']':
                 bracket_depth -= 1
+            elif char == '{':
+                brace_depth += 1
+            elif char == '}':
+                brace_depth -= 1
 
-            # Split on comma only if not in string and all brackets/parens are balanced
-            if char == ',' and paren_depth == 0 and bracket_depth == 0:
+            # Split on comma only if not in string and all brackets/parens/braces are balanced
+            if char == ',' and paren_depth == 0 and bracket_depth == 0 and brace_depth == 0:
                 args.append(''.join(current).strip())
                 current = []
                 continue
@@ -450,6 +858,359 @@ def split_arguments(args_str):
     return args
 
 
+# ---------------------------
+# Record / Replay Cassettes (--record / --replay)
+# ---------------------------
+# A cassette is a JSON Lines file with one {"kind", "request", "result"} (or
+# "error") entry per intercepted I/O call. Replay answers each call with the
+# next recorded entry for the same kind and request, without touching the
+# network, database or disk.
+class LipiCassette:
+    """Records I/O results to a cassette file, or serves them back on replay"""
+    def __init__(self, path, mode):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.entries = {}  # (kind, request key) -> deque of recorded entries
+        if mode == 'record':
+            self.file = open(path, 'w', encoding='utf-8')
+        else:
+            self.file = None
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        key = (entry['kind'], self.request_key(entry['request']))
+                        self.entries.setdefault(key, deque()).append(entry)
+
+    @staticmethod
+    def request_key(request):
+        return json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+
+    def record(self, kind, request, result=None, error=None):
+        entry = {'kind': kind, 'request': request}
+        if error is not None:
+            entry['error'] = error
+        else:
+            entry['result'] = result
+        text = json.dumps(entry, ensure_ascii=False, default=str)
+        with self.lock:
+            self.file.write(text + '\n')
+            self.file.flush()
+
+    def replay(self, kind, request):
+        """Return the next recorded result for this call, raising recorded errors"""
+        with self.lock:
+            queue = self.entries.get((kind, self.request_key(request)))
+            entry = queue.popleft() if queue else None
+        if entry is None:
+            raise LipiException(get_error_message('cassette_miss', f"{kind} {self.request_key(request)}"))
+        if 'error' in entry:
+            raise LipiException(entry['error'])
+        return entry['result']
+
+    def intercept(self, kind, request, func, args):
+        if self.mode == 'replay':
+            return self.replay(kind, request)
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.record(kind, request, error=str(e))
+            raise
+        self.record(kind, request, result)
+        return result
+
+    async def intercept_async(self, kind, request, make_awaitable):
+        if self.mode == 'replay':
+            return self.replay(kind, request)
+        try:
+            result = await make_awaitable()
+        except Exception as e:
+            self.record(kind, request, error=str(e))
+            raise
+        self.record(kind, request, result)
+        return result
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def recordable(kind, describe, on_replay=None):
+    """
+    Route calls through the current runtime's cassette, if any. describe(*args)
+    builds the JSON request that identifies the call; on_replay(*args) runs
+    instead of the real call on replay (e.g. to drain an input iterator).
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            cassette = _current_runtime.get().cassette
+            if cassette is None:
+                return func(*args)
+            if on_replay is not None and cassette.mode == 'replay':
+                on_replay(*args)
+            return cassette.intercept(kind, describe(*args), func, args)
+        return wrapper
+    return decorate
+
+
+def recordable_awaitable(kind, request, make_awaitable):
+    """Awaitable counterpart of recordable() for the async I/O built-ins"""
+    cassette = _current_runtime.get().cassette
+    if cassette is None:
+        return make_awaitable()
+    return cassette.intercept_async(kind, request, make_awaitable)
+
+
+# ---------------------------
+# I/O Built-in Implementations (v3.0)
+# ---------------------------
+# Shared by the synchronous built-ins and their async variants.
+@recordable('file_read', lambda file_path: {'path': file_path})
+def read_text_file(file_path):
+    """Read a whole UTF-8 text file (file_read)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        raise LipiException(f"File read error: {e}")
+    count_stat('file_reads')
+    count_stat('file_bytes', len(content))
+    return content
+
+
+@recordable('file_stream', lambda file_path: {'path': file_path})
+def read_stream_text(file_path):
+    """Whole file for csv_iter / jsonl_iter while recording or replaying a cassette"""
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+    except Exception as e:
+        raise LipiException(f"File read error: {e}")
+    count_stat('file_reads')
+    count_stat('file_bytes', len(content))
+    return content
+
+
+@recordable('http_get', lambda url: {'url': url})
+def http_get_request(url):
+    """Blocking HTTP GET returning the decoded body (http_get)"""
+    try:
+        with urllib.request.urlopen(url, timeout=runtime.http_timeout) as response:
+            content = response.read()
+    except Exception as e:
+        raise LipiException(f"HTTP GET error: {e}")
+    count_stat('http_requests')
+    count_stat('http_bytes', len(content))
+    return content.decode('utf-8')
+
+
+@recordable('http_post', lambda url, data: {'url': url, 'data': data})
+def http_post_request(url, data):
+    """Blocking HTTP POST of a string or JSON object (http_post)"""
+    try:
+        # Convert dict to JSON if needed
+        if isinstance(data, dict):
+            data = json.dumps(data)
+        data_bytes = data.encode('utf-8')
+        req = urllib.request.Request(url, data=data_bytes, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req, timeout=runtime.http_timeout) as response:
+            content = response.read()
+    except Exception as e:
+        raise LipiException(f"HTTP POST error: {e}")
+    count_stat('http_requests')
+    count_stat('http_bytes', len(data_bytes) + len(content))
+    return content.decode('utf-8')
+
+
+@recordable('db_query', lambda conn_id, sql: {'conn': conn_id, 'sql': sql})
+def execute_db_query(conn_id, sql):
+    """Run SQL on a SQLite connection: list of row objects for SELECT, else row count"""
+    try:
+        if conn_id not in runtime.db_connections:
+            raise LipiException(f"Invalid database connection: {conn_id}")
+        with connection_lock(conn_id):
+            conn = runtime.db_connections[conn_id]
+            cursor = conn.cursor()
+            cursor.execute(sql)
+            conn.commit()
+            count_stat('db_queries')
+            # Return results for SELECT, row count for other operations
+            if sql.strip().upper().startswith('SELECT'):
+                results = cursor.fetchall()
+                count_stat('db_rows', len(results))
+                # Convert to list of dicts
+                columns = [desc[0] for desc in cursor.description]
+                return [dict(zip(columns, row)) for row in results]
+            return cursor.rowcount
+    except Exception as e:
+        raise LipiException(f"Database query error: {e}")
+
+
+@recordable('db_query', lambda conn_id, sql, params=None: {'conn': conn_id, 'sql': sql, 'params': params})
+def execute_mysql_query(conn_id, sql, params=None):
+    """Run SQL on a MySQL connection: list of row objects for SELECT, else affected rows"""
+    try:
+        if conn_id not in runtime.db_connections:
+            raise LipiException(f"Invalid MySQL connection: {conn_id}")
+
+        with connection_lock(conn_id):
+            conn = runtime.db_connections[conn_id]
+            cursor = conn.cursor(dictionary=True)  # Return results as dictionaries
+
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+
+            conn.commit()
+            count_stat('db_queries')
+
+            # Fetch results if it's a SELECT query
+            if sql.strip().upper().startswith('SELECT'):
+                results = cursor.fetchall()
+                count_stat('db_rows', len(results))
+                cursor.close()
+                return results
+            else:
+                # For INSERT/UPDATE/DELETE, return affected rows
+                affected = cursor.rowcount
+                cursor.close()
+                return affected
+    except Exception as e:
+        raise LipiException(f"MySQL query error: {e}")
+
+
+@recordable('db_query', lambda conn_id, sql, params=None: {'conn': conn_id, 'sql': sql, 'params': params})
+def execute_postgres_query(conn_id, sql, params=None):
+    """Run SQL on a PostgreSQL connection: list of row objects for SELECT, else affected rows"""
+    try:
+        if conn_id not in runtime.db_connections:
+            raise LipiException(f"Invalid PostgreSQL connection: {conn_id}")
+
+        with connection_lock(conn_id):
+            conn = runtime.db_connections[conn_id]
+            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)  # Return results as dictionaries
+
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+
+            conn.commit()
+            count_stat('db_queries')
+
+            # Fetch results if it's a SELECT query
+            if sql.strip().upper().startswith('SELECT'):
+                results = cursor.fetchall()
+                count_stat('db_rows', len(results))
+                # Convert RealDictRow to regular dict
+                results = [dict(row) for row in results]
+                cursor.close()
+                return results
+            else:
+                # For INSERT/UPDATE/DELETE, return affected rows
+                affected = cursor.rowcount
+                cursor.close()
+                return affected
+    except Exception as e:
+        raise LipiException(f"PostgreSQL query error: {e}")
+
+
+CONNECTION_DRIVERS = {'db': 'sqlite', 'mysql': 'mysql', 'pg': 'postgres'}  # Connection id prefix -> driver
+
+
+@recordable('db_connect',
+            lambda prefix, target, connect: {'driver': CONNECTION_DRIVERS[prefix], 'target': target})
+def register_connection(prefix, target, connect):
+    """Open a connection with connect() and register it under a new '<prefix>_...' id"""
+    conn = connect()
+    conn_id = f"{prefix}_{id(conn)}"
+    runtime.db_connections[conn_id] = conn
+    return conn_id
+
+
+@recordable('db_close', lambda conn_id, prefix=None: {'conn': conn_id})
+def close_connection(conn_id, prefix=None):
+    """Close and forget a connection; False if conn_id is unknown (or not a prefix connection)"""
+    if conn_id in runtime.db_connections and (prefix is None or conn_id.startswith(prefix + '_')):
+        runtime.db_connections[conn_id].close()
+        del runtime.db_connections[conn_id]
+        runtime.db_locks.pop(conn_id, None)
+        return True
+    return False
+
+
+# ---------------------------
+# Built-in Function Registry
+# ---------------------------
+# Built-ins registered here are dispatched with a single dict lookup on the
+# name before '(' instead of walking the startswith() chain in eval_lipi_expr.
+BUILTIN_FUNCTIONS = {}
+
+
+def lipi_builtin(*names):
+    """
+    Register a built-in function under its English and Telugu names.
+
+    The handler is called as handler(args, env) where args is the list of
+    unevaluated argument expressions (see split_arguments).
+    """
+    def register(handler):
+        for name in names:
+            BUILTIN_FUNCTIONS[name] = handler
+        return handler
+    return register
+
+
+def find_closing_paren(expr, open_pos):
+    """
+    Find the parenthesis matching the one at open_pos, ignoring string contents.
+    Returns the position, or -1 if unbalanced.
+    """
+    depth = 0
+    in_string = False
+    string_char = None
+
+    for i in range(open_pos, len(expr)):
+        char = expr[i]
+        if char in ['"', "'"] and (i == 0 or expr[i-1] != '\\'):
+            if not in_string:
+                in_string = True
+                string_char = char
+            elif char == string_char:
+                in_string = False
+                string_char = None
+        elif not in_string:
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth == 0:
+                    return i
+
+    return -1
+
+
+def match_builtin_call(expr):
+    """
+    Match an expression that is exactly one registered built-in call.
+    Returns (handler, args) or None.
+    """
+    paren_pos = expr.find('(')
+    if paren_pos <= 0:
+        return None
+    handler = BUILTIN_FUNCTIONS.get(expr[:paren_pos])
+    if handler is None or find_closing_paren(expr, paren_pos) != len(expr) - 1:
+        return None
+    args_str = expr[paren_pos+1:-1].strip()
+    return handler, (split_arguments(args_str) if args_str else [])
+
+
 def eval_lipi_expr(expr, env):
     """
     Evaluate a Lipi expression.
@@ -467,6 +1228,9 @@ def eval_lipi_expr(expr, env):
     - List/object indexing: list[0], obj["key"]
     - Built-in functions: len(), str(), int()
     """
+    stats = _current_runtime.get().stats
+    if stats is not None:
+        stats.expressions += 1
     expr = expr.strip()
 
     # Handle null/శూన్యం
@@ -479,6 +1243,18 @@ def eval_lipi_expr(expr, env):
     if expr in ['false', 'అబద్ధం']:
         return False
 
+    # Lambda: lambda x: expr / lambda(a, b): expr / లాంబ్డా x: expr
+    if expr.startswith(LAMBDA_KEYWORDS):
+        lipi_lambda = parse_lambda(expr, env)
+        if lipi_lambda is not None:
+            return lipi_lambda
+
+    # Membership: x in items / x లో items / x not in items
+    if ' in ' in expr or ' లో ' in expr:
+        membership = eval_membership(expr, env)
+        if membership is not None:
+            return membership
+
     # String literal (only if no operators outside quotes)
     if (expr.startswith('"') and expr.endswith('"')) or \
        (expr.startswith("'") and expr.endswith("'")):
@@ -489,14 +1265,17 @@ def eval_lipi_expr(expr, env):
             return expr[1:-1]
         # Otherwise, fall through to operator handling below
 
+    # Template literal: f"Hello {name}"
+    if is_template_literal(expr):
+        return eval_template(expr, env)
+
     # List literal [1, 2, 3]
     if expr.startswith('[') and expr.endswith(']'):
         list_content = expr[1:-1].strip()
         if not list_content:
             return []
-        # Simple comma-separated parsing (TODO: handle nested structures)
         items = []
-        for item in list_content.split(','):
+        for item in split_arguments(list_content):
             items.append(eval_lipi_expr(item.strip(), env))
         return items
 
@@ -505,9 +1284,11 @@ def eval_lipi_expr(expr, env):
         obj_content = expr[1:-1].strip()
         if not obj_content:
             return {}
+        # Set literal {1, 2, 3}: no key: value pairs
+        if find_top_level_operator(obj_content, ':') == -1:
+            return make_set(eval_lipi_expr(item, env) for item in split_arguments(obj_content))
         obj = {}
-        # Simple parsing (TODO: handle nested structures)
-        pairs = obj_content.split(',')
+        pairs = split_arguments(obj_content)
         for pair in pairs:
             if ':' in pair:
                 key, value = pair.split(':', 1)
@@ -537,6 +1318,27 @@ def eval_lipi_expr(expr, env):
         call_expr = expr[5:] if expr.startswith('call ') else expr[4:]
         return eval_function_call(call_expr, env)
 
+    # Method call on a built-in object: sb.append(text)
+    matched, result = eval_native_method_call(expr, env)
+    if matched:
+        return result
+
+    # Python module function call: math.sqrt(16)
+    matched, result = eval_module_call(expr, env)
+    if matched:
+        return result
+
+    # Await: await expr / వేచి expr (top level; async bodies use execute_block_async)
+    for kw in AWAIT_KEYWORDS:
+        if expr.startswith(kw):
+            return runtime.run_async(eval_lipi_expr(expr[len(kw):], env))
+
+    # Registered built-in functions (see lipi_builtin)
+    builtin_call = match_builtin_call(expr)
+    if builtin_call:
+        handler, args = builtin_call
+        return handler(args, env)
+
     # Built-in function: len(expr)
     if expr.startswith('len(') and expr.endswith(')'):
         arg_expr = expr[4:-1]
@@ -560,11 +1362,7 @@ def eval_lipi_expr(expr, env):
         start = len('file_read(') if expr.startswith('file_read(') else len('ఫైల్_చదువు(')
         arg_expr = expr[start:-1]
         file_path = eval_lipi_expr(arg_expr, env)
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            raise LipiException(f"File read error: {e}")
+        return read_text_file(file_path)
 
     # File I/O: file_write(path, content) / ఫైల్_వ్రాయి(path, content)
     if expr.startswith('file_write(') or expr.startswith('ఫైల్_వ్రాయి('):
@@ -577,10 +1375,12 @@ def eval_lipi_expr(expr, env):
         content = eval_lipi_expr(args[1], env)
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(str(content))
-            return True
+                written = f.write(str(content))
         except Exception as e:
             raise LipiException(f"File write error: {e}")
+        count_stat('file_writes')
+        count_stat('file_bytes', written)
+        return True
 
     # File I/O: file_append(path, content) / ఫైల్_జోడించు(path, content)
     if expr.startswith('file_append(') or expr.startswith('ఫైల్_జోడించు('):
@@ -593,21 +1393,19 @@ def eval_lipi_expr(expr, env):
         content = eval_lipi_expr(args[1], env)
         try:
             with open(file_path, 'a', encoding='utf-8') as f:
-                f.write(str(content))
-            return True
+                written = f.write(str(content))
         except Exception as e:
             raise LipiException(f"File append error: {e}")
+        count_stat('file_writes')
+        count_stat('file_bytes', written)
+        return True
 
     # HTTP: http_get(url) / http_పొందు(url)
     if expr.startswith('http_get(') or expr.startswith('http_పొందు('):
         start = len('http_get(') if expr.startswith('http_get(') else len('http_పొందు(')
         arg_expr = expr[start:-1]
         url = eval_lipi_expr(arg_expr, env)
-        try:
-            with urllib.request.urlopen(url) as response:
-                return response.read().decode('utf-8')
-        except Exception as e:
-            raise LipiException(f"HTTP GET error: {e}")
+        return http_get_request(url)
 
     # HTTP: http_post(url, data) / http_పంపు(url, data)
     if expr.startswith('http_post(') or expr.startswith('http_పంపు('):
@@ -618,27 +1416,19 @@ def eval_lipi_expr(expr, env):
             raise LipiException("http_post requires 2 arguments: url and data")
         url = eval_lipi_expr(args[0], env)
         data = eval_lipi_expr(args[1], env)
-        try:
-            # Convert dict to JSON if needed
-            if isinstance(data, dict):
-                data = json.dumps(data)
-            data_bytes = data.encode('utf-8')
-            req = urllib.request.Request(url, data=data_bytes, headers={'Content-Type': 'application/json'})
-            with urllib.request.urlopen(req) as response:
-                return response.read().decode('utf-8')
-        except Exception as e:
-            raise LipiException(f"HTTP POST error: {e}")
+        return http_post_request(url, data)
 
-    # Database: db_connect(path) / డేటాబేస్_కనెక్ట్(path)
+    # Database: db_connect(path, [options]) / డేటాబేస్_కనెక్ట్(path, [options])
     if expr.startswith('db_connect(') or expr.startswith('డేటాబేస్_కనెక్ట్('):
         start = len('db_connect(') if expr.startswith('db_connect(') else len('డేటాబేస్_కనెక్ట్(')
-        arg_expr = expr[start:-1]
-        db_path = eval_lipi_expr(arg_expr, env)
+        args_expr = expr[start:-1]
+        args = split_arguments(args_expr)
+        if len(args) not in (1, 2):
+            raise LipiException("db_connect requires 1 or 2 arguments: path and [options]")
+        db_path = eval_lipi_expr(args[0], env)
+        options = eval_lipi_expr(args[1], env) if len(args) == 2 else None
         try:
-            conn = sqlite3.connect(db_path)
-            conn_id = f"db_{id(conn)}"
-            runtime.db_connections[conn_id] = conn
-            return conn_id
+            return register_connection('db', db_path, lambda: open_sqlite_connection(db_path, options))
         except Exception as e:
             raise LipiException(f"Database connection error: {e}")
 
@@ -651,22 +1441,7 @@ def eval_lipi_expr(expr, env):
             raise LipiException("db_query requires 2 arguments: connection_id and sql")
         conn_id = eval_lipi_expr(args[0], env)
         sql = eval_lipi_expr(args[1], env)
-        try:
-            if conn_id not in runtime.db_connections:
-                raise LipiException(f"Invalid database connection: {conn_id}")
-            conn = runtime.db_connections[conn_id]
-            cursor = conn.cursor()
-            cursor.execute(sql)
-            conn.commit()
-            # Return results for SELECT, row count for other operations
-            if sql.strip().upper().startswith('SELECT'):
-                results = cursor.fetchall()
-                # Convert to list of dicts
-                columns = [desc[0] for desc in cursor.description]
-                return [dict(zip(columns, row)) for row in results]
-            return cursor.rowcount
-        except Exception as e:
-            raise LipiException(f"Database query error: {e}")
+        return execute_db_query(conn_id, sql)
 
     # Database: db_close(conn_id) / డేటాబేస్_మూసివేయి(conn_id)
     if expr.startswith('db_close(') or expr.startswith('డేటాబేస్_మూసివేయి('):
@@ -674,11 +1449,7 @@ def eval_lipi_expr(expr, env):
         arg_expr = expr[start:-1]
         conn_id = eval_lipi_expr(arg_expr, env)
         try:
-            if conn_id in runtime.db_connections:
-                runtime.db_connections[conn_id].close()
-                del runtime.db_connections[conn_id]
-                return True
-            return False
+            return close_connection(conn_id)
         except Exception as e:
             raise LipiException(f"Database close error: {e}")
 
@@ -700,15 +1471,13 @@ def eval_lipi_expr(expr, env):
         database = eval_lipi_expr(args[3], env)
 
         try:
-            conn = mysql.connector.connect(
+            # The cassette request omits the password
+            return register_connection('mysql', f"{user}@{host}/{database}", lambda: mysql.connector.connect(
                 host=host,
                 user=user,
                 password=password,
                 database=database
-            )
-            conn_id = f"mysql_{id(conn)}"
-            runtime.db_connections[conn_id] = conn
-            return conn_id
+            ))
         except Exception as e:
             raise LipiException(f"MySQL connection error: {e}")
 
@@ -732,32 +1501,7 @@ def eval_lipi_expr(expr, env):
             if not isinstance(params, (list, tuple)):
                 params = [params]
 
-        try:
-            if conn_id not in runtime.db_connections:
-                raise LipiException(f"Invalid MySQL connection: {conn_id}")
-
-            conn = runtime.db_connections[conn_id]
-            cursor = conn.cursor(dictionary=True)  # Return results as dictionaries
-
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-
-            conn.commit()
-
-            # Fetch results if it's a SELECT query
-            if sql.strip().upper().startswith('SELECT'):
-                results = cursor.fetchall()
-                cursor.close()
-                return results
-            else:
-                # For INSERT/UPDATE/DELETE, return affected rows
-                affected = cursor.rowcount
-                cursor.close()
-                return affected
-        except Exception as e:
-            raise LipiException(f"MySQL query error: {e}")
+        return execute_mysql_query(conn_id, sql, params)
 
     # MySQL: mysql_close(conn_id) / mysql_మూసివేయి(conn_id) (v3.0)
     if expr.startswith('mysql_close(') or expr.startswith('mysql_మూసివేయి('):
@@ -765,11 +1509,7 @@ def eval_lipi_expr(expr, env):
         arg_expr = expr[start:-1]
         conn_id = eval_lipi_expr(arg_expr, env)
         try:
-            if conn_id in runtime.db_connections and conn_id.startswith('mysql_'):
-                runtime.db_connections[conn_id].close()
-                del runtime.db_connections[conn_id]
-                return True
-            return False
+            return close_connection(conn_id, 'mysql')
         except Exception as e:
             raise LipiException(f"MySQL close error: {e}")
 
@@ -794,16 +1534,14 @@ def eval_lipi_expr(expr, env):
             port = eval_lipi_expr(args[4], env)
 
         try:
-            conn = psycopg2.connect(
+            # The cassette request omits the password
+            return register_connection('pg', f"{user}@{host}:{port}/{database}", lambda: psycopg2.connect(
                 host=host,
                 user=user,
                 password=password,
                 database=database,
                 port=port
-            )
-            conn_id = f"pg_{id(conn)}"
-            runtime.db_connections[conn_id] = conn
-            return conn_id
+            ))
         except Exception as e:
             raise LipiException(f"PostgreSQL connection error: {e}")
 
@@ -827,34 +1565,7 @@ def eval_lipi_expr(expr, env):
             if not isinstance(params, (list, tuple)):
                 params = [params]
 
-        try:
-            if conn_id not in runtime.db_connections:
-                raise LipiException(f"Invalid PostgreSQL connection: {conn_id}")
-
-            conn = runtime.db_connections[conn_id]
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)  # Return results as dictionaries
-
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-
-            conn.commit()
-
-            # Fetch results if it's a SELECT query
-            if sql.strip().upper().startswith('SELECT'):
-                results = cursor.fetchall()
-                # Convert RealDictRow to regular dict
-                results = [dict(row) for row in results]
-                cursor.close()
-                return results
-            else:
-                # For INSERT/UPDATE/DELETE, return affected rows
-                affected = cursor.rowcount
-                cursor.close()
-                return affected
-        except Exception as e:
-            raise LipiException(f"PostgreSQL query error: {e}")
+        return execute_postgres_query(conn_id, sql, params)
 
     # PostgreSQL: postgres_close(conn_id) / postgres_మూసివేయి(conn_id) (v3.0)
     if expr.startswith('postgres_close(') or expr.startswith('postgres_మూసివేయి('):
@@ -862,11 +1573,7 @@ def eval_lipi_expr(expr, env):
         arg_expr = expr[start:-1]
         conn_id = eval_lipi_expr(arg_expr, env)
         try:
-            if conn_id in runtime.db_connections and conn_id.startswith('pg_'):
-                runtime.db_connections[conn_id].close()
-                del runtime.db_connections[conn_id]
-                return True
-            return False
+            return close_connection(conn_id, 'pg')
         except Exception as e:
             raise LipiException(f"PostgreSQL close error: {e}")
 
@@ -878,7 +1585,14 @@ def eval_lipi_expr(expr, env):
         index_expr = expr[bracket_pos+1:expr.rindex(']')].strip()
 
         var_value = eval_lipi_expr(var_name, env)
-        index_value = eval_lipi_expr(index_expr, env)
+        # Slice: items[start:end]
+        colon_pos = find_top_level_operator(index_expr, ':')
+        if colon_pos != -1:
+            start, end = index_expr[:colon_pos].strip(), index_expr[colon_pos+1:].strip()
+            index_value = slice(eval_lipi_expr(start, env) if start else None,
+                                eval_lipi_expr(end, env) if end else None)
+        else:
+            index_value = eval_lipi_expr(index_expr, env)
 
         return var_value[index_value]
 
@@ -916,32 +1630,6 @@ def eval_lipi_expr(expr, env):
                     return attr
                 return attr
 
-    # Python module function call: math.sqrt(16)
-    if '.' in expr and '(' in expr and ')' in expr:
-        dot_pos = expr.index('.')
-        paren_pos = expr.index('(')
-        if dot_pos < paren_pos:
-            module_name = expr[:dot_pos].strip()
-            if module_name in runtime.python_modules:
-                func_and_args = expr[dot_pos+1:]
-                func_name = func_and_args[:func_and_args.index('(')].strip()
-                args_str = func_and_args[func_and_args.index('(')+1:func_and_args.rindex(')')].strip()
-
-                # Security: Prevent access to dunder methods
-                if func_name.startswith('__') and func_name.endswith('__'):
-                    raise LipiException(f"Access to dunder methods is not allowed: {func_name}")
-
-                module = runtime.python_modules[module_name]
-                func = getattr(module, func_name)
-
-                # Parse arguments
-                args = []
-                if args_str:
-                    for arg in args_str.split(','):
-                        args.append(eval_lipi_expr(arg.strip(), env))
-
-                return func(*args)
-
     # Comparisons (order matters: check >= before >)
     for op in [">=", "<=", "==", "!=", ">", "<"]:
         if op in expr:
@@ -1086,6 +1774,10 @@ def eval_function_call(call_expr, env):
         obj_name = func_name[:dot_pos].strip()
         method_name = func_name[dot_pos+1:].strip()
 
+        # Built-in objects such as builder()
+        if obj_name in env and isinstance(env[obj_name], LipiNativeObject):
+            return call_native_method(env[obj_name], method_name, args_str, env)
+
         # Check if this is a class instance
         if obj_name in env and isinstance(env[obj_name], LipiClassInstance):
             instance = env[obj_name]
@@ -1096,20 +1788,47 @@ def eval_function_call(call_expr, env):
                     args.append(eval_lipi_expr(arg.strip(), env))
             return call_method(instance, method_name, args, env)
 
+    # Lambda stored in a variable: double = lambda x: x * 2
+    if func_name not in runtime.functions and isinstance(env.get(func_name), LipiLambda):
+        args = [eval_lipi_expr(arg, env) for arg in split_arguments(args_str)] if args_str else []
+        return env[func_name](*args)
+
     # Check if function exists
     if func_name not in runtime.functions:
         raise LipiException(get_error_message('function_not_found', func_name))
 
-    func_def = runtime.functions[func_name]
-
     # Parse arguments
     args = []
     if args_str:
-        for arg in args_str.split(','):
+        for arg in split_arguments(args_str):
             args.append(eval_lipi_expr(arg.strip(), env))
 
+    return call_lipi_function(func_name, args, env)
+
+
+def call_lipi_function(func_name, args, env):
+    """
+    Call a user-defined function with already-evaluated arguments.
+    Used by `call` expressions and by built-ins that take a function name.
+    """
+    if func_name not in runtime.functions:
+        raise LipiException(get_error_message('function_not_found', func_name))
+
+    func_def = runtime.functions[func_name]
+    cache = func_def.get('cache')
+    if cache is not None:
+        return cache.call(args, lambda: call_function_uncached(func_name, func_def, args, env))
+    return call_function_uncached(func_name, func_def, args, env)
+
+
+def call_function_uncached(func_name, func_def, args, env):
+    """Bind args in a copy of env and run the function body"""
     # Create new scope for function
     func_env = env.copy()
+    stats = runtime.stats
+    if stats is not None:
+        stats.function_calls += 1
+        stats.env_copies += 1
 
     # Bind parameters
     params = func_def['params']
@@ -1119,6 +1838,40 @@ def eval_function_call(call_expr, env):
     for param, arg in zip(params, args):
         func_env[param] = arg
 
+    return invoke_function_body(func_name, func_def, func_env)
+
+
+def invoke_function_body(name, func_def, func_env):
+    """Run a function or method body, reporting it to an active profiler or sampler"""
+    rt = get_runtime()
+    sampler = rt.sampler
+    tracer = rt.tracer
+    if sampler is not None:
+        sampler.push(name)
+    if tracer is not None:
+        tracer('call', name, func_env)
+    result = None
+    try:
+        if rt.profiler is not None:
+            result = rt.profiler.time_call(name, run_function_body, func_def, func_env)
+        else:
+            result = run_function_body(func_def, func_env)
+        return result
+    finally:
+        if tracer is not None:
+            tracer('return', name, result)
+        if sampler is not None:
+            sampler.pop()
+
+
+def run_function_body(func_def, func_env):
+    """
+    Execute a function or method body in its bound environment.
+    Async functions are not run here: a coroutine is returned for await / gather.
+    """
+    if func_def.get('async'):
+        return run_async_function_body(func_def['body'], func_env)
+
     # Execute function body using block executor for proper control flow
     try:
         execute_block(func_def['body'], func_env)
@@ -1127,157 +1880,1603 @@ def eval_function_call(call_expr, env):
         return ret.value
 
 
-# ---------------------------
-# Enhanced Line Executor
-# ---------------------------
-def run_lipi_line(line, env):
+def eval_function_name_arg(arg_expr, env):
     """
-    Execute a single line of Lipi code.
-    Supports both Telugu and English keywords.
+    Evaluate a built-in argument naming a user-defined function.
+    Accepts a bare name (square) or a string ("square").
     """
-    line = line.strip()
+    arg_expr = arg_expr.strip()
+    if arg_expr in runtime.functions:
+        return arg_expr
+    if arg_expr.isidentifier() and arg_expr not in env:
+        raise LipiException(get_error_message('function_not_found', arg_expr))
+    func_name = eval_lipi_expr(arg_expr, env)
+    if not isinstance(func_name, str) or func_name not in runtime.functions:
+        raise LipiException(get_error_message('function_not_found', func_name))
+    return func_name
 
-    # Empty / comment
-    if not line or line.startswith("#"):
-        return
 
-    # Return statement: return expr / రిటర్న్ expr
-    if line.startswith("return ") or line.startswith("రిటర్న్ "):
-        expr = line[7:] if line.startswith("return ") else line[8:]
-        value = eval_lipi_expr(expr.strip(), env) if expr.strip() else None
-        raise LipiReturnValue(value)
+# ---------------------------
+# Database Connection Locking (v3.0)
+# ---------------------------
+def connection_lock(conn_id):
+    """Per-connection lock: DB-API connections are not safe to share between threads"""
+    return runtime.db_locks.setdefault(conn_id, threading.RLock())
 
-    # Print statement (Telugu): చెప్పు expr
-    if line.startswith("చెప్పు "):
-        expr = line[len("చెప్పు "):]
-        value = eval_lipi_expr(expr, env)
-        print(value)
-        return
 
-    # Print statement (English): print expr
-    if line.startswith("print "):
-        expr = line[len("print "):]
-        value = eval_lipi_expr(expr, env)
-        print(value)
-        return
+# ---------------------------
+# Streaming Database Export (v3.0)
+# ---------------------------
+EXPORT_BATCH_SIZE = 1000  # Rows fetched/inserted per database round-trip
+EXPORT_CURSOR_IDS = itertools.count(1)  # Unique names for server-side cursors
 
-    # Python library import: import_python("module") / దిగుమతి_python("module")
-    if line.startswith("import_python(") or line.startswith("దిగుమతి_python("):
-        module_expr = line[line.index('(')+1:line.rindex(')')]
-        module_name = eval_lipi_expr(module_expr.strip(), env)
 
-        if module_name not in runtime.whitelist_modules:
-            raise LipiException(f"Module {module_name} is not whitelisted for security reasons")
+def open_export_cursor(conn_id, sql, params=None):
+    """
+    Execute a query on any connection in runtime.db_connections and return a
+    cursor suitable for fetchmany() streaming.
 
-        try:
-            module = importlib.import_module(module_name)
-            runtime.python_modules[module_name] = module
-            env[module_name] = module
-        except ImportError as e:
-            raise LipiException(f"Failed to import Python module {module_name}: {e}")
-        return
+    PostgreSQL uses a named (server-side) cursor so rows are not buffered on the
+    client; MySQL's default cursor is already unbuffered; SQLite steps lazily.
+    """
+    if conn_id not in runtime.db_connections:
+        raise LipiException(f"Invalid database connection: {conn_id}")
 
-    # v3.0: Lipi module import: దిగుమతి func from "module" / import func from "module"
-    if line.startswith("దిగుమతి ") or line.startswith("import "):
-        # Check if it's a module import (has "from" keyword)
-        if " from " in line:
-            parse_import_statement(line, runtime, env)
-            return
-        # Otherwise fall through to other statement types
+    conn = runtime.db_connections[conn_id]
+    if conn_id.startswith('pg_'):
+        cursor = conn.cursor(name=f"lipi_export_{next(EXPORT_CURSOR_IDS)}")
+        cursor.itersize = EXPORT_BATCH_SIZE
+    else:
+        cursor = conn.cursor()
 
-    # Export statement: export func_name / ఎగుమతి func_name
-    if line.startswith("export ") or line.startswith("ఎగుమతి "):
-        names = line[7:] if line.startswith("export ") else line[8:]
-        for name in names.split(','):
-            name = name.strip()
-            if name in env:
-                runtime.exports[name] = env[name]
-            elif name in runtime.functions:
-                runtime.exports[name] = runtime.functions[name]
-        return
+    if params:
+        cursor.execute(sql, params)
+    else:
+        cursor.execute(sql)
+    return cursor
 
-    # Standalone function call: call func(args) or కాల్ func(args)
-    if line.startswith('call ') or line.startswith('కాల్ '):
-        eval_lipi_expr(line, env)
-        return
 
-    # Standalone built-in function calls (file operations, http, db)
-    # Check these BEFORE assignment to avoid false positives with '=' in function arguments
-    builtin_prefixes = [
-        'file_read(', 'file_write(', 'file_append(',
-        'ఫైల్_చదువు(', 'ఫైల్_వ్రాయి(', 'ఫైల్_జోడించు(',
-        'http_get(', 'http_post(',
-        'http_పొందు(', 'http_పంపు(',
-        'db_connect(', 'db_query(', 'db_close(',
-        'డేటాబేస్_కనెక్ట్(', 'డేటాబేస్_ప్రశ్న(', 'డేటాబేస్_మూసివేయి(',
-        'mysql_connect(', 'mysql_query(', 'mysql_close(',  # v3.0 MySQL
-        'mysql_కనెక్ట్(', 'mysql_ప్రశ్న(', 'mysql_మూసివేయి(',  # v3.0 MySQL Telugu
-        'postgres_connect(', 'postgres_query(', 'postgres_close(',  # v3.0 PostgreSQL
-        'postgres_కనెక్ట్(', 'postgres_ప్రశ్న(', 'postgres_మూసివేయి('  # v3.0 PostgreSQL Telugu
-    ]
-    for prefix in builtin_prefixes:
-        if line.startswith(prefix):
-            eval_lipi_expr(line, env)
-            return
+def export_query(args, env, builtin_name, write_rows):
+    """
+    Shared driver for db_export_csv / db_export_jsonl.
 
-    # Assignment: name = expr
-    if "=" in line and not any(op in line for op in ["==", ">=", "<=", "!="]):
-        name, expr = line.split("=", 1)
-        name = name.strip()
-        expr = expr.strip()
+    Args:
+        args: Unevaluated (conn_id, sql, path, [params]) expressions
+        env: Current environment
+        builtin_name: Name used in error messages
+        write_rows: Callback (file, columns, rows, is_first_batch) writing one batch
 
-        # Attribute assignment: self.name = expr or స్వీయ.name = expr (v3.0)
-        if '.' in name:
-            dot_pos = name.index('.')
-            obj_name = name[:dot_pos].strip()
-            attr_name = name[dot_pos+1:].strip()
+    Returns:
+        Number of rows written
+    """
+    if len(args) not in (3, 4):
+        raise LipiException(f"{builtin_name} requires 3 or 4 arguments: (conn_id, sql, path, [params])")
+
+    conn_id = eval_lipi_expr(args[0], env)
+    sql = eval_lipi_expr(args[1], env)
+    path = eval_lipi_expr(args[2], env)
+    params = None
+    if len(args) == 4:
+        params = eval_lipi_expr(args[3], env)
+        if not isinstance(params, (list, tuple)):
+            params = [params]
+    cassette = runtime.cassette
+    if cassette is None:
+        return export_rows(conn_id, sql, path, params, write_rows)
+    result = export_rows_recorded(conn_id, sql, path, params, write_rows)
+    if cassette.mode == 'replay':
+        # Later code may read the exported file, so write it as recorded
+        try:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(result['content'])
+        except OSError as e:
+            raise LipiException(f"Database export error: {e}")
+        count_stat('file_writes')
+    return result['rows']
+
+
+@recordable('db_export', lambda conn_id, sql, path, params, write_rows:
+            {'conn': conn_id, 'sql': sql, 'path': path, 'params': params})
+def export_rows_recorded(conn_id, sql, path, params, write_rows):
+    """export_rows plus the file's text, so a cassette replay can write the file again"""
+    row_count = export_rows(conn_id, sql, path, params, write_rows)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return {'rows': row_count, 'content': f.read()}
+
+
+def export_rows(conn_id, sql, path, params, write_rows):
+    """Stream a query's rows to path in batches. Returns the row count."""
+    with connection_lock(conn_id):
+        try:
+            cursor = open_export_cursor(conn_id, sql, params)
+            try:
+                with open(path, 'w', encoding='utf-8', newline='') as f:
+                    rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                    # Named PostgreSQL cursors only fill description after the first fetch
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                    write_rows(f, columns, rows, True)
+                    row_count = len(rows)
+                    while rows:
+                        rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                        write_rows(f, columns, rows, False)
+                        row_count += len(rows)
+                count_stat('db_queries')
+                count_stat('db_rows', row_count)
+                count_stat('file_writes')
+            finally:
+                cursor.close()
+                if not conn_id.startswith('db_'):
+                    runtime.db_connections[conn_id].commit()  # End the read transaction
+            return row_count
+        except LipiException:
+            raise
+        except Exception as e:
+            raise LipiException(f"Database export error: {e}")
 
-            # Check if this is a class instance
-            if obj_name in env and isinstance(env[obj_name], LipiClassInstance):
-                instance = env[obj_name]
-                instance.attributes[attr_name] = eval_lipi_expr(expr, env)
-                return
 
-        # Regular variable assignment
-        env[name] = eval_lipi_expr(expr, env)
-        return
+@lipi_builtin('db_export_csv', 'డేటాబేస్_ఎగుమతి_csv')
+def builtin_db_export_csv(args, env):
+    """db_export_csv(conn_id, sql, path, [params]) - stream query rows to a CSV file with a header"""
+    def write_rows(f, columns, rows, first_batch):
+        writer = csv.writer(f)
+        if first_batch:
+            writer.writerow(columns)
+        writer.writerows(rows)
+
+    return export_query(args, env, 'db_export_csv', write_rows)
 
-    # If we reach here, syntax is unknown
-    raise SyntaxError(f"తెలియని లైన్ (unknown line): {line}")
+
+@lipi_builtin('db_export_jsonl', 'డేటాబేస్_ఎగుమతి_jsonl')
+def builtin_db_export_jsonl(args, env):
+    """db_export_jsonl(conn_id, sql, path, [params]) - stream query rows to a JSON Lines file"""
+    def write_rows(f, columns, rows, first_batch):
+        f.writelines(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) + '\n'
+            for row in rows
+        )
+
+    return export_query(args, env, 'db_export_jsonl', write_rows)
 
 
 # ---------------------------
-# Function Definition Handler
+# Streaming File Readers (v3.0)
 # ---------------------------
-def parse_function_definition(lines, start_index, env):
+def parse_bool_cell(value):
+    """Coerce a CSV/JSON cell to bool ("true"/"1"/"yes"/"నిజం" are true)"""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ['true', '1', 'yes', 'నిజం']
+
+
+ROW_TYPE_CONVERTERS = {
+    'int': int,
+    'float': float,
+    'str': str,
+    'bool': parse_bool_cell,
+    'json': json.loads,
+}
+
+
+def build_row_converters(types):
+    """Validate a {column: type_name} mapping and return {column: converter}"""
+    if types is None:
+        return {}
+    if not isinstance(types, dict):
+        raise LipiException("Column types must be an object like {age: \"int\"}")
+    converters = {}
+    for column, type_name in types.items():
+        if type_name not in ROW_TYPE_CONVERTERS:
+            raise LipiException(
+                f"Unknown column type '{type_name}' for {column} (choose from {', '.join(ROW_TYPE_CONVERTERS)})")
+        converters[column] = ROW_TYPE_CONVERTERS[type_name]
+    return converters
+
+
+def iter_typed_rows(f, records, converters, columns):
     """
-    Parse function definition starting at start_index.
-    Supports: function name(params): / పనిచేయి name(params):
-    Returns: (next_index, function_name, params, body)
+    Lazily project and coerce dict records, closing f when iteration ends.
+    Empty cells in typed columns become None (null).
     """
-    line = lines[start_index].strip()
+    try:
+        for line_no, record in enumerate(records, start=1):
+            if columns is not None:
+                record = {column: record.get(column) for column in columns}
+            for column, convert in converters.items():
+                value = record.get(column)
+                if value is None or value == '':
+                    if column in record:
+                        record[column] = None
+                    continue
+                try:
+                    record[column] = convert(value)
+                except (ValueError, TypeError) as e:
+                    raise LipiException(f"Row {line_no}: cannot convert {column}={value!r}: {e}")
+            yield record
+    finally:
+        f.close()
 
-    # Check for Telugu or English function definition
-    is_telugu = line.startswith("పనిచేయి ")
-    is_english = line.startswith("function ")
 
-    if not (is_telugu or is_english) or ':' not in line:
-        return None
+def open_row_stream(args, env, builtin_name, parse_records):
+    """
+    Shared driver for csv_iter / jsonl_iter.
 
-    # Extract function signature
-    if is_telugu:
-        signature = line[len("పనిచేయి "):-1].strip()
+    Args:
+        args: Unevaluated (path, [types], [columns]) expressions
+        env: Current environment
+        builtin_name: Name used in error messages
+        parse_records: Callback turning an open text file into an iterator of dicts
+
+    Returns:
+        Lazy iterator of row objects
+    """
+    if len(args) not in (1, 2, 3):
+        raise LipiException(f"{builtin_name} requires 1 to 3 arguments: (path, [types], [columns])")
+
+    path = eval_lipi_expr(args[0], env)
+    types = eval_lipi_expr(args[1], env) if len(args) >= 2 else None
+    columns = eval_lipi_expr(args[2], env) if len(args) == 3 else None
+    if columns is not None and not isinstance(columns, list):
+        raise LipiException(f"{builtin_name} columns must be a list")
+
+    converters = build_row_converters(types)
+    if _current_runtime.get().cassette is not None:
+        f = io.StringIO(read_stream_text(path), newline='')
     else:
-        signature = line[len("function "):-1].strip()
+        try:
+            f = open(path, 'r', encoding='utf-8', newline='')
+        except Exception as e:
+            raise LipiException(f"File read error: {e}")
+        count_stat('file_reads')
+    return iter_typed_rows(f, parse_records(f), converters, columns)
 
-    # Parse function name and parameters
-    paren_pos = signature.index('(')
-    func_name = signature[:paren_pos].strip()
-    params_str = signature[paren_pos+1:signature.rindex(')')].strip()
 
-    params = []
-    if params_str:
-        params = [p.strip() for p in params_str.split(',')]
+def parse_jsonl_records(f):
+    """Yield one object per non-blank JSON Lines row"""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+@lipi_builtin('csv_iter', 'csv_ప్రవాహం')
+def builtin_csv_iter(args, env):
+    """csv_iter(path, [types], [columns]) - lazy iterator of row objects keyed by the header"""
+    return open_row_stream(args, env, 'csv_iter', csv.DictReader)
+
+
+@lipi_builtin('jsonl_iter', 'jsonl_ప్రవాహం')
+def builtin_jsonl_iter(args, env):
+    """jsonl_iter(path, [types], [columns]) - lazy iterator of JSON Lines objects"""
+    return open_row_stream(args, env, 'jsonl_iter', parse_jsonl_records)
+
+
+@lipi_builtin('db_insert_many', 'డేటాబేస్_బహుళ_చేర్పు')
+def builtin_db_insert_many(args, env):
+    """
+    db_insert_many(conn_id, sql, rows) - executemany() over a list or lazy iterator
+    in batches, committing once. Rows are objects (named placeholders) or lists.
+    """
+    if len(args) != 3:
+        raise LipiException("db_insert_many requires 3 arguments: (conn_id, sql, rows)")
+
+    conn_id = eval_lipi_expr(args[0], env)
+    sql = eval_lipi_expr(args[1], env)
+    return insert_rows(conn_id, sql, iter(eval_lipi_expr(args[2], env)))
+
+
+@recordable('db_insert_many', lambda conn_id, sql, rows: {'conn': conn_id, 'sql': sql},
+            on_replay=lambda conn_id, sql, rows: deque(rows, maxlen=0))
+def insert_rows(conn_id, sql, rows):
+    """executemany() rows in batches and commit once. Returns the row count."""
+    if conn_id not in runtime.db_connections:
+        raise LipiException(f"Invalid database connection: {conn_id}")
+    conn = runtime.db_connections[conn_id]
+
+    with connection_lock(conn_id):
+        try:
+            cursor = conn.cursor()
+            inserted = 0
+            try:
+                while True:
+                    batch = list(itertools.islice(rows, EXPORT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    cursor.executemany(sql, batch)
+                    count_stat('db_queries')
+                    inserted += len(batch)
+            finally:
+                cursor.close()
+            conn.commit()
+            return inserted
+        except LipiException:
+            conn.rollback()
+            raise
+        except Exception as e:
+            conn.rollback()
+            raise LipiException(f"Database insert error: {e}")
+
+
+# ---------------------------
+# Native Objects: builder() (v3.0)
+# ---------------------------
+class LipiNativeObject:
+    """
+    Base for built-in object types with methods callable from Lipi as
+    call obj.method(args) or obj.method(args). METHODS maps English and
+    Telugu method names to Python method names.
+    """
+    LIPI_NAME = 'object'
+    METHODS = {}
+
+    def call_lipi_method(self, name, args):
+        attr = self.METHODS.get(name)
+        if attr is None:
+            raise LipiException(get_error_message('attribute_error', f"{self.LIPI_NAME}.{name}"))
+        return getattr(self, attr)(*args)
+
+
+def call_native_method(obj, method_name, args_str, env):
+    """Evaluate args_str and call a LipiNativeObject method"""
+    args = [eval_lipi_expr(arg, env) for arg in split_arguments(args_str)] if args_str.strip() else []
+    return obj.call_lipi_method(method_name.strip(), args)
+
+
+def eval_native_method_call(expr, env):
+    """
+    Evaluate expr if it is exactly obj.method(args) on a LipiNativeObject.
+    Returns (True, result), or (False, None) for any other expression.
+    """
+    if not expr.endswith(')'):
+        return False, None
+    dot_pos = expr.find('.')
+    paren_pos = expr.find('(')
+    if not 0 < dot_pos < paren_pos:
+        return False, None
+    obj = env.get(expr[:dot_pos])
+    if not isinstance(obj, LipiNativeObject) or find_closing_paren(expr, paren_pos) != len(expr) - 1:
+        return False, None
+    return True, call_native_method(obj, expr[dot_pos+1:paren_pos], expr[paren_pos+1:-1], env)
+
+
+class LipiStringBuilder(LipiNativeObject):
+    """
+    Mutable text buffer: append() stores pieces and to_string() joins them
+    once, so building output in a loop is linear instead of quadratic.
+    """
+    LIPI_NAME = 'builder'
+    METHODS = {
+        'append': 'append', 'జోడించు': 'append',
+        'join': 'join', 'కలుపు': 'join',
+        'to_string': 'to_string', 'పాఠ్యం': 'to_string',
+        'clear': 'clear', 'ఖాళీచేయి': 'clear',
+    }
+
+    def __init__(self, text=''):
+        self.parts = [text] if text else []
+        self.length = len(text)
+
+    def append(self, value):
+        text = value if isinstance(value, str) else str(value)
+        self.parts.append(text)
+        self.length += len(text)
+        return self
+
+    def join(self, items, sep=''):
+        """Append the items separated by sep"""
+        return self.append(join_values(items, sep))
+
+    def to_string(self):
+        if len(self.parts) > 1:
+            self.parts = [''.join(self.parts)]
+        return self.parts[0] if self.parts else ''
+
+    def clear(self):
+        self.parts = []
+        self.length = 0
+        return self
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        return self.to_string()
+
+    def __repr__(self):
+        return f"builder({self.length} chars)"
+
+
+def join_values(items, sep=''):
+    """Join any iterable of values with sep, converting non-strings with str()"""
+    if not isinstance(sep, str):
+        raise LipiException(get_error_message('type_error', "join separator must be a string"))
+    try:
+        return sep.join(item if isinstance(item, str) else str(item) for item in items)
+    except TypeError:
+        raise LipiException(get_error_message('type_error', "join expects a list"))
+
+
+@lipi_builtin('builder', 'నిర్మాత')
+def builtin_builder(args, env):
+    """builder([text]) - create a string builder with append / join / to_string"""
+    if len(args) > 1:
+        raise LipiException("builder takes at most 1 argument: initial text")
+    text = eval_lipi_expr(args[0], env) if args else ''
+    return LipiStringBuilder(str(text))
+
+
+@lipi_builtin('join', 'కలుపు')
+def builtin_join(args, env):
+    """join(list, [sep]) - join values into one string in a single pass"""
+    if len(args) not in (1, 2):
+        raise LipiException("join requires 1 or 2 arguments: (list, [separator])")
+    sep = eval_lipi_expr(args[1], env) if len(args) == 2 else ''
+    return join_values(eval_lipi_expr(args[0], env), sep)
+
+
+# ---------------------------
+# String Templates: f"..." (v3.0)
+# ---------------------------
+TEMPLATE_PREFIXES = ('f"', "f'")
+MAX_TEMPLATE_CACHE = 4096
+TEMPLATE_CACHE = {}  # Template literal -> parsed segments, shared by all runtimes
+
+
+def is_template_literal(expr):
+    """True if expr is exactly one f"..." template literal"""
+    if expr[:2] not in TEMPLATE_PREFIXES or len(expr) < 3:
+        return False
+    quote_pos = expr.find(expr[1], 2)
+    if quote_pos == len(expr) - 1:
+        return True
+    if quote_pos != -1 and template_field_open(expr[2:quote_pos]):
+        other = "'" if expr[1] == '"' else '"'
+        raise LipiException(get_error_message(
+            'invalid_syntax', f"{expr[1]} inside a {{}} field ends the template; use {other} there: {expr}"))
+    return False
+
+
+def template_field_open(body):
+    """True if body ends inside an unclosed {...} field ({{ is a literal brace)"""
+    i = 0
+    in_field = False
+    while i < len(body):
+        if not in_field and body[i:i+2] == '{{':
+            i += 2
+            continue
+        if body[i] == '{':
+            in_field = True
+        elif body[i] == '}':
+            in_field = False
+        i += 1
+    return in_field
+
+
+def find_template_field_end(body, start):
+    """
+    Find the '}' closing the field opened at body[start] and the position of
+    its ':' format spec separator (-1 if none), skipping nested brackets and
+    strings.
+    """
+    depth = 0
+    string_char = None
+    colon_pos = -1
+    for i in range(start + 1, len(body)):
+        char = body[i]
+        if string_char:
+            if char == string_char:
+                string_char = None
+        elif char in '"\'':
+            string_char = char
+        elif char in '([{':
+            depth += 1
+        elif char in ')]' or (char == '}' and depth > 0):
+            depth -= 1
+        elif char == '}':
+            return i, colon_pos
+        elif char == ':' and depth == 0 and colon_pos == -1:
+            colon_pos = i
+    raise LipiException(get_error_message('invalid_syntax', f"unclosed {{ in template: {body}"))
+
+
+def parse_template(body):
+    """
+    Split a template body into a tuple of literal strings and
+    (expression, format_spec) fields. {{ and }} are literal braces.
+    """
+    segments = []
+    literal = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char in '{}' and body[i+1:i+2] == char:
+            literal.append(char)
+            i += 2
+            continue
+        if char == '}':
+            raise LipiException(get_error_message('invalid_syntax', f"single }} in template: {body}"))
+        if char != '{':
+            literal.append(char)
+            i += 1
+            continue
+        end, colon_pos = find_template_field_end(body, i)
+        if colon_pos == -1:
+            field, spec = body[i+1:end].strip(), ''
+        else:
+            field, spec = body[i+1:colon_pos].strip(), body[colon_pos+1:end]
+        if not field:
+            raise LipiException(get_error_message('invalid_syntax', f"empty {{}} in template: {body}"))
+        if literal:
+            segments.append(''.join(literal))
+            literal = []
+        segments.append((field, spec))
+        i = end + 1
+    if literal:
+        segments.append(''.join(literal))
+    return tuple(segments)
+
+
+def eval_template(expr, env):
+    """
+    Evaluate an f"..." template. The literal is parsed into segments once and
+    cached, so each evaluation only evaluates the fields and joins the parts.
+    """
+    segments = TEMPLATE_CACHE.get(expr)
+    if segments is None:
+        segments = parse_template(expr[2:-1])
+        if len(TEMPLATE_CACHE) >= MAX_TEMPLATE_CACHE:
+            TEMPLATE_CACHE.clear()
+        TEMPLATE_CACHE[expr] = segments
+    parts = []
+    for segment in segments:
+        if segment.__class__ is str:
+            parts.append(segment)
+            continue
+        field, spec = segment
+        value = eval_lipi_expr(field, env)
+        if spec:
+            try:
+                parts.append(format(value, spec))
+            except (TypeError, ValueError) as e:
+                raise LipiException(get_error_message('type_error', f"{{{field}:{spec}}}: {e}"))
+        else:
+            parts.append(value if value.__class__ is str else str(value))
+    return ''.join(parts)
+
+
+# ---------------------------
+# Collections: sets, sorting, heaps (v3.0)
+# ---------------------------
+MEMBERSHIP_OPERATORS = ((' not in ', True), (' in ', False), (' లో ', False))
+
+
+def eval_membership(expr, env):
+    """
+    Evaluate x in items / x లో items / x not in items. Returns None if expr has
+    no top-level membership operator.
+    """
+    for keyword, negate in MEMBERSHIP_OPERATORS:
+        pos = find_top_level_operator(expr, keyword)
+        if pos == -1:
+            continue
+        item = eval_lipi_expr(expr[:pos], env)
+        container = eval_lipi_expr(expr[pos+len(keyword):], env)
+        try:
+            return (item in container) != negate
+        except TypeError:
+            raise LipiException(get_error_message('type_error', f"cannot test membership in {type(container).__name__}"))
+    return None
+
+
+def make_set(values):
+    """Build a set, rejecting unhashable items such as lists and objects"""
+    try:
+        return set(values)
+    except TypeError:
+        raise LipiException(get_error_message('type_error', "set items must be numbers, strings or booleans"))
+
+
+def field_getter(name):
+    """Key function reading a field of an object or class instance"""
+    def get_field(item):
+        if isinstance(item, LipiClassInstance):
+            return item.attributes[name]
+        return item[name]
+    return get_field
+
+
+def resolve_key_function(arg_expr, env):
+    """
+    Turn a key or function argument into a Python callable. Accepts a Lipi
+    function name (bare or quoted), a lambda, a field name string, a Python
+    callable, or null.
+    """
+    arg_expr = arg_expr.strip()
+    if arg_expr in runtime.functions:
+        func_name = arg_expr
+    elif arg_expr.isidentifier() and arg_expr not in env and arg_expr not in ('null', 'శూన్యం'):
+        raise LipiException(get_error_message('function_not_found', arg_expr))
+    else:
+        key = eval_lipi_expr(arg_expr, env)
+        if key is None or callable(key):
+            return key
+        if not isinstance(key, str):
+            raise LipiException(get_error_message('type_error', "key must be a function or a field name"))
+        if key not in runtime.functions:
+            return field_getter(key)
+        func_name = key
+    return lambda *args: call_lipi_function(func_name, list(args), env)
+
+
+def native_call(func, *args, **kwargs):
+    """Run a collection operation, reporting bad items and keys as Lipi errors"""
+    try:
+        return func(*args, **kwargs)
+    except (KeyError, IndexError) as e:
+        raise LipiException(get_error_message('key_error', e))
+    except TypeError as e:
+        raise LipiException(get_error_message('type_error', e))
+    except ValueError as e:
+        raise LipiException(get_error_message('runtime_error', e))
+
+
+def eval_list_arg(arg_expr, env, func_name):
+    """Evaluate an argument that must be a Lipi list"""
+    value = eval_lipi_expr(arg_expr, env)
+    if not isinstance(value, list):
+        raise LipiException(get_error_message('type_error', f"{func_name} expects a list"))
+    return value
+
+
+@lipi_builtin('set', 'సమితి')
+def builtin_set(args, env):
+    """set([items]) - create a hash set, optionally from a list"""
+    if len(args) > 1:
+        raise LipiException("set takes at most 1 argument: items")
+    return make_set(eval_lipi_expr(args[0], env) if args else ())
+
+
+@lipi_builtin('set_add', 'సమితి_చేర్చు')
+def builtin_set_add(args, env):
+    """set_add(set, item) - add an item to a set"""
+    if len(args) != 2:
+        raise LipiException("set_add requires 2 arguments: (set, item)")
+    items = eval_lipi_expr(args[0], env)
+    if not isinstance(items, set):
+        raise LipiException(get_error_message('type_error', "set_add expects a set"))
+    native_call(items.add, eval_lipi_expr(args[1], env))
+    return items
+
+
+@lipi_builtin('set_remove', 'సమితి_తొలగించు')
+def builtin_set_remove(args, env):
+    """set_remove(set, item) - remove an item from a set if present"""
+    if len(args) != 2:
+        raise LipiException("set_remove requires 2 arguments: (set, item)")
+    items = eval_lipi_expr(args[0], env)
+    if not isinstance(items, set):
+        raise LipiException(get_error_message('type_error', "set_remove expects a set"))
+    native_call(items.discard, eval_lipi_expr(args[1], env))
+    return items
+
+
+@lipi_builtin('sorted', 'క్రమీకరించు')
+def builtin_sorted(args, env):
+    """sorted(items, [key], [reverse]) - new sorted list; key is a function or field name"""
+    if len(args) not in (1, 2, 3):
+        raise LipiException("sorted requires 1 to 3 arguments: (items, [key], [reverse])")
+    items = eval_lipi_expr(args[0], env)
+    key = resolve_key_function(args[1], env) if len(args) > 1 else None
+    reverse = bool(eval_lipi_expr(args[2], env)) if len(args) > 2 else False
+    return native_call(sorted, items, key=key, reverse=reverse)
+
+
+@lipi_builtin('bisect', 'ద్విభాగం')
+def builtin_bisect(args, env):
+    """bisect(sorted_list, item) - index where item would be inserted to keep order"""
+    if len(args) != 2:
+        raise LipiException("bisect requires 2 arguments: (sorted_list, item)")
+    items = eval_list_arg(args[0], env, 'bisect')
+    return native_call(bisect.bisect_right, items, eval_lipi_expr(args[1], env))
+
+
+@lipi_builtin('bisect_insert', 'ద్విభాగ_చేర్చు')
+def builtin_bisect_insert(args, env):
+    """bisect_insert(sorted_list, item) - insert item in order; returns its index"""
+    if len(args) != 2:
+        raise LipiException("bisect_insert requires 2 arguments: (sorted_list, item)")
+    items = eval_list_arg(args[0], env, 'bisect_insert')
+    item = eval_lipi_expr(args[1], env)
+    index = native_call(bisect.bisect_right, items, item)
+    items.insert(index, item)
+    return index
+
+
+@lipi_builtin('heap_push', 'కుప్ప_చేర్చు')
+def builtin_heap_push(args, env):
+    """heap_push(heap, item) - push onto a list used as a min-heap"""
+    if len(args) != 2:
+        raise LipiException("heap_push requires 2 arguments: (heap, item)")
+    heap = eval_list_arg(args[0], env, 'heap_push')
+    native_call(heapq.heappush, heap, eval_lipi_expr(args[1], env))
+    return heap
+
+
+@lipi_builtin('heap_pop', 'కుప్ప_తీయి')
+def builtin_heap_pop(args, env):
+    """heap_pop(heap) - remove and return the smallest item"""
+    if len(args) != 1:
+        raise LipiException("heap_pop requires 1 argument: heap")
+    heap = eval_list_arg(args[0], env, 'heap_pop')
+    if not heap:
+        raise LipiException(get_error_message('index_error', "heap_pop from an empty heap"))
+    return native_call(heapq.heappop, heap)
+
+
+@lipi_builtin('counter', 'లెక్కించు')
+def builtin_counter(args, env):
+    """counter(items, [key]) - object mapping each value (or key) to its count"""
+    if len(args) not in (1, 2):
+        raise LipiException("counter requires 1 or 2 arguments: (items, [key])")
+    items = eval_lipi_expr(args[0], env)
+    key = resolve_key_function(args[1], env) if len(args) == 2 else None
+    return dict(native_call(Counter, map(key, items) if key else items))
+
+
+@lipi_builtin('group_by', 'సమూహపరచు')
+def builtin_group_by(args, env):
+    """group_by(items, key) - object mapping each key to the list of its items"""
+    if len(args) != 2:
+        raise LipiException("group_by requires 2 arguments: (items, key)")
+    items = eval_lipi_expr(args[0], env)
+    key = resolve_key_function(args[1], env)
+    if key is None:
+        raise LipiException(get_error_message('type_error', "group_by requires a key"))
+    groups = {}
+    for item in items:
+        native_call(groups.setdefault, key(item), []).append(item)
+    return groups
+
+
+@lipi_builtin('unique', 'ప్రత్యేకం')
+def builtin_unique(args, env):
+    """unique(items) - items without duplicates, in first-seen order"""
+    if len(args) != 1:
+        raise LipiException("unique requires 1 argument: items")
+    return list(native_call(dict.fromkeys, eval_lipi_expr(args[0], env)))
+
+
+# ---------------------------
+# Higher-Order Built-ins: lambda, map, filter, reduce (v3.0)
+# ---------------------------
+LAMBDA_KEYWORDS = ('lambda', 'లాంబ్డా')
+
+
+class LipiLambda:
+    """
+    Anonymous one-expression function. Calls evaluate the body in a scope
+    that layers the parameters over the defining environment, so no
+    environment is copied per call.
+    """
+    def __init__(self, params, body, env):
+        self.params = params
+        self.body = body
+        self.env = env
+
+    def __call__(self, *args):
+        if len(args) != len(self.params):
+            raise LipiException(f"lambda expects {len(self.params)} arguments, got {len(args)}")
+        return eval_lipi_expr(self.body, ChainMap(dict(zip(self.params, args)), self.env))
+
+    def __repr__(self):
+        return f"lambda({', '.join(self.params)})"
+
+
+def parse_lambda(expr, env):
+    """
+    Parse lambda x: body, lambda(a, b): body or లాంబ్డా x: body.
+    Returns None if expr only starts with a name like lambda_count.
+    """
+    keyword = next(kw for kw in LAMBDA_KEYWORDS if expr.startswith(kw))
+    rest = expr[len(keyword):]
+    if not rest.startswith((' ', '(')):
+        return None
+    colon_pos = rest.find(':')
+    if colon_pos == -1 or not rest[colon_pos+1:].strip():
+        raise LipiException(get_error_message('invalid_syntax', expr))
+    params_str = rest[:colon_pos].strip()
+    if params_str.startswith('(') and params_str.endswith(')'):
+        params_str = params_str[1:-1]
+    params = [param.strip() for param in params_str.split(',')] if params_str.strip() else []
+    if not all(param.isidentifier() for param in params):
+        raise LipiException(get_error_message('invalid_syntax', expr))
+    return LipiLambda(params, rest[colon_pos+1:].strip(), env)
+
+
+def eval_function_arg(arg_expr, env):
+    """Evaluate a function argument (Lipi function name, lambda or Python callable)"""
+    func = resolve_key_function(arg_expr, env)
+    if func is None:
+        raise LipiException(get_error_message('type_error', f"expected a function: {arg_expr.strip()}"))
+    return func
+
+
+def eval_key_arg(args, index, env):
+    """Optional key argument at args[index], or None"""
+    return resolve_key_function(args[index], env) if len(args) > index else None
+
+
+@lipi_builtin('map', 'పటం')
+def builtin_map(args, env):
+    """map(func, items) - apply func to each item; lazy when items is an iterator"""
+    if len(args) != 2:
+        raise LipiException("map requires 2 arguments: (function, items)")
+    func = eval_function_arg(args[0], env)
+    items = eval_lipi_expr(args[1], env)
+    if isinstance(items, (list, tuple, set, dict, str)):
+        return [func(item) for item in items]
+    return map(func, items)
+
+
+@lipi_builtin('filter', 'వడపోత')
+def builtin_filter(args, env):
+    """filter(func, items) - items for which func is true; lazy when items is an iterator"""
+    if len(args) != 2:
+        raise LipiException("filter requires 2 arguments: (function, items)")
+    func = eval_function_arg(args[0], env)
+    items = eval_lipi_expr(args[1], env)
+    if isinstance(items, (list, tuple, set, dict, str)):
+        return [item for item in items if func(item)]
+    return filter(func, items)
+
+
+@lipi_builtin('reduce', 'కుదించు')
+def builtin_reduce(args, env):
+    """reduce(func, items, [initial]) - fold items with func(accumulated, item)"""
+    if len(args) not in (2, 3):
+        raise LipiException("reduce requires 2 or 3 arguments: (function, items, [initial])")
+    func = eval_function_arg(args[0], env)
+    items = eval_lipi_expr(args[1], env)
+    if len(args) == 3:
+        return native_call(functools.reduce, func, items, eval_lipi_expr(args[2], env))
+    return native_call(functools.reduce, func, items)
+
+
+@lipi_builtin('sum', 'మొత్తం')
+def builtin_sum(args, env):
+    """sum(items, [key]) - total of the items (or of key(item))"""
+    if len(args) not in (1, 2):
+        raise LipiException("sum requires 1 or 2 arguments: (items, [key])")
+    items = eval_lipi_expr(args[0], env)
+    key = eval_key_arg(args, 1, env)
+    if key is None and isinstance(items, LipiArray):
+        return items.sum()
+    return native_call(sum, map(key, items) if key else items)
+
+
+@lipi_builtin('min', 'కనిష్ఠం')
+def builtin_min(args, env):
+    """min(items, [key]) - smallest item"""
+    if len(args) not in (1, 2):
+        raise LipiException("min requires 1 or 2 arguments: (items, [key])")
+    items = eval_lipi_expr(args[0], env)
+    key = eval_key_arg(args, 1, env)
+    if key is None and isinstance(items, LipiArray):
+        return items.min()
+    return native_call(min, items, key=key)
+
+
+@lipi_builtin('max', 'గరిష్ఠం')
+def builtin_max(args, env):
+    """max(items, [key]) - largest item"""
+    if len(args) not in (1, 2):
+        raise LipiException("max requires 1 or 2 arguments: (items, [key])")
+    items = eval_lipi_expr(args[0], env)
+    key = eval_key_arg(args, 1, env)
+    if key is None and isinstance(items, LipiArray):
+        return items.max()
+    return native_call(max, items, key=key)
+
+
+@lipi_builtin('any', 'ఏదైనా')
+def builtin_any(args, env):
+    """any(items, [key]) - true if any item (or key(item)) is true; stops at the first"""
+    if len(args) not in (1, 2):
+        raise LipiException("any requires 1 or 2 arguments: (items, [key])")
+    items = eval_lipi_expr(args[0], env)
+    key = eval_key_arg(args, 1, env)
+    return native_call(any, map(key, items) if key else items)
+
+
+@lipi_builtin('all', 'అన్నీ')
+def builtin_all(args, env):
+    """all(items, [key]) - true if every item (or key(item)) is true; stops at the first false"""
+    if len(args) not in (1, 2):
+        raise LipiException("all requires 1 or 2 arguments: (items, [key])")
+    items = eval_lipi_expr(args[0], env)
+    key = eval_key_arg(args, 1, env)
+    return native_call(all, map(key, items) if key else items)
+
+
+# ---------------------------
+# Numeric Arrays: array() (v3.0)
+# ---------------------------
+ARRAY_KINDS = ['bool', 'int', 'float']  # Each kind can hold the ones before it
+NUMPY_DTYPES = {'bool': 'bool', 'int': 'int64', 'float': 'float64'}
+ARRAY_TYPECODES = {'bool': 'b', 'int': 'q', 'float': 'd'}
+ARRAY_OVERFLOW_OPS = (operator.add, operator.sub, operator.mul, operator.pow)
+ARRAY_INT_LIMIT = 2.0 ** 62  # Float estimates past this are rechecked exactly
+
+
+def infer_array_kind(values):
+    """Narrowest array kind that holds every value"""
+    kind = 0
+    for value in values:
+        if value is True or value is False:
+            continue
+        if isinstance(value, int):
+            kind = max(kind, 1)
+        elif isinstance(value, float):
+            kind = 2
+        else:
+            raise LipiException(get_error_message('type_error', f"array items must be numbers, got {value!r}"))
+    return ARRAY_KINDS[kind]
+
+
+class LipiArray(LipiNativeObject):
+    """
+    Homogeneous numeric array. Arithmetic and comparison operators work
+    elementwise on whole arrays (or an array and a number), so the loop runs
+    in NumPy when it is installed, or over a compact array.array otherwise.
+    """
+    LIPI_NAME = 'array'
+    METHODS = {
+        'sum': 'sum', 'మొత్తం': 'sum',
+        'mean': 'mean', 'సగటు': 'mean',
+        'min': 'min', 'కనిష్ఠం': 'min',
+        'max': 'max', 'గరిష్ఠం': 'max',
+        'sort': 'sort', 'క్రమీకరించు': 'sort',
+        'slice': 'slice', 'ఖండం': 'slice',
+        'to_list': 'to_list', 'జాబితా': 'to_list',
+    }
+    __hash__ = None  # == is elementwise
+
+    def __init__(self, data, kind):
+        self.data = data  # numpy.ndarray or array.array
+        self.kind = kind
+        self.is_numpy = not isinstance(data, array.array)
+
+    @classmethod
+    def from_values(cls, values, kind=None):
+        """Build an array from numbers; kind is 'int', 'float', 'bool' or None to infer"""
+        values = values if isinstance(values, list) else list(values)
+        inferred = infer_array_kind(values)
+        if kind is None:
+            kind = inferred
+        elif kind not in ARRAY_KINDS:
+            raise LipiException(get_error_message('type_error', f"array type must be one of {', '.join(ARRAY_KINDS)}"))
+        elif ARRAY_KINDS.index(inferred) > ARRAY_KINDS.index(kind):
+            raise LipiException(get_error_message('type_error', f"{inferred} values in a {kind} array"))
+        try:
+            if NUMPY_AVAILABLE:
+                return cls(numpy.array(values, dtype=NUMPY_DTYPES[kind]), kind)
+            return cls(array.array(ARRAY_TYPECODES[kind], values), kind)
+        except OverflowError:
+            raise LipiException(get_error_message('type_error', "integer too large for an int array"))
+
+    @classmethod
+    def from_numpy(cls, data):
+        kind = 'bool' if data.dtype.kind == 'b' else 'int' if data.dtype.kind in 'iu' else 'float'
+        return cls(data, kind)
+
+    def _binary(self, other, op, reflected=False):
+        """Apply op elementwise against another array of the same length or a number"""
+        if isinstance(other, LipiArray):
+            if len(other) != len(self):
+                raise LipiException(get_error_message(
+                    'type_error', f"array lengths differ: {len(self)} and {len(other)}"))
+            other_data = other.data
+        elif isinstance(other, (int, float)):
+            other_data = other
+        else:
+            return NotImplemented
+        left, right = (other_data, self.data) if reflected else (self.data, other_data)
+        try:
+            if self.is_numpy:
+                with numpy.errstate(divide='raise', invalid='raise'):
+                    result = op(left, right)
+                if result.dtype.kind in 'iu' and op in ARRAY_OVERFLOW_OPS and self._near_int_limit(op, left, right):
+                    # int64 wraps silently; redo the arithmetic exactly so
+                    # overflow raises like the array.array backend does
+                    return self._python_binary(other, op, reflected)
+                return LipiArray.from_numpy(result)
+            return self._python_binary(other, op, reflected)
+        except (ZeroDivisionError, FloatingPointError):
+            raise LipiException(get_error_message('division_by_zero'))
+        except OverflowError:
+            raise LipiException(get_error_message('type_error', "integer too large for an int array"))
+
+    def _python_binary(self, other, op, reflected):
+        """Apply op one element at a time on Python numbers"""
+        if isinstance(other, LipiArray):
+            pairs = zip(other, self) if reflected else zip(self, other)
+            return LipiArray.from_values([op(a, b) for a, b in pairs])
+        if reflected:
+            return LipiArray.from_values([op(other, a) for a in self])
+        return LipiArray.from_values([op(a, other) for a in self])
+
+    @staticmethod
+    def _near_int_limit(op, left, right):
+        """Cheap float estimate of op; true if any result may not fit in int64"""
+        with numpy.errstate(all='ignore'):
+            estimate = op(numpy.asarray(left, dtype=numpy.float64), numpy.asarray(right, dtype=numpy.float64))
+            return not numpy.all(numpy.abs(estimate) < ARRAY_INT_LIMIT)
+
+    def __add__(self, other):
+        return self._binary(other, operator.add)
+
+    def __radd__(self, other):
+        return self._binary(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._binary(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._binary(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._binary(other, operator.truediv, reflected=True)
+
+    def __mod__(self, other):
+        return self._binary(other, operator.mod)
+
+    def __pow__(self, other):
+        return self._binary(other, operator.pow)
+
+    def __lt__(self, other):
+        return self._binary(other, operator.lt)
+
+    def __le__(self, other):
+        return self._binary(other, operator.le)
+
+    def __gt__(self, other):
+        return self._binary(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._binary(other, operator.ge)
+
+    def __eq__(self, other):
+        return self._binary(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._binary(other, operator.ne)
+
+    def __bool__(self):
+        # `if a == b:` would otherwise be true for any non-empty mask
+        raise LipiException(get_error_message(
+            'type_error', "the truth value of an array is ambiguous; use all() or any()"))
+
+    def __getitem__(self, index):
+        """a[i] is a number; a[start:end] and a[mask] are new arrays"""
+        if isinstance(index, slice):
+            return LipiArray(self.data[index], self.kind)
+        if isinstance(index, LipiArray):
+            if index.kind != 'bool' or len(index) != len(self):
+                raise LipiException(get_error_message(
+                    'type_error', "an array index must be a true/false mask of the same length"))
+            if self.is_numpy:
+                return LipiArray(self.data[numpy.asarray(index.data, dtype=bool)], self.kind)
+            return LipiArray.from_values([a for a, keep in zip(self, index) if keep], self.kind)
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise LipiException(get_error_message('type_error', "array index must be an integer"))
+        try:
+            value = self.data[index]
+        except IndexError:
+            raise LipiException(get_error_message('index_error', index))
+        if self.is_numpy:
+            return value.item()
+        return bool(value) if self.kind == 'bool' else value
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        if self.is_numpy:
+            return iter(self.data.tolist())
+        return map(bool, self.data) if self.kind == 'bool' else iter(self.data)
+
+    def __str__(self):
+        return f"array({self.to_list()})"
+
+    __repr__ = __str__
+
+    def to_list(self):
+        return list(self)
+
+    def sum(self):
+        if self.is_numpy:
+            return self.data.sum().item()
+        return sum(self)
+
+    def mean(self):
+        if not len(self):
+            raise LipiException(get_error_message('runtime_error', "mean of an empty array"))
+        if self.is_numpy:
+            return self.data.mean().item()
+        return sum(self) / len(self)
+
+    def min(self):
+        if not len(self):
+            raise LipiException(get_error_message('runtime_error', "min of an empty array"))
+        return self.data.min().item() if self.is_numpy else min(self)
+
+    def max(self):
+        if not len(self):
+            raise LipiException(get_error_message('runtime_error', "max of an empty array"))
+        return self.data.max().item() if self.is_numpy else max(self)
+
+    def sort(self):
+        """New array with the values in ascending order"""
+        if self.is_numpy:
+            return LipiArray(numpy.sort(self.data), self.kind)
+        return LipiArray(array.array(self.data.typecode, sorted(self.data)), self.kind)
+
+    def slice(self, start, end=None):
+        return self[start:end]
+
+
+@lipi_builtin('array', 'శ్రేణి')
+def builtin_array(args, env):
+    """array(items, [type]) - numeric array from a list or iterator; type is "int", "float" or "bool" """
+    if len(args) not in (1, 2):
+        raise LipiException("array requires 1 or 2 arguments: (items, [type])")
+    items = eval_lipi_expr(args[0], env)
+    kind = eval_lipi_expr(args[1], env) if len(args) == 2 else None
+    try:
+        return LipiArray.from_values(items, kind)
+    except TypeError:
+        raise LipiException(get_error_message('type_error', "array expects a list of numbers"))
+
+
+# ---------------------------
+# Regular Expressions (v3.0)
+# ---------------------------
+REGEX_CACHE_SIZE = 256  # Compiled patterns kept per process
+
+
+@functools.lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_regex(pattern):
+    """Compile a pattern once; later calls with the same text reuse it"""
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise LipiException(get_error_message('regex_error', f"{pattern}: {e}"))
+
+
+def eval_regex_arg(arg_expr, env):
+    """Evaluate a pattern argument and return its cached compiled regex"""
+    pattern = eval_lipi_expr(arg_expr, env)
+    if not isinstance(pattern, str):
+        raise LipiException(get_error_message('type_error', "regex pattern must be a string"))
+    return compile_regex(pattern)
+
+
+def eval_text_arg(arg_expr, env, func_name):
+    """Evaluate an argument that must be a string"""
+    text = eval_lipi_expr(arg_expr, env)
+    if not isinstance(text, str):
+        raise LipiException(get_error_message('type_error', f"{func_name} expects text, got {text!r}"))
+    return text
+
+
+def eval_count_arg(args, index, env, description):
+    """Optional non-negative integer argument (0 when absent, meaning no limit)"""
+    if len(args) <= index:
+        return 0
+    value = eval_lipi_expr(args[index], env)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise LipiException(f"{description} must be a non-negative integer, got {value!r}")
+    return value
+
+
+def match_to_object(match):
+    """Convert a re.Match to a Lipi object: {text, start, end, groups} plus named groups"""
+    obj = match.groupdict()
+    obj.update(text=match.group(0), start=match.start(), end=match.end(), groups=list(match.groups()))
+    return obj
+
+
+@lipi_builtin('regex_match', 'నమూనా_సరిపోలు')
+def builtin_regex_match(args, env):
+    """regex_match(pattern, text) - first match anywhere in text as {text, start, end, groups}, or null"""
+    if len(args) != 2:
+        raise LipiException("regex_match requires 2 arguments: (pattern, text)")
+    match = eval_regex_arg(args[0], env).search(eval_text_arg(args[1], env, 'regex_match'))
+    return match_to_object(match) if match else None
+
+
+@lipi_builtin('regex_find_all', 'నమూనా_అన్నీ')
+def builtin_regex_find_all(args, env):
+    """regex_find_all(pattern, text) - list of matched texts (or groups, as re.findall)"""
+    if len(args) != 2:
+        raise LipiException("regex_find_all requires 2 arguments: (pattern, text)")
+    matches = eval_regex_arg(args[0], env).findall(eval_text_arg(args[1], env, 'regex_find_all'))
+    return [list(groups) if isinstance(groups, tuple) else groups for groups in matches]
+
+
+@lipi_builtin('regex_iter', 'నమూనా_ప్రవాహం')
+def builtin_regex_iter(args, env):
+    """regex_iter(pattern, text) - lazy iterator of match objects"""
+    if len(args) != 2:
+        raise LipiException("regex_iter requires 2 arguments: (pattern, text)")
+    regex = eval_regex_arg(args[0], env)
+    return map(match_to_object, regex.finditer(eval_text_arg(args[1], env, 'regex_iter')))
+
+
+@lipi_builtin('regex_sub', 'నమూనా_మార్చు')
+def builtin_regex_sub(args, env):
+    """regex_sub(pattern, replacement, text, [count]) - replace matches; \\1 refers to group 1"""
+    if len(args) not in (3, 4):
+        raise LipiException("regex_sub requires 3 or 4 arguments: (pattern, replacement, text, [count])")
+    regex = eval_regex_arg(args[0], env)
+    replacement = eval_text_arg(args[1], env, 'regex_sub')
+    text = eval_text_arg(args[2], env, 'regex_sub')
+    count = eval_count_arg(args, 3, env, 'regex_sub count')
+    try:
+        return regex.sub(replacement, text, count=count)
+    except re.error as e:
+        raise LipiException(get_error_message('regex_error', f"{replacement}: {e}"))
+
+
+@lipi_builtin('regex_split', 'నమూనా_విభజించు')
+def builtin_regex_split(args, env):
+    """regex_split(pattern, text, [max_splits]) - split text around matches"""
+    if len(args) not in (2, 3):
+        raise LipiException("regex_split requires 2 or 3 arguments: (pattern, text, [max_splits])")
+    regex = eval_regex_arg(args[0], env)
+    text = eval_text_arg(args[1], env, 'regex_split')
+    max_splits = eval_count_arg(args, 2, env, 'regex_split max_splits')
+    return regex.split(text, maxsplit=max_splits)
+
+
+# ---------------------------
+# Python Module Call Sites (v3.0)
+# ---------------------------
+MAX_MODULE_CALL_CACHE = 4096
+MODULE_CALL_CACHE = {}  # Call expression -> (module name, module, function, argument expressions)
+
+
+def resolve_module_call(expr, python_modules):
+    """
+    Parse expr as exactly module.func(args) on an imported Python module.
+    Returns (module_name, module, func, arg_exprs) or None.
+    """
+    if not expr.endswith(')'):
+        return None
+    dot_pos = expr.find('.')
+    paren_pos = expr.find('(')
+    if not 0 < dot_pos < paren_pos:
+        return None
+    module_name = expr[:dot_pos].strip()
+    module = python_modules.get(module_name)
+    func_name = expr[dot_pos+1:paren_pos].strip()
+    if module is None or not func_name.isidentifier() or find_closing_paren(expr, paren_pos) != len(expr) - 1:
+        return None
+
+    # Security: Prevent access to dunder methods
+    if func_name.startswith('__') and func_name.endswith('__'):
+        raise LipiException(f"Access to dunder methods is not allowed: {func_name}")
+    func = getattr(module, func_name, None)
+    if func is None:
+        raise LipiException(get_error_message('attribute_error', f"{module_name}.{func_name}"))
+    args_str = expr[paren_pos+1:-1].strip()
+    return module_name, module, func, tuple(split_arguments(args_str)) if args_str else ()
+
+
+def eval_module_call(expr, env):
+    """
+    Evaluate expr if it is a call on a module loaded with import_python.
+    The function and argument list are resolved once per call site; later
+    evaluations only check that this runtime imported the same module.
+    Returns (True, result), or (False, None) for any other expression.
+    """
+    python_modules = _current_runtime.get().python_modules
+    site = MODULE_CALL_CACHE.get(expr)
+    if site is None or python_modules.get(site[0]) is not site[1]:
+        site = resolve_module_call(expr, python_modules)
+        if site is None:
+            return False, None
+        if len(MODULE_CALL_CACHE) >= MAX_MODULE_CALL_CACHE:
+            MODULE_CALL_CACHE.clear()
+        MODULE_CALL_CACHE[expr] = site
+    return True, site[2](*[eval_lipi_expr(arg, env) for arg in site[3]])
+
+
+# ---------------------------
+# Parallel Map over a Process Pool (v3.0)
+# ---------------------------
+PARALLEL_WORKER_ENV = {}  # Global environment inside a parallel_map worker process
+
+
+def is_picklable(value):
+    """True if value can be sent to a worker process"""
+    try:
+        pickle.dumps(value)
+        return True
+    except Exception:
+        return False
+
+
+def strip_definition(definition):
+    """Copy a function/class definition without its captured closure env"""
+    stripped = {key: value for key, value in definition.items() if key != 'env'}
+    stripped['env'] = {}
+    return stripped
+
+
+def snapshot_for_workers(env):
+    """
+    Capture the picklable runtime state a worker needs to run Lipi functions:
+    function and class definitions, loaded module exports, imported Python
+    module names and the caller's global variables.
+    """
+    classes = {}
+    for class_name, class_def in runtime.classes.items():
+        class_copy = strip_definition(class_def)
+        class_copy['methods'] = {name: strip_definition(method)
+                                 for name, method in class_def['methods'].items()}
+        classes[class_name] = class_copy
+
+    loaded_modules = {}
+    for module_path, exports in runtime.loaded_modules.items():
+        loaded_modules[module_path] = {
+            name: (strip_definition(value) if isinstance(value, dict) and 'body' in value else value)
+            for name, value in exports.items()
+            if is_picklable(value)
+        }
+
+    return {
+        'functions': {name: strip_definition(func_def) for name, func_def in runtime.functions.items()},
+        'classes': classes,
+        'loaded_modules': loaded_modules,
+        'python_modules': list(runtime.python_modules),
+        'env': {name: value for name, value in env.items() if is_picklable(value)},
+    }
+
+
+def init_parallel_worker(snapshot):
+    """ProcessPoolExecutor initializer: install the parent's definitions once per worker"""
+    runtime.functions.clear()
+    runtime.functions.update(snapshot['functions'])
+    runtime.classes.clear()
+    runtime.classes.update(snapshot['classes'])
+    runtime.loaded_modules.clear()
+    runtime.loaded_modules.update(snapshot['loaded_modules'])
+
+    PARALLEL_WORKER_ENV.clear()
+    PARALLEL_WORKER_ENV.update(snapshot['env'])
+    for module_name in snapshot['python_modules']:
+        module = importlib.import_module(module_name)
+        runtime.python_modules[module_name] = module
+        PARALLEL_WORKER_ENV[module_name] = module
+
+
+def run_parallel_worker(func_name, item):
+    """Call one Lipi function on one item inside a worker process"""
+    return call_lipi_function(func_name, [item], PARALLEL_WORKER_ENV)
+
+
+@lipi_builtin('parallel_map', 'సమాంతర_పటం')
+def builtin_parallel_map(args, env):
+    """
+    parallel_map(func_name, items, [workers]) - apply a one-argument Lipi function
+    to every item on a process pool. Results keep the order of items.
+    """
+    if len(args) not in (2, 3):
+        raise LipiException("parallel_map requires 2 or 3 arguments: (func_name, items, [workers])")
+
+    func_name = eval_function_name_arg(args[0], env)
+    items = list(eval_lipi_expr(args[1], env))
+    workers = eval_lipi_expr(args[2], env) if len(args) == 3 else (os.cpu_count() or 1)
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise LipiException(f"parallel_map workers must be a positive integer, got {workers!r}")
+
+    if not items:
+        return []
+    workers = min(workers, len(items))
+    chunksize = max(1, len(items) // (workers * 4))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=init_parallel_worker,
+                                 initargs=(snapshot_for_workers(env),)) as pool:
+            return list(pool.map(run_parallel_worker, itertools.repeat(func_name), items,
+                                 chunksize=chunksize))
+    except LipiException:
+        raise
+    except Exception as e:
+        raise LipiException(f"parallel_map error: {e}")
+
+
+# ---------------------------
+# Enhanced Line Executor
+# ---------------------------
+def run_lipi_line(line, env):
+    """
+    Execute a single line of Lipi code.
+    Supports both Telugu and English keywords.
+    """
+    line = line.strip()
+
+    # Empty / comment
+    if not line or line.startswith("#"):
+        return
+
+    # Return statement: return expr / రిటర్న్ expr
+    if line.startswith("return ") or line.startswith("రిటర్న్ "):
+        expr = line[7:] if line.startswith("return ") else line[8:]
+        value = eval_lipi_expr(expr.strip(), env) if expr.strip() else None
+        raise LipiReturnValue(value)
+
+    # Print statement (Telugu): చెప్పు expr
+    if line.startswith("చెప్పు "):
+        expr = line[len("చెప్పు "):]
+        value = eval_lipi_expr(expr, env)
+        print(value)
+        return
+
+    # Print statement (English): print expr
+    if line.startswith("print "):
+        expr = line[len("print "):]
+        value = eval_lipi_expr(expr, env)
+        print(value)
+        return
+
+    # Python library import: import_python("module") / దిగుమతి_python("module")
+    if line.startswith("import_python(") or line.startswith("దిగుమతి_python("):
+        module_expr = line[line.index('(')+1:line.rindex(')')]
+        module_name = eval_lipi_expr(module_expr.strip(), env)
+
+        if module_name not in runtime.whitelist_modules:
+            raise LipiException(f"Module {module_name} is not whitelisted for security reasons")
+
+        try:
+            module = importlib.import_module(module_name)
+            runtime.python_modules[module_name] = module
+            env[module_name] = module
+        except ImportError as e:
+            raise LipiException(f"Failed to import Python module {module_name}: {e}")
+        return
+
+    # v3.0: Lipi module import: దిగుమతి func from "module" / import func from "module"
+    if line.startswith("దిగుమతి ") or line.startswith("import "):
+        # Check if it's a module import (has "from" keyword)
+        if " from " in line:
+            parse_import_statement(line, runtime, env)
+            return
+        # Otherwise fall through to other statement types
+
+    # Export statement: export func_name / ఎగుమతి func_name
+    if line.startswith("export ") or line.startswith("ఎగుమతి "):
+        names = line[7:] if line.startswith("export ") else line[8:]
+        for name in names.split(','):
+            name = name.strip()
+            if name in env:
+                runtime.exports[name] = env[name]
+            elif name in runtime.functions:
+                runtime.exports[name] = runtime.functions[name]
+        return
+
+    # Standalone await: await expr / వేచి expr
+    if any(line.startswith(kw) for kw in AWAIT_KEYWORDS):
+        eval_lipi_expr(line, env)
+        return
+
+    # Standalone function call: call func(args) or కాల్ func(args)
+    if line.startswith('call ') or line.startswith('కాల్ '):
+        eval_lipi_expr(line, env)
+        return
+
+    # Standalone built-in function calls (file operations, http, db)
+    # Check these BEFORE assignment to avoid false positives with '=' in function arguments
+    builtin_prefixes = [
+        'file_read(', 'file_write(', 'file_append(',
+        'ఫైల్_చదువు(', 'ఫైల్_వ్రాయి(', 'ఫైల్_జోడించు(',
+        'http_get(', 'http_post(',
+        'http_పొందు(', 'http_పంపు(',
+        'db_connect(', 'db_query(', 'db_close(',
+        'డేటాబేస్_కనెక్ట్(', 'డేటాబేస్_ప్రశ్న(', 'డేటాబేస్_మూసివేయి(',
+        'mysql_connect(', 'mysql_query(', 'mysql_close(',  # v3.0 MySQL
+        'mysql_కనెక్ట్(', 'mysql_ప్రశ్న(', 'mysql_మూసివేయి(',  # v3.0 MySQL Telugu
+        'postgres_connect(', 'postgres_query(', 'postgres_close(',  # v3.0 PostgreSQL
+        'postgres_కనెక్ట్(', 'postgres_ప్రశ్న(', 'postgres_మూసివేయి('  # v3.0 PostgreSQL Telugu
+    ]
+    for prefix in builtin_prefixes:
+        if line.startswith(prefix):
+            eval_lipi_expr(line, env)
+            return
+    if match_builtin_call(line):
+        eval_lipi_expr(line, env)
+        return
+    # Standalone method call on a built-in object: sb.append(text)
+    if eval_native_method_call(line, env)[0]:
+        return
+
+    # Assignment: name = expr
+    if "=" in line and not any(op in line for op in ["==", ">=", "<=", "!="]):
+        name, expr = line.split("=", 1)
+        name = name.strip()
+        expr = expr.strip()
+
+        # Attribute assignment: self.name = expr or స్వీయ.name = expr (v3.0)
+        if '.' in name:
+            dot_pos = name.index('.')
+            obj_name = name[:dot_pos].strip()
+            attr_name = name[dot_pos+1:].strip()
+
+            # Check if this is a class instance
+            if obj_name in env and isinstance(env[obj_name], LipiClassInstance):
+                instance = env[obj_name]
+                instance.attributes[attr_name] = eval_lipi_expr(expr, env)
+                return
+
+        # Regular variable assignment
+        env[name] = eval_lipi_expr(expr, env)
+        return
+
+    # If we reach here, syntax is unknown
+    raise SyntaxError(f"తెలియని లైన్ (unknown line): {line}")
+
+
+# ---------------------------
+# Function Definition Handler
+# ---------------------------
+def parse_function_definition(lines, start_index, env):
+    """
+    Parse function definition starting at start_index.
+    Supports: function name(params): / పనిచేయి name(params):
+    Returns: (next_index, function_name, params, body)
+    """
+    line = lines[start_index].strip()
+
+    # async function / అసమకాలిక పనిచేయి, cached function / స్మృతి పనిచేయి
+    is_async = is_cached = False
+    modifier = True
+    while modifier:
+        modifier = next((prefix for prefix in FUNCTION_MODIFIERS if line.startswith(prefix)), None)
+        if modifier:
+            is_async = is_async or modifier in ASYNC_PREFIXES
+            is_cached = is_cached or modifier in CACHED_PREFIXES
+            line = line[len(modifier):].strip()
+
+    # Check for Telugu or English function definition
+    is_telugu = line.startswith("పనిచేయి ")
+    is_english = line.startswith("function ")
+
+    if not (is_telugu or is_english) or ':' not in line:
+        return None
+
+    # Extract function signature
+    if is_telugu:
+        signature = line[len("పనిచేయి "):-1].strip()
+    else:
+        signature = line[len("function "):-1].strip()
+
+    # Parse function name and parameters
+    paren_pos = signature.index('(')
+    func_name = signature[:paren_pos].strip()
+    params_str = signature[paren_pos+1:signature.rindex(')')].strip()
+
+    params = []
+    if params_str:
+        params = [p.strip() for p in params_str.split(',')]
 
     # Collect function body (track nesting depth)
     body = []
@@ -1291,7 +3490,8 @@ def parse_function_definition(lines, start_index, env):
         if any(stripped.startswith(kw) for kw in ["యెడల", "if", "లేకపోతే", "else",
                                                     "అలాగే", "elif", "ఎప్పుడు", "while",
                                                     "పునరావృతం", "for", "పనిచేయి", "function",
-                                                    "ప్రయత్నించు:", "try:"]):
+                                                    "ప్రయత్నించు:", "try:"]) or \
+           (stripped.endswith(":") and any(stripped.startswith(kw) for kw in BLOCK_OPENERS)):
             nesting_depth += 1
             body.append(stripped)
         elif stripped in ["ముగింపు", "end"]:
@@ -1308,16 +3508,129 @@ def parse_function_definition(lines, start_index, env):
         i += 1
 
     # Store function in runtime
+    count_stat('env_copies')
     runtime.functions[func_name] = {
         'params': params,
         'body': body,
         'env': env.copy()  # Capture closure
     }
+    if is_async:
+        runtime.functions[func_name]['async'] = True
+    if is_cached:
+        if is_async:
+            raise LipiException(f"Function {func_name} cannot be both async and cached")
+        runtime.functions[func_name]['cache'] = LipiFunctionCache()
 
     # Return index after 'ముగింపు' or 'end'
     return i + 1
 
 
+# ---------------------------
+# Memoization (cached function / memoize)
+# ---------------------------
+CACHED_PREFIXES = ["స్మృతి ", "cached "]
+DEFAULT_CACHE_SIZE = 128
+
+
+class LipiFunctionCache:
+    """
+    Bounded LRU of a pure function's results, keyed on the argument tuple.
+    Calls with unhashable arguments (lists, objects) bypass the cache.
+    maxsize None means unbounded.
+    """
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def call(self, args, compute):
+        key = tuple(args)
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+        if key is None:
+            return compute()
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        result = compute()
+        if self.maxsize != 0:
+            with self.lock:
+                self.entries[key] = result
+                self.entries.move_to_end(key)
+                if self.maxsize is not None and len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return result
+
+    def info(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'maxsize': self.maxsize, 'currsize': len(self.entries)}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def __reduce__(self):
+        # Worker processes (parallel_map) start with an empty cache
+        return (LipiFunctionCache, (self.maxsize,))
+
+
+def fresh_function_def(func_def):
+    """Copy a function definition; a cached function gets a new, empty cache"""
+    copy = dict(func_def)
+    if copy.get('cache') is not None:
+        copy['cache'] = LipiFunctionCache(copy['cache'].maxsize)
+    return copy
+
+
+def function_cache(args, env, builtin_name):
+    """Look up the cache of the function named by args[0]"""
+    if len(args) != 1:
+        raise LipiException(f"{builtin_name} requires 1 argument: function")
+    func_name = eval_function_name_arg(args[0], env)
+    cache = runtime.functions[func_name].get('cache')
+    if cache is None:
+        raise LipiException(f"{builtin_name}: function {func_name} is not cached")
+    return cache
+
+
+@lipi_builtin('memoize', 'స్మృతి_చేయి')
+def builtin_memoize(args, env):
+    """memoize(func, [maxsize]) - cache a function's results in an LRU (maxsize null = unbounded)"""
+    if len(args) not in (1, 2):
+        raise LipiException("memoize requires 1 or 2 arguments: (function, [maxsize])")
+    func_name = eval_function_name_arg(args[0], env)
+    maxsize = eval_lipi_expr(args[1], env) if len(args) == 2 else DEFAULT_CACHE_SIZE
+    if maxsize is not None and (not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0):
+        raise LipiException("memoize maxsize must be a non-negative integer or null")
+    func_def = runtime.functions[func_name]
+    if func_def.get('async'):
+        raise LipiException(f"Function {func_name} cannot be both async and cached")
+    func_def['cache'] = LipiFunctionCache(maxsize)
+    return func_name
+
+
+@lipi_builtin('cache_info', 'కాష్_సమాచారం')
+def builtin_cache_info(args, env):
+    """cache_info(func) - {hits, misses, maxsize, currsize} of a cached function"""
+    return function_cache(args, env, 'cache_info').info()
+
+
+@lipi_builtin('cache_clear', 'కాష్_తుడువు')
+def builtin_cache_clear(args, env):
+    """cache_clear(func) - empty a cached function's cache and reset its statistics"""
+    function_cache(args, env, 'cache_clear').clear()
+    return True
+
+
 # ---------------------------
 # Class Definition Parser (v3.0)
 # ---------------------------
@@ -1360,7 +3673,8 @@ def parse_class_definition(lines, start_index, env):
         stripped = lines[i].strip()
 
         # Check if this is a method definition
-        if (stripped.startswith("పనిచేయి ") or stripped.startswith("function ")) and stripped.endswith(":"):
+        if (stripped.startswith("పనిచేయి ") or stripped.startswith("function ") or
+                any(stripped.startswith(prefix) for prefix in FUNCTION_MODIFIERS)) and stripped.endswith(":"):
             # Parse method definition
             method_result = parse_function_definition(lines, i, env)
             if method_result:
@@ -1369,6 +3683,8 @@ def parse_class_definition(lines, start_index, env):
                 # The last added function is the method we just parsed
                 last_func_name = list(runtime.functions.keys())[-1]
                 method_def = runtime.functions.pop(last_func_name)
+                if 'cache' in method_def:
+                    raise LipiException(f"Method {last_func_name} cannot be cached; cache a function instead")
                 methods[last_func_name] = method_def
                 continue
 
@@ -1376,7 +3692,8 @@ def parse_class_definition(lines, start_index, env):
         if any(stripped.startswith(kw) for kw in ["యెడల", "if", "లేకపోతే", "else",
                                                     "అలాగే", "elif", "ఎప్పుడు", "while",
                                                     "పునరావృతం", "for", "పనిచేయి", "function",
-                                                    "ప్రయత్నించు:", "try:"]):
+                                                    "ప్రయత్నించు:", "try:"]) or \
+           (stripped.endswith(":") and any(stripped.startswith(kw) for kw in BLOCK_OPENERS)):
             nesting_depth += 1
         elif stripped in ["ముగింపు", "end"]:
             if nesting_depth == 0:
@@ -1389,6 +3706,7 @@ def parse_class_definition(lines, start_index, env):
         i += 1
 
     # Store class in runtime
+    count_stat('env_copies')
     runtime.classes[class_name] = {
         'methods': methods,
         'parent': parent_class,
@@ -1444,6 +3762,10 @@ def instantiate_class(class_name, args, env):
         method_env = env.copy()
         method_env['స్వీయ'] = instance  # Telugu 'self'
         method_env['self'] = instance  # English 'self'
+        stats = runtime.stats
+        if stats is not None:
+            stats.method_calls += 1
+            stats.env_copies += 1
 
         # Bind parameters
         params = init_method['params']
@@ -1483,83 +3805,531 @@ def call_method(instance, method_name, args, env):
             method = current_class_def['methods'][method_name]
             break
 
-        # Move to parent class
-        parent_name = current_class_def.get('parent')
-        if parent_name and parent_name in runtime.classes:
-            current_class_def = runtime.classes[parent_name]
-            method_class_name = parent_name
-        else:
-            current_class_def = None
+        # Move to parent class
+        parent_name = current_class_def.get('parent')
+        if parent_name and parent_name in runtime.classes:
+            current_class_def = runtime.classes[parent_name]
+            method_class_name = parent_name
+        else:
+            current_class_def = None
+
+    if method is None:
+        raise LipiException(f"Undefined method: {instance.class_name}.{method_name}")
+
+    # Create method environment with self bound to instance
+    method_env = env.copy()
+    method_env['స్వీయ'] = instance  # Telugu 'self'
+    method_env['self'] = instance  # English 'self'
+    stats = runtime.stats
+    if stats is not None:
+        stats.method_calls += 1
+        stats.env_copies += 1
+
+    # Bind parameters (skip first which is self/స్వీయ)
+    params = method['params']
+    if len(args) != len(params) - 1:  # -1 because first param is self
+        raise LipiException(f"{method_name} expects {len(params)-1} arguments, got {len(args)}")
+
+    for i, param_name in enumerate(params[1:]):
+        method_env[param_name] = args[i]
+
+    # Execute method body
+    return invoke_function_body(f"{method_class_name}.{method_name}", method, method_env)
+
+
+# ---------------------------
+# For Loop Handler
+# ---------------------------
+def run_lipi_for_loop(lines, start_index, env):
+    """
+    Process a FOR loop: for item in list: / పునరావృతం item in list:
+    """
+    line = lines[start_index].strip()
+
+    # Check for Telugu or English for loop
+    is_telugu = line.startswith("పునరావృతం ")
+    is_english = line.startswith("for ")
+
+    if not (is_telugu or is_english) or ':' not in line or ' in ' not in line:
+        return start_index
+
+    # Extract loop variable and iterable
+    if is_telugu:
+        loop_expr = line[len("పునరావృతం "):-1].strip()
+    else:
+        loop_expr = line[len("for "):-1].strip()
+
+    var_name, iterable_expr = loop_expr.split(' in ', 1)
+    var_name = var_name.strip()
+    iterable = eval_lipi_expr(iterable_expr.strip(), env)
+
+    # Collect loop body
+    body = []
+    i = start_index + 1
+    while i < len(lines):
+        stripped = lines[i].strip()
+
+        # End of loop
+        if stripped == "ముగింపు" or stripped == "end":
+            break
+
+        body.append(stripped)
+        i += 1
+
+    # Execute loop using block executor for proper control flow
+    for item in iterable:
+        env[var_name] = item
+        execute_block(body, env)
+
+    return i + 1
+
+
+# ---------------------------
+# Parallel For Loop Handler (v3.0)
+# ---------------------------
+BLOCK_OPENERS = ["యెడల ", "if ", "వరకు ", "while ", "పునరావృతం ", "for ", "పనిచేయి ", "function ",
+                 "క్లాస్ ", "class ", "సమాంతర ", "parallel ", "ప్రయత్నించు:", "try:",
+                 "అసమకాలిక ", "async ", "స్మృతి ", "cached "]
+
+
+def collect_block_body(lines, start_index):
+    """
+    Collect the body of the block opened at start_index up to its matching end.
+    Returns (body, end_index).
+    """
+    body = []
+    nesting_level = 0
+    i = start_index + 1
+    while i < len(lines):
+        stripped = lines[i].strip()
+
+        if stripped.endswith(":") and any(stripped.startswith(kw) for kw in BLOCK_OPENERS):
+            nesting_level += 1
+        elif stripped == "ముగింపు" or stripped == "end":
+            if nesting_level == 0:
+                break
+            nesting_level -= 1
+
+        body.append(stripped)
+        i += 1
+
+    return body, i
+
+
+class LipiAccumulator(list):
+    """Thread-safe result list for parallel loops: accumulator() / సంచయం()"""
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def add(self, value):
+        with self.lock:
+            self.append(value)
+
+
+@lipi_builtin('accumulator', 'సంచయం')
+def builtin_accumulator(args, env):
+    """accumulator() - create an empty thread-safe result list"""
+    if args:
+        raise LipiException("accumulator takes no arguments")
+    return LipiAccumulator()
+
+
+@lipi_builtin('accumulate', 'సంచయించు')
+def builtin_accumulate(args, env):
+    """accumulate(acc, value) - append value to an accumulator from any loop iteration"""
+    if len(args) != 2:
+        raise LipiException("accumulate requires 2 arguments: (accumulator, value)")
+    acc = eval_lipi_expr(args[0], env)
+    if not isinstance(acc, LipiAccumulator):
+        raise LipiException(get_error_message('type_error', "accumulate expects an accumulator()"))
+    acc.add(eval_lipi_expr(args[1], env))
+    return True
+
+
+def run_lipi_parallel_for(lines, start_index, env):
+    """
+    Process a parallel FOR loop: parallel for item in list: / సమాంతర పునరావృతం item in list:
+    Iterations run on a bounded thread pool, each in its own copy of the scope.
+    Collect results with accumulator() / accumulate().
+    """
+    line = lines[start_index].strip()
+
+    if line.startswith("సమాంతర "):
+        header = line[len("సమాంతర "):].strip()
+    else:
+        header = line[len("parallel "):].strip()
+
+    if header.startswith("పునరావృతం "):
+        loop_expr = header[len("పునరావృతం "):-1].strip()
+    elif header.startswith("for "):
+        loop_expr = header[len("for "):-1].strip()
+    else:
+        raise SyntaxError(f"తెలియని లైన్ (unknown line): {line}")
+
+    var_name, iterable_expr = loop_expr.split(' in ', 1)
+    var_name = var_name.strip()
+    iterable = eval_lipi_expr(iterable_expr.strip(), env)
+
+    body, end_index = collect_block_body(lines, start_index)
+
+    def run_iteration(item):
+        iteration_env = env.copy()
+        count_stat('env_copies')
+        iteration_env[var_name] = item
+        sampler = runtime.sampler
+        if sampler is not None:
+            sampler.push('<parallel for>')
+        try:
+            execute_block(body, iteration_env)
+        except LipiReturnValue:
+            raise LipiException("return is not allowed inside a parallel for loop")
+        finally:
+            if sampler is not None:
+                sampler.pop()
+
+    # Keep a bounded number of iterations in flight so lazy iterables stay lazy
+    workers = runtime.parallel_workers
+    pending = deque()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for item in iterable:
+            if len(pending) >= workers * 2:
+                pending.popleft().result()
+            # Workers run in a copy of this context so they see the same runtime
+            pending.append(pool.submit(contextvars.copy_context().run, run_iteration, item))
+        while pending:
+            pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    return end_index + 1
+
+
+# ---------------------------
+# Async / Await (v3.0)
+# ---------------------------
+ASYNC_PREFIXES = ["అసమకాలిక ", "async "]
+FUNCTION_MODIFIERS = ASYNC_PREFIXES + CACHED_PREFIXES  # Prefixes allowed before function
+AWAIT_KEYWORDS = ["వేచి ", "await "]
+AWAIT_PLACEHOLDER = '__lipi_await__'  # Binds an awaited value while the rest of the line runs
+
+
+def find_await(line):
+    """Find an await keyword outside strings. Returns (position, keyword) or (-1, None)."""
+    padded = ' ' + line
+    for kw in AWAIT_KEYWORDS:
+        pos = find_operator_outside_strings(padded, ' ' + kw)
+        if pos != -1:
+            return pos, kw
+    return -1, None
+
+
+async def eval_lipi_expr_async(expr, env):
+    """Evaluate an expression that may contain one await (await applies to the rest of it)"""
+    expr = expr.strip()
+    pos, kw = find_await(expr)
+    if pos == -1:
+        return eval_lipi_expr(expr, env)
+
+    value = eval_lipi_expr(expr[pos+len(kw):], env)
+    if inspect.isawaitable(value):
+        value = await value
+    if pos == 0:
+        return value
+
+    scope = env.copy()
+    scope[AWAIT_PLACEHOLDER] = value
+    return eval_lipi_expr(expr[:pos] + ' ' + AWAIT_PLACEHOLDER, scope)
+
+
+async def run_lipi_line_async(line, env):
+    """Run one statement of an async body: x = await ..., return await ..., print await ..."""
+    pos, kw = find_await(line)
+    if pos == -1:
+        run_lipi_line(line, env)
+        return
+
+    value = eval_lipi_expr(line[pos+len(kw):], env)
+    if inspect.isawaitable(value):
+        value = await value
+    statement = line[:pos].strip()
+    if not statement:
+        return  # Bare await
+
+    env[AWAIT_PLACEHOLDER] = value
+    try:
+        run_lipi_line(statement + ' ' + AWAIT_PLACEHOLDER, env)
+    finally:
+        env.pop(AWAIT_PLACEHOLDER, None)
+
+
+def split_block_sections(body, is_marker):
+    """
+    Split a block body at top-level marker lines (else:, catch e:, finally:).
+    Returns [(marker_line, lines), ...]; the first section's marker is None.
+    """
+    sections = [(None, [])]
+    nesting_level = 0
+    for stripped in body:
+        if nesting_level == 0 and is_marker(stripped):
+            sections.append((stripped, []))
+            continue
+        if stripped.endswith(":") and any(stripped.startswith(kw) for kw in BLOCK_OPENERS):
+            nesting_level += 1
+        elif stripped == "ముగింపు" or stripped == "end":
+            nesting_level -= 1
+        sections[-1][1].append(stripped)
+    return sections
+
+
+async def run_control_block_async(header, body, env):
+    """Run an if / while / for / try block whose header or body awaits"""
+    if header.startswith("యెడల ") or header.startswith("if "):
+        condition_expr = header[len("యెడల "):-1] if header.startswith("యెడల ") else header[len("if "):-1]
+        sections = split_block_sections(body, lambda s: s in ["లేకపోతే:", "else:"])
+        else_body = sections[1][1] if len(sections) > 1 else []
+        if bool(await eval_lipi_expr_async(condition_expr, env)):
+            await execute_block_async(sections[0][1], env)
+        else:
+            await execute_block_async(else_body, env)
+
+    elif header.startswith("వరకు ") or header.startswith("while "):
+        condition_expr = header[len("వరకు "):-1] if header.startswith("వరకు ") else header[len("while "):-1]
+        while bool(await eval_lipi_expr_async(condition_expr, env)):
+            await execute_block_async(body, env)
+
+    elif header.startswith("పునరావృతం ") or header.startswith("for "):
+        loop_expr = header[len("పునరావృతం "):-1] if header.startswith("పునరావృతం ") else header[len("for "):-1]
+        var_name, iterable_expr = loop_expr.split(' in ', 1)
+        for item in await eval_lipi_expr_async(iterable_expr, env):
+            env[var_name.strip()] = item
+            await execute_block_async(body, env)
+
+    else:  # try: / ప్రయత్నించు:
+        sections = split_block_sections(
+            body, lambda s: s.startswith("catch") or s.startswith("పట్టుకో") or s in ["finally:", "చివరకు:"])
+        try_body, catch_body, finally_body, error_var = sections[0][1], [], [], None
+        for marker, section in sections[1:]:
+            if marker in ["finally:", "చివరకు:"]:
+                finally_body = section
+            else:
+                parts = marker.split()
+                if len(parts) > 1:
+                    error_var = parts[1].rstrip(':')
+                catch_body = section
+        try:
+            await execute_block_async(try_body, env)
+        except LipiReturnValue:
+            raise
+        except Exception as e:
+            if error_var:
+                env[error_var] = str(e)
+            await execute_block_async(catch_body, env)
+        finally:
+            await execute_block_async(finally_body, env)
+
+
+ASYNC_CONTROL_BLOCKS = ["యెడల ", "if ", "వరకు ", "while ", "పునరావృతం ", "for ", "ప్రయత్నించు:", "try:"]
+
 
-    if method is None:
-        raise LipiException(f"Undefined method: {instance.class_name}.{method_name}")
+async def execute_block_async(lines, env):
+    """
+    Execute the body of an async function on the runtime's event loop.
+    Statements and control blocks that await are stepped here; everything
+    else is handed to the synchronous executor unchanged.
+    """
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
 
-    # Create method environment with self bound to instance
-    method_env = env.copy()
-    method_env['స్వీయ'] = instance  # Telugu 'self'
-    method_env['self'] = instance  # English 'self'
+        if not line or line.startswith("#") or line in ["ముగింపు", "end"]:
+            i += 1
+            continue
 
-    # Bind parameters (skip first which is self/స్వీయ)
-    params = method['params']
-    if len(args) != len(params) - 1:  # -1 because first param is self
-        raise LipiException(f"{method_name} expects {len(params)-1} arguments, got {len(args)}")
+        if line.endswith(":") and any(line.startswith(kw) for kw in BLOCK_OPENERS):
+            body, end_index = collect_block_body(lines, i)
+            awaits = any(find_await(stmt)[0] != -1 for stmt in [line] + body)
+            if awaits and any(line.startswith(kw) for kw in ASYNC_CONTROL_BLOCKS):
+                await run_control_block_async(line, body, env)
+            else:
+                execute_block(lines[i:end_index + 1], env)
+            i = end_index + 1
+            continue
 
-    for i, param_name in enumerate(params[1:]):
-        method_env[param_name] = args[i]
+        await run_lipi_line_async(line, env)
+        i += 1
 
-    # Execute method body
+
+async def run_async_function_body(body, func_env):
+    """Coroutine returned when an async function is called"""
     try:
-        execute_block(method['body'], method_env)
-        return None  # Methods that don't return anything
+        await execute_block_async(body, func_env)
+        return None
     except LipiReturnValue as ret:
         return ret.value
 
 
-# ---------------------------
-# For Loop Handler
-# ---------------------------
-def run_lipi_for_loop(lines, start_index, env):
-    """
-    Process a FOR loop: for item in list: / పునరావృతం item in list:
-    """
-    line = lines[start_index].strip()
-
-    # Check for Telugu or English for loop
-    is_telugu = line.startswith("పునరావృతం ")
-    is_english = line.startswith("for ")
+async def gather_awaitables(awaitables):
+    """Await all awaitables concurrently, returning results in order"""
+    return list(await asyncio.gather(*awaitables))
 
-    if not (is_telugu or is_english) or ':' not in line or ' in ' not in line:
-        return start_index
 
-    # Extract loop variable and iterable
-    if is_telugu:
-        loop_expr = line[len("పునరావృతం "):-1].strip()
-    else:
-        loop_expr = line[len("for "):-1].strip()
+@lipi_builtin('gather', 'సమీకరించు')
+def builtin_gather(args, env):
+    """gather(a, b, ...) or gather(list) - run awaitables concurrently; await the result"""
+    values = [eval_lipi_expr(arg, env) for arg in args]
+    if len(values) == 1 and isinstance(values[0], list):
+        values = values[0]
+    for value in values:
+        if not inspect.isawaitable(value):
+            raise LipiException(get_error_message('type_error', f"gather expects awaitables, got {type(value).__name__}"))
+    return gather_awaitables(values)
 
-    var_name, iterable_expr = loop_expr.split(' in ', 1)
-    var_name = var_name.strip()
-    iterable = eval_lipi_expr(iterable_expr.strip(), env)
 
-    # Collect loop body
-    body = []
-    i = start_index + 1
-    while i < len(lines):
-        stripped = lines[i].strip()
+async def run_in_thread(func, *args):
+    """Run a blocking I/O function in the loop's default executor"""
+    return await asyncio.get_running_loop().run_in_executor(None, contextvars.copy_context().run, func, *args)
 
-        # End of loop
-        if stripped == "ముగింపు" or stripped == "end":
-            break
 
-        body.append(stripped)
-        i += 1
+async def async_http_request(method, url, data=None, redirects=5, timeout=None):
+    """
+    Minimal HTTP/1.1 client on asyncio streams, so thousands of requests can be
+    in flight on one thread. Mirrors http_get/http_post: returns the decoded
+    body and raises for 4xx/5xx responses. Follows up to 5 redirects.
+    timeout (default: the runtime's http_timeout) bounds the connect and each read.
+    """
+    label = f"HTTP {method}"
+    timeout = runtime.http_timeout if timeout is None else timeout
+
+    def within(awaitable):
+        return asyncio.wait_for(awaitable, timeout)
+    parsed = urllib.parse.urlsplit(url)
+    if parsed.scheme not in ['http', 'https'] or not parsed.hostname:
+        raise LipiException(f"{label} error: unsupported URL {url}")
+
+    body = b''
+    headers = {
+        'Host': parsed.netloc,
+        'Connection': 'close',
+        'Accept-Encoding': 'identity',
+        'User-Agent': 'lipi-async/3.0',
+    }
+    if data is not None:
+        if isinstance(data, dict):
+            data = json.dumps(data)
+        body = data.encode('utf-8')
+        headers['Content-Type'] = 'application/json'
+        headers['Content-Length'] = str(len(body))
 
-    # Execute loop using block executor for proper control flow
-    for item in iterable:
-        env[var_name] = item
-        execute_block(body, env)
+    target = parsed.path or '/'
+    if parsed.query:
+        target += '?' + parsed.query
 
-    return i + 1
+    try:
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        ssl_context = ssl.create_default_context() if parsed.scheme == 'https' else None
+        reader, writer = await within(asyncio.open_connection(parsed.hostname, port, ssl=ssl_context))
+        try:
+            request = f"{method} {target} HTTP/1.1\r\n"
+            request += ''.join(f"{name}: {value}\r\n" for name, value in headers.items())
+            writer.write(request.encode('latin-1') + b'\r\n' + body)
+            await within(writer.drain())
+
+            status_line = (await within(reader.readline())).decode('latin-1').strip()
+            parts = status_line.split(' ', 2)
+            status = int(parts[1])
+            reason = parts[2] if len(parts) > 2 else ''
+
+            response_headers = {}
+            while True:
+                header_line = (await within(reader.readline())).decode('latin-1')
+                if header_line in ['\r\n', '\n', '']:
+                    break
+                name, _, value = header_line.partition(':')
+                response_headers[name.strip().lower()] = value.strip()
+
+            if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+                chunks = []
+                while True:
+                    size = int((await within(reader.readline())).split(b';')[0].strip(), 16)
+                    if size == 0:
+                        break
+                    chunks.append(await within(reader.readexactly(size)))
+                    await within(reader.readline())
+                content = b''.join(chunks)
+            elif 'content-length' in response_headers:
+                content = await within(reader.readexactly(int(response_headers['content-length'])))
+            else:
+                content = await within(reader.read())
+        finally:
+            writer.close()
+    except LipiException:
+        raise
+    except asyncio.TimeoutError:
+        raise LipiException(f"{label} error: timed out after {timeout}s")
+    except Exception as e:
+        raise LipiException(f"{label} error: {e}")
+
+    if status in [301, 302, 303, 307, 308] and 'location' in response_headers and redirects > 0:
+        next_url = urllib.parse.urljoin(url, response_headers['location'])
+        if status in [301, 302, 303]:
+            method, data = 'GET', None
+        return await async_http_request(method, next_url, data, redirects - 1, timeout)
+    count_stat('http_requests')
+    count_stat('http_bytes', len(body) + len(content))
+    if status >= 400:
+        raise LipiException(f"{label} error: HTTP Error {status}: {reason}")
+
+    return content.decode('utf-8')
+
+
+@lipi_builtin('http_get_async', 'http_పొందు_అసమకాలిక')
+def builtin_http_get_async(args, env):
+    """http_get_async(url) - awaitable HTTP GET"""
+    if len(args) != 1:
+        raise LipiException("http_get_async requires 1 argument: url")
+    url = eval_lipi_expr(args[0], env)
+    return recordable_awaitable('http_get', {'url': url}, lambda: async_http_request('GET', url))
+
+
+@lipi_builtin('http_post_async', 'http_పంపు_అసమకాలిక')
+def builtin_http_post_async(args, env):
+    """http_post_async(url, data) - awaitable HTTP POST"""
+    if len(args) != 2:
+        raise LipiException("http_post_async requires 2 arguments: url and data")
+    url = eval_lipi_expr(args[0], env)
+    data = eval_lipi_expr(args[1], env)
+    return recordable_awaitable('http_post', {'url': url, 'data': data},
+                                lambda: async_http_request('POST', url, data))
+
+
+@lipi_builtin('file_read_async', 'ఫైల్_చదువు_అసమకాలిక')
+def builtin_file_read_async(args, env):
+    """file_read_async(path) - awaitable file read (runs in the loop's executor)"""
+    if len(args) != 1:
+        raise LipiException("file_read_async requires 1 argument: path")
+    return run_in_thread(read_text_file, eval_lipi_expr(args[0], env))
+
+
+def db_query_async_builtin(name, query_func, min_args, max_args):
+    """Build an awaitable variant of a database query built-in"""
+    def handler(args, env):
+        if not min_args <= len(args) <= max_args:
+            raise LipiException(f"{name} requires {min_args} to {max_args} arguments: (conn_id, sql, [params])")
+        values = [eval_lipi_expr(arg, env) for arg in args]
+        if len(values) == 3 and not isinstance(values[2], (list, tuple)):
+            values[2] = [values[2]]
+        return run_in_thread(query_func, *values)
+    return handler
+
+
+lipi_builtin('db_query_async', 'డేటాబేస్_ప్రశ్న_అసమకాలిక')(
+    db_query_async_builtin('db_query_async', execute_db_query, 2, 2))
+lipi_builtin('mysql_query_async', 'mysql_ప్రశ్న_అసమకాలిక')(
+    db_query_async_builtin('mysql_query_async', execute_mysql_query, 2, 3))
+lipi_builtin('postgres_query_async', 'postgres_ప్రశ్న_అసమకాలిక')(
+    db_query_async_builtin('postgres_query_async', execute_postgres_query, 2, 3))
 
 
 # ---------------------------
@@ -1665,8 +4435,14 @@ def run_lipi_if_block(lines, start_index, env):
             nesting_level += 1
         elif (stripped.startswith("పునరావృతం ") or stripped.startswith("for ")) and stripped.endswith(":"):
             nesting_level += 1
+        elif (stripped.startswith("సమాంతర ") or stripped.startswith("parallel ")) and stripped.endswith(":"):
+            nesting_level += 1
         elif (stripped.startswith("పనిచేయి ") or stripped.startswith("function ")) and stripped.endswith(":"):
             nesting_level += 1
+        elif (stripped.startswith("అసమకాలిక ") or stripped.startswith("async ")) and stripped.endswith(":"):
+            nesting_level += 1
+        elif (stripped.startswith("స్మృతి ") or stripped.startswith("cached ")) and stripped.endswith(":"):
+            nesting_level += 1
 
         # ELSE branch (only at our level)
         if nesting_level == 0 and (stripped == "లేకపోతే:" or stripped == "else:"):
@@ -1722,6 +4498,8 @@ def run_lipi_while_block(lines, start_index, env):
             nesting_level += 1
         elif (stripped.startswith("పునరావృతం ") or stripped.startswith("for ")) and stripped.endswith(":"):
             nesting_level += 1
+        elif (stripped.startswith("సమాంతర ") or stripped.startswith("parallel ")) and stripped.endswith(":"):
+            nesting_level += 1
 
         # END of block (only at our level)
         if nesting_level == 0 and (stripped == "ముగింపు" or stripped == "end"):
@@ -1747,6 +4525,7 @@ def run_lipi_while_block(lines, start_index, env):
 
 def execute_block(lines, env):
     """Execute a block of code with support for nested structures"""
+    rt = get_runtime()
     i = 0
     while i < len(lines):
         line = lines[i].strip()
@@ -1756,63 +4535,793 @@ def execute_block(lines, env):
             i += 1
             continue
 
-        # Function definition
-        if (line.startswith("పనిచేయి ") or line.startswith("function ")) and line.endswith(":"):
-            i = parse_function_definition(lines, i, env)
-            continue
+        if rt.stats is not None:
+            rt.stats.statements += 1
+        if rt.sampler is not None:
+            rt.sampler.set_line(line)
+        if rt.tracer is not None or rt.profiler is not None:
+            i = run_instrumented_statement(rt, line, lines, i, env)
+        else:
+            i = execute_statement(line, lines, i, env)
 
-        # Class definition (v3.0)
-        if (line.startswith("క్లాస్ ") or line.startswith("class ")) and line.endswith(":"):
-            i = parse_class_definition(lines, i, env)
-            continue
 
-        # IF block
-        if (line.startswith("యెడల ") or line.startswith("if ")) and line.endswith(":"):
-            i = run_lipi_if_block(lines, i, env)
-            continue
+def run_instrumented_statement(rt, line, lines, i, env):
+    """execute_statement with trace events and profiler timing"""
+    tracer = rt.tracer
+    if tracer is not None:
+        tracer('line', line, env)
+    try:
+        if rt.profiler is not None:
+            return rt.profiler.time_line(line, execute_statement, line, lines, i, env)
+        return execute_statement(line, lines, i, env)
+    except LipiReturnValue:
+        raise
+    except Exception as e:
+        # Report where the error was raised, not every block it unwinds through
+        if tracer is not None and not getattr(e, 'lipi_traced', False):
+            e.lipi_traced = True
+            tracer('exception', line, e)
+        raise
 
-        # WHILE block
-        if (line.startswith("వరకు ") or line.startswith("while ")) and line.endswith(":"):
-            i = run_lipi_while_block(lines, i, env)
-            continue
 
-        # FOR loop
-        if (line.startswith("పునరావృతం ") or line.startswith("for ")) and ' in ' in line and line.endswith(":"):
-            i = run_lipi_for_loop(lines, i, env)
-            continue
+def execute_statement(line, lines, i, env):
+    """Execute the statement (or block) starting at lines[i]. Returns the next index."""
+    # Function definition
+    if (line.startswith("పనిచేయి ") or line.startswith("function ")) and line.endswith(":"):
+        return parse_function_definition(lines, i, env)
 
-        # Try-catch
-        if line == "ప్రయత్నించు:" or line == "try:":
-            i = run_lipi_try_catch(lines, i, env)
-            continue
+    # Async or cached function definition
+    if any(line.startswith(prefix) for prefix in FUNCTION_MODIFIERS) and line.endswith(":"):
+        return parse_function_definition(lines, i, env)
 
-        # Single line
-        run_lipi_line(line, env)
-        i += 1
+    # Class definition (v3.0)
+    if (line.startswith("క్లాస్ ") or line.startswith("class ")) and line.endswith(":"):
+        return parse_class_definition(lines, i, env)
+
+    # IF block
+    if (line.startswith("యెడల ") or line.startswith("if ")) and line.endswith(":"):
+        return run_lipi_if_block(lines, i, env)
+
+    # WHILE block
+    if (line.startswith("వరకు ") or line.startswith("while ")) and line.endswith(":"):
+        return run_lipi_while_block(lines, i, env)
+
+    # Parallel FOR loop
+    if (line.startswith("సమాంతర ") or line.startswith("parallel ")) and ' in ' in line and line.endswith(":"):
+        return run_lipi_parallel_for(lines, i, env)
+
+    # FOR loop
+    if (line.startswith("పునరావృతం ") or line.startswith("for ")) and ' in ' in line and line.endswith(":"):
+        return run_lipi_for_loop(lines, i, env)
+
+    # Try-catch
+    if line == "ప్రయత్నించు:" or line == "try:":
+        return run_lipi_try_catch(lines, i, env)
+
+    # Single line
+    run_lipi_line(line, env)
+    return i + 1
 
 
 # ---------------------------
 # File Runner
 # ---------------------------
-def run_lipi_file(path):
-    """Run a Lipi source file"""
+def run_lipi_file(path, rt=None):
+    """Run a Lipi source file, in rt if given, else in the current runtime"""
     env = {}
-
-    # v3.0: Set current module path for imports
-    runtime.current_module_path = os.path.abspath(path)
+    rt = rt or get_runtime()
 
     with open(path, "r", encoding="utf-8") as f:
         lines = [ln.rstrip("\n") for ln in f]
 
     try:
-        execute_block(lines, env)
+        rt.run_source(lines, env, path=path)
     except Exception as e:
-        print(get_error_message('runtime_error', str(e)))
+        with use_runtime(rt):
+            print(get_error_message('runtime_error', str(e)))
         import traceback
         traceback.print_exc()
+
+
+# ---------------------------
+# Profiler (lipi --profile)
+# ---------------------------
+PROFILE_REPORT_HEADERS = {
+    'en': {
+        'lines': 'Line profile (sorted by total time)',
+        'functions': 'Function profile (sorted by total time)',
+        'hits': 'Hits', 'calls': 'Calls', 'total': 'Total ms', 'each': 'Per hit ms', 'each_call': 'Per call ms',
+        'location': 'Location', 'source': 'Source', 'function': 'Function',
+    },
+    'te': {
+        'lines': 'లైన్ ప్రొఫైల్ (మొత్తం సమయం ప్రకారం)',
+        'functions': 'ఫంక్షన్ ప్రొఫైల్ (మొత్తం సమయం ప్రకారం)',
+        'hits': 'సార్లు', 'calls': 'కాల్స్', 'total': 'మొత్తం ms', 'each': 'ఒక్కోసారి ms',
+        'each_call': 'ఒక్కో కాల్ ms',
+        'location': 'స్థానం', 'source': 'మూలం', 'function': 'ఫంక్షన్',
+    },
+}
+PROFILE_REPORT_ROWS = 25
+
+
+class LipiProfiler:
+    """
+    Exact per-line and per-function timing. Times are cumulative (a block or
+    call line includes everything it runs); recursive entries are counted once
+    per outermost activation so totals never exceed wall time.
+    """
+    def __init__(self):
+        self.lines = {}  # (filename, lineno, source) -> [hits, seconds]
+        self.functions = {}  # name -> [calls, seconds]
+        self.lock = threading.Lock()
+        self.local = threading.local()  # Active (recursion) counts per thread
+
+    def _timed(self, table, key, func, args):
+        active = self.local.__dict__.setdefault('active', {})
+        active[key] = active.get(key, 0) + 1
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            depth = active[key] - 1
+            if depth:
+                active[key] = depth
+            else:
+                del active[key]
+            with self.lock:
+                entry = table.get(key)
+                if entry is None:
+                    entry = table[key] = [0, 0.0]
+                entry[0] += 1
+                if not depth:
+                    entry[1] += elapsed
+
+    def time_line(self, line, func, *args):
+        key = (getattr(line, 'filename', None), getattr(line, 'lineno', None), str(line))
+        return self._timed(self.lines, ('line',) + key, func, args)
+
+    def time_call(self, name, func, *args):
+        return self._timed(self.functions, ('call', name), func, args)
+
+    def to_dict(self):
+        """Machine-readable profile, sorted by total time"""
+        with self.lock:
+            lines = [{'file': key[1], 'line': key[2], 'source': key[3], 'hits': hits, 'seconds': seconds}
+                     for key, (hits, seconds) in self.lines.items()]
+            functions = [{'name': key[1], 'calls': calls, 'seconds': seconds}
+                         for key, (calls, seconds) in self.functions.items()]
+        lines.sort(key=lambda entry: entry['seconds'], reverse=True)
+        functions.sort(key=lambda entry: entry['seconds'], reverse=True)
+        return {'lines': lines, 'functions': functions}
+
+    def report(self, lang='en', rows=PROFILE_REPORT_ROWS):
+        """Human-readable report with English or Telugu headers"""
+        headers = PROFILE_REPORT_HEADERS.get(lang, PROFILE_REPORT_HEADERS['en'])
+        data = self.to_dict()
+        out = [headers['lines'],
+               f"{headers['hits']:>8} {headers['total']:>10} {headers['each']:>11}  "
+               f"{headers['location']:<28} {headers['source']}"]
+        for entry in data['lines'][:rows]:
+            location = f"{os.path.basename(entry['file'] or '?')}:{entry['line'] or '?'}"
+            out.append(f"{entry['hits']:>8} {entry['seconds'] * 1000:>10.3f} "
+                       f"{entry['seconds'] * 1000 / entry['hits']:>11.4f}  {location:<28} {entry['source']}")
+        out.append('')
+        out.append(headers['functions'])
+        out.append(f"{headers['calls']:>8} {headers['total']:>10} {headers['each_call']:>11}  {headers['function']}")
+        for entry in data['functions'][:rows]:
+            out.append(f"{entry['calls']:>8} {entry['seconds'] * 1000:>10.3f} "
+                       f"{entry['seconds'] * 1000 / entry['calls']:>11.4f}  {entry['name']}")
+        return '\n'.join(out)
+
+
+def profile_lipi_file(path, output_path=None, lang=None, rt=None):
+    """Run a file under LipiProfiler, print the report to stderr and dump JSON"""
+    rt = rt or get_runtime()
+    profiler = LipiProfiler()
+    rt.profiler = profiler
+    try:
+        run_lipi_file(path, rt)
+    finally:
+        rt.profiler = None
+    print(profiler.report(lang or rt.error_language or ERROR_LANGUAGE[0]), file=sys.stderr)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(profiler.to_dict(), f, ensure_ascii=False, indent=2)
+    return profiler
+
+
+# ---------------------------
+# Memory Profiler (lipi --memprofile)
+# ---------------------------
+MEMORY_REPORT_HEADERS = {
+    'en': {
+        'lines': 'Lipi lines by retained memory (self)',
+        'functions': 'Functions by retained memory (including callees)',
+        'growth': 'Python allocation growth',
+        'hits': 'Hits', 'calls': 'Calls', 'kib': 'KiB', 'count': 'Blocks',
+        'location': 'Location', 'source': 'Source', 'function': 'Function', 'site': 'Interpreter site',
+    },
+    'te': {
+        'lines': 'నిలిచిన మెమరీ ప్రకారం Lipi లైన్లు (స్వంతం)',
+        'functions': 'నిలిచిన మెమరీ ప్రకారం ఫంక్షన్లు (పిలిచినవి సహా)',
+        'growth': 'Python కేటాయింపుల పెరుగుదల',
+        'hits': 'సార్లు', 'calls': 'కాల్స్', 'kib': 'KiB', 'count': 'బ్లాక్‌లు',
+        'location': 'స్థానం', 'source': 'మూలం', 'function': 'ఫంక్షన్', 'site': 'ఇంటర్‌ప్రెటర్ స్థానం',
+    },
+}
+MEMORY_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+
+class LipiMemoryProfiler:
+    """
+    Attributes tracemalloc's traced-memory deltas to Lipi source lines and
+    functions. Installed as runtime.profiler, so it uses the same hooks as
+    LipiProfiler. Line figures are self (children excluded): memory a line
+    left allocated when it finished. Labelled tracemalloc snapshots (start,
+    memory_snapshot(label) calls, end) show which interpreter sites grew in
+    between, e.g. closure env copies versus result lists. Measurements are
+    process-wide, so concurrent parallel-for iterations blur attribution.
+    """
+    def __init__(self):
+        self.lines = {}  # (filename, lineno, source) -> [hits, bytes]
+        self.functions = {}  # name -> [calls, bytes]
+        self.snapshots = []  # [(label, tracemalloc.Snapshot)]
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        self.snapshot('start')
+
+    def stop(self):
+        self.snapshot('end')
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def snapshot(self, label):
+        """Record a labelled snapshot; returns the currently traced bytes"""
+        before = tracemalloc.get_traced_memory()[0]
+        snap = tracemalloc.take_snapshot().filter_traces(MEMORY_SNAPSHOT_FILTERS)
+        with self.lock:
+            self.snapshots.append((str(label), snap))
+        after = tracemalloc.get_traced_memory()[0]
+        # Keep the snapshot's own footprint out of the calling line's figure
+        stack = getattr(self.local, 'stack', None)
+        if stack:
+            stack[-1] += after - before
+        return before
+
+    def time_line(self, line, func, *args):
+        stack = self.local.__dict__.setdefault('stack', [])
+        before = tracemalloc.get_traced_memory()[0]
+        stack.append(0)
+        try:
+            return func(*args)
+        finally:
+            delta = tracemalloc.get_traced_memory()[0] - before
+            children = stack.pop()
+            if stack:
+                stack[-1] += delta
+            key = (getattr(line, 'filename', None), getattr(line, 'lineno', None), str(line))
+            self._add(self.lines, key, delta - children)
+
+    def time_call(self, name, func, *args):
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            return func(*args)
+        finally:
+            self._add(self.functions, name, tracemalloc.get_traced_memory()[0] - before)
+
+    def _add(self, table, key, amount):
+        with self.lock:
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = [0, 0]
+            entry[0] += 1
+            entry[1] += amount
+
+    def growth(self, limit=10):
+        """Top interpreter allocation sites that grew between consecutive snapshots"""
+        with self.lock:
+            snapshots = list(self.snapshots)
+        result = []
+        for (old_label, old), (new_label, new) in zip(snapshots, snapshots[1:]):
+            stats = [stat for stat in new.compare_to(old, 'lineno') if stat.size_diff > 0][:limit]
+            result.append({
+                'from': old_label,
+                'to': new_label,
+                'sites': [{'file': stat.traceback[0].filename, 'line': stat.traceback[0].lineno,
+                           'bytes': stat.size_diff, 'blocks': stat.count_diff} for stat in stats],
+            })
+        return result
+
+    def to_dict(self):
+        with self.lock:
+            lines = [{'file': key[0], 'line': key[1], 'source': key[2], 'hits': hits, 'bytes': size}
+                     for key, (hits, size) in self.lines.items()]
+            functions = [{'name': name, 'calls': calls, 'bytes': size}
+                         for name, (calls, size) in self.functions.items()]
+        lines.sort(key=lambda entry: entry['bytes'], reverse=True)
+        functions.sort(key=lambda entry: entry['bytes'], reverse=True)
+        return {'lines': lines, 'functions': functions, 'growth': self.growth()}
+
+    def report(self, lang='en', rows=PROFILE_REPORT_ROWS):
+        headers = MEMORY_REPORT_HEADERS.get(lang, MEMORY_REPORT_HEADERS['en'])
+        data = self.to_dict()
+        out = [headers['lines'],
+               f"{headers['hits']:>8} {headers['kib']:>10}  {headers['location']:<28} {headers['source']}"]
+        for entry in data['lines'][:rows]:
+            location = f"{os.path.basename(entry['file'] or '?')}:{entry['line'] or '?'}"
+            out.append(f"{entry['hits']:>8} {entry['bytes'] / 1024:>10.1f}  {location:<28} {entry['source']}")
+        out.append('')
+        out.append(headers['functions'])
+        out.append(f"{headers['calls']:>8} {headers['kib']:>10}  {headers['function']}")
+        for entry in data['functions'][:rows]:
+            out.append(f"{entry['calls']:>8} {entry['bytes'] / 1024:>10.1f}  {entry['name']}")
+        for step in data['growth']:
+            out.append('')
+            out.append(f"{headers['growth']}: {step['from']} -> {step['to']}")
+            out.append(f"{headers['kib']:>10} {headers['count']:>8}  {headers['site']}")
+            for site in step['sites']:
+                out.append(f"{site['bytes'] / 1024:>10.1f} {site['blocks']:>8}  "
+                           f"{os.path.basename(site['file'])}:{site['line']}")
+        return '\n'.join(out)
+
+
+@lipi_builtin('memory_snapshot', 'మెమరీ_చిత్రం')
+def builtin_memory_snapshot(args, env):
+    """memory_snapshot(label) - mark a --memprofile snapshot; returns traced bytes, or null when off"""
+    if len(args) != 1:
+        raise LipiException("memory_snapshot requires 1 argument: label")
+    label = eval_lipi_expr(args[0], env)
+    profiler = runtime.profiler
+    if isinstance(profiler, LipiMemoryProfiler):
+        return profiler.snapshot(label)
+    return None
+
+
+def memprofile_lipi_file(path, output_path=None, lang=None, rt=None):
+    """Run a file under LipiMemoryProfiler, print the report to stderr and dump JSON"""
+    rt = rt or get_runtime()
+    profiler = LipiMemoryProfiler()
+    rt.profiler = profiler
+    profiler.start()
+    try:
+        run_lipi_file(path, rt)
+    finally:
+        profiler.stop()
+        rt.profiler = None
+    print(profiler.report(lang or rt.error_language or ERROR_LANGUAGE[0]), file=sys.stderr)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(profiler.to_dict(), f, ensure_ascii=False, indent=2)
+    return profiler
+
+
+# ---------------------------
+# Sampling Profiler (lipi --sample)
+# ---------------------------
+DEFAULT_SAMPLE_RATE = 200  # Samples per second
+
+
+class LipiSampler:
+    """
+    Low-overhead sampling profiler. Each thread keeps a Lipi call stack of
+    [name, line] frames (script, module, function and Class.method names);
+    a timer thread snapshots every stack at the sampling rate. Results are
+    folded stacks ("a:1;b:5;c:9 42") for flame graph tools.
+    """
+    def __init__(self, rate=DEFAULT_SAMPLE_RATE):
+        if rate <= 0:
+            raise LipiException(f"Sampling rate must be positive, got {rate}")
+        self.interval = 1.0 / rate
+        self.samples = {}  # folded stack -> count
+        self.stacks = {}  # thread ident -> that thread's stack
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def push(self, name):
+        local = self.local.__dict__
+        stack = local.get('stack')
+        if stack is None:
+            stack = local['stack'] = []
+            with self.lock:
+                self.stacks[threading.get_ident()] = stack
+        stack.append([name, None])
+
+    def pop(self):
+        stack = self.local.stack
+        stack.pop()
+        if not stack:
+            # Unregister so finished worker threads do not pile up in stacks
+            del self.local.stack
+            with self.lock:
+                self.stacks.pop(threading.get_ident(), None)
+
+    def set_line(self, line):
+        stack = self.local.__dict__.get('stack')
+        if stack:
+            stack[-1][1] = getattr(line, 'lineno', None)
+
+    def take_sample(self):
+        with self.lock:
+            stacks = list(self.stacks.values())
+        for stack in stacks:
+            frames = list(stack)  # Owner thread may be mutating it
+            if not frames:
+                continue  # Idle thread
+            folded = ';'.join(f"{name}:{lineno}" if lineno is not None else name
+                              for name, lineno in frames)
+            self.samples[folded] = self.samples.get(folded, 0) + 1
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.take_sample()
+
+    def start(self):
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name='lipi-sampler', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def folded(self):
+        """Brendan Gregg folded-stack text, heaviest stacks first"""
+        ordered = sorted(self.samples.items(), key=lambda item: item[1], reverse=True)
+        return ''.join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+def sample_lipi_file(path, output_path, rate=DEFAULT_SAMPLE_RATE, rt=None):
+    """Run a file under LipiSampler and write folded stacks to output_path"""
+    rt = rt or get_runtime()
+    sampler = LipiSampler(rate)
+    rt.sampler = sampler
+    sampler.push(os.path.basename(path))
+    sampler.start()
+    try:
+        run_lipi_file(path, rt)
+    finally:
+        sampler.stop()
+        sampler.pop()
+        rt.sampler = None
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(sampler.folded())
+    total = sum(sampler.samples.values())
+    print(f"{total} samples written to {output_path}", file=sys.stderr)
+    return sampler
+
+
+# ---------------------------
+# Embedding API: compile_program / run / call
+# ---------------------------
+class LipiProgram:
+    """
+    Compiled Lipi program returned by compile_program(). Holds the normalized source
+    lines (stripped, without blank lines and comments) and is immutable, so one
+    program can be run any number of times, from any thread or runtime.
+    """
+    __slots__ = ('filename', 'lines', '__weakref__')
+
+    def __init__(self, filename, lines):
+        object.__setattr__(self, 'filename', filename)
+        object.__setattr__(self, 'lines', tuple(lines))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LipiProgram is immutable")
+
+    def __repr__(self):
+        return f"<LipiProgram {self.filename} ({len(self.lines)} lines)>"
+
+
+def compile_program(source, filename='<lipi>'):
+    """
+    Compile Lipi source text into a reusable LipiProgram.
+    filename is used to resolve relative module imports when it names a file.
+    """
+    if not isinstance(source, str):
+        raise LipiException(get_error_message('type_error', "compile_program() expects source text"))
+    lines = []
+    for lineno, line in enumerate(source.split('\n'), 1):
+        stripped = line.strip()
+        if stripped and not stripped.startswith('#'):
+            lines.append(SourceLine(stripped, filename, lineno))
+    return LipiProgram(filename, lines)
+
+
+def program_path(program):
+    """File path for module resolution, or None for '<string>'-style names"""
+    if program.filename.startswith('<'):
+        return None
+    return program.filename
+
+
+def run(program, env=None, runtime=None):
+    """Execute a compiled program in runtime (default: the current one). Returns the env."""
+    rt = runtime or get_runtime()
+    return rt.run_source(program.lines, env, path=program_path(program))
+
+
+def call(program, func_name, *args, runtime=None):
+    """
+    Call a function defined by a compiled program with Python values.
+    The program's top level runs once per runtime; later calls reuse its
+    definitions and globals, so each call only pays for the function itself.
+    Each program keeps its own function table, so programs sharing a runtime
+    can define functions with the same name. Async functions are awaited
+    before returning.
+    """
+    rt = runtime or get_runtime()
+    prev_functions = rt.functions
+    try:
+        state = rt.program_envs.get(program)
+        if state is None:
+            rt.functions = dict(prev_functions)
+            state = (run(program, runtime=rt), rt.functions)
+            rt.program_envs[program] = state
+        program_env, rt.functions = state
+
+        with use_runtime(rt):
+            prev_module_path = rt.current_module_path
+            path = program_path(program)
+            if path:
+                rt.current_module_path = os.path.abspath(path)
+            try:
+                return rt.run_async(call_lipi_function(func_name, list(args), program_env))
+            finally:
+                rt.current_module_path = prev_module_path
     finally:
-        # Reset module path
-        runtime.current_module_path = None
+        rt.functions = prev_functions
+
+
+# ---------------------------
+# Batch Map (lipi map)
+# ---------------------------
+MAP_WORKER_STATE = {}  # Compiled program and entry name, per worker process
+
+
+def init_map_worker(source, filename, entry, lang):
+    """Pool initializer: compile the script once per worker process"""
+    ERROR_LANGUAGE[0] = lang
+    MAP_WORKER_STATE['program'] = compile_program(source, filename)
+    MAP_WORKER_STATE['entry'] = entry
+    MAP_WORKER_STATE['runtime'] = LipiRuntime()
+
+
+def run_map_record(numbered_line):
+    """Apply the entry function to one JSONL record. Returns (ok, line_number, json_text)."""
+    line_number, line = numbered_line
+    try:
+        record = json.loads(line)
+        result = call(MAP_WORKER_STATE['program'], MAP_WORKER_STATE['entry'], record,
+                      runtime=MAP_WORKER_STATE['runtime'])
+        return True, line_number, json.dumps(result, ensure_ascii=False, default=str)
+    except Exception as e:
+        error = {'error': str(e) or type(e).__name__, 'line': line_number}
+        return False, line_number, json.dumps(error, ensure_ascii=False)
+
+
+def format_map_result(ok, line_number, text, ordered):
+    """Output line for one record; unordered results carry their input line number"""
+    if ordered or not ok:
+        return text + '\n'
+    return f'{{"line": {line_number}, "result": {text}}}\n'
+
+
+def read_numbered_records(f):
+    """Yield (line_number, line) for the non-blank lines of a JSONL stream"""
+    for line_number, line in enumerate(f, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def map_records(script_path, input_path, output, workers=None, entry='main',
+                ordered=True, chunksize=64):
+    """
+    Run script_path's entry function over every record of a JSONL file and
+    write one JSON result per line to output (a text stream). Each record is
+    passed as the entry function's argument rather than bound as a global, so
+    the top level runs once per worker and records cannot leak. Records are
+    dispatched to a process pool in chunks; with ordered=False results are
+    written as they complete, as {"line", "result"}. A failing record writes
+    {"error", "line"} instead of a result. Returns (records, errors).
+    """
+    source = read_text_file(script_path)
+    workers = workers or os.cpu_count() or 1
+    initargs = (source, os.path.abspath(script_path), entry, ERROR_LANGUAGE[0])
+    records = errors = 0
+
+    try:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            numbered = read_numbered_records(f)
+            if workers == 1:
+                # Run in-process: simplest to debug, no pickling
+                saved_state = dict(MAP_WORKER_STATE)
+                init_map_worker(*initargs)
+                try:
+                    for ok, line_number, text in map(run_map_record, numbered):
+                        records += 1
+                        errors += not ok
+                        output.write(format_map_result(ok, line_number, text, ordered))
+                finally:
+                    MAP_WORKER_STATE['runtime'].close()
+                    MAP_WORKER_STATE.clear()
+                    MAP_WORKER_STATE.update(saved_state)
+            else:
+                with multiprocessing.Pool(workers, initializer=init_map_worker, initargs=initargs) as pool:
+                    imap = pool.imap if ordered else pool.imap_unordered
+                    for ok, line_number, text in imap(run_map_record, numbered, chunksize=max(1, chunksize)):
+                        records += 1
+                        errors += not ok
+                        output.write(format_map_result(ok, line_number, text, ordered))
+    except OSError as e:
+        raise LipiException(get_error_message('file_error', str(e)))
+
+    output.flush()
+    return records, errors
+
+
+# ---------------------------
+# Benchmarks (lipi bench)
+# ---------------------------
+# Each benchmark is benchmarks/<lang>/<name>.lipi.py; lib/ folders hold the
+# modules they import. Every benchmark runs in its own subprocess so peak RSS
+# is per benchmark and one program's garbage cannot slow the next.
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+DEFAULT_BENCH_REPEAT = 5
+DEFAULT_BENCH_THRESHOLD = 0.10
+BENCH_REPORT_HEADERS = {
+    'en': {
+        'name': 'Benchmark', 'median': 'Median ms', 'p95': 'p95 ms', 'ops': 'Runs/s', 'rss': 'Peak MiB',
+        'change': 'vs baseline', 'regressed': 'REGRESSED', 'failed': 'FAILED',
+    },
+    'te': {
+        'name': 'బెంచ్‌మార్క్', 'median': 'మధ్యస్థ ms', 'p95': 'p95 ms', 'ops': 'రన్లు/సె', 'rss': 'గరిష్ఠ MiB',
+        'change': 'ఆధారంతో పోలిక', 'regressed': 'నెమ్మదించింది', 'failed': 'విఫలం',
+    },
+}
+
+
+def discover_benchmarks(bench_dir=None, pattern=None):
+    """Return {name: path} for bench_dir/<lang>/*.lipi.py, filtered by a name substring"""
+    bench_dir = bench_dir or BENCHMARK_DIR
+    found = {}
+    for lang in sorted(os.listdir(bench_dir)):
+        lang_dir = os.path.join(bench_dir, lang)
+        if not os.path.isdir(lang_dir):
+            continue
+        for filename in sorted(os.listdir(lang_dir)):
+            if filename.endswith('.lipi.py'):
+                name = f"{lang}/{filename[:-len('.lipi.py')]}"
+                if not pattern or pattern in name:
+                    found[name] = os.path.join(lang_dir, filename)
+    return found
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * fraction // 1))
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mib():
+    """Peak resident set size of this process in MiB, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def bench_worker(path, repeat=DEFAULT_BENCH_REPEAT, warmup=1):
+    """
+    Run one benchmark warmup + repeat times in this process, each time in a
+    fresh runtime with a cold module cache and stdout discarded. Runs happen
+    inside a temporary working directory so programs can write scratch files.
+    """
+    path = os.path.abspath(path)
+    lines = tag_lines(read_text_file(path).splitlines(), path)
+    times = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir, open(os.devnull, 'w') as sink:
+        os.chdir(work_dir)
+        try:
+            for iteration in range(warmup + repeat):
+                rt = LipiRuntime(module_cache=ModuleSourceCache())
+                start = time.perf_counter()
+                try:
+                    with redirect_stdout(sink):
+                        rt.run_source(lines, {}, path=path)
+                finally:
+                    rt.close()
+                if iteration >= warmup:
+                    times.append(time.perf_counter() - start)
+        finally:
+            os.chdir(cwd)
+    return {'times': times, 'peak_rss_mib': peak_rss_mib()}
+
+
+def summarize_timings(times, peak_rss):
+    median = percentile(times, 0.5)
+    return {
+        'median_ms': round(median * 1000, 3),
+        'p95_ms': round(percentile(times, 0.95) * 1000, 3),
+        'ops_per_sec': round(1 / median, 3) if median else None,
+        'peak_rss_mib': round(peak_rss, 1) if peak_rss is not None else None,
+        'runs': len(times),
+    }
+
+
+def run_benchmark_subprocess(path, repeat, warmup):
+    """Run bench_worker in a fresh interpreter. Returns (summary, error)."""
+    command = [sys.executable, os.path.abspath(__file__), 'bench', '--worker', path,
+               '--repeat', str(repeat), '--warmup', str(warmup)]
+    proc = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+    if proc.returncode != 0:
+        return None, (proc.stderr.strip().splitlines() or ['exit code ' + str(proc.returncode)])[-1]
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return summarize_timings(result['times'], result['peak_rss_mib']), None
+
+
+def run_benchmarks(bench_dir=None, pattern=None, repeat=DEFAULT_BENCH_REPEAT, warmup=1,
+                   baseline=None, threshold=DEFAULT_BENCH_THRESHOLD, lang='en', out=None):
+    """
+    Run the benchmark suite and print a table. baseline is a dict loaded
+    from a baseline JSON file; a benchmark whose median exceeds its baseline
+    median by more than threshold (a fraction) counts as a regression.
+    Returns (results, regressions) where results is the baseline-format dict.
+    """
+    out = out or sys.stdout
+    headers = BENCH_REPORT_HEADERS.get(lang, BENCH_REPORT_HEADERS['en'])
+    previous = (baseline or {}).get('benchmarks', {})
+    results = {
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'repeat': repeat,
+        'benchmarks': {},
+    }
+    regressions = []
+    out.write(f"{headers['name']:<18} {headers['median']:>10} {headers['p95']:>10} {headers['ops']:>10} "
+              f"{headers['rss']:>9}  {headers['change']}\n")
+    for name, path in discover_benchmarks(bench_dir, pattern).items():
+        summary, error = run_benchmark_subprocess(path, repeat, warmup)
+        if error:
+            regressions.append(name)
+            out.write(f"{name:<18} {headers['failed']}: {error}\n")
+            out.flush()
+            continue
+        results['benchmarks'][name] = summary
+        change = ''
+        base = previous.get(name)
+        if base and base.get('median_ms'):
+            ratio = summary['median_ms'] / base['median_ms'] - 1
+            change = f"{ratio * 100:+.1f}%"
+            if ratio > threshold:
+                regressions.append(name)
+                change += f" {headers['regressed']}"
+        rss = f"{summary['peak_rss_mib']:.1f}" if summary['peak_rss_mib'] is not None else '-'
+        out.write(f"{name:<18} {summary['median_ms']:>10.2f} {summary['p95_ms']:>10.2f} "
+                  f"{summary['ops_per_sec']:>10.1f} {rss:>9}  {change}\n")
+        out.flush()
+    return results, regressions
 
 
 # ---------------------------
@@ -1839,9 +5348,404 @@ def repl():
             print(get_error_message('runtime_error', str(e)))
 
 
-if __name__ == "__main__":
-    # Parse command-line arguments
+# ---------------------------
+# Warm Daemon (lipi serve / lipi run --daemon)
+# ---------------------------
+# Requests and replies are JSON objects, one per line, over a Unix socket:
+#   client -> {"path": ..., "source": ..., "env": {...}, "lang": "te"}
+#   daemon -> {"stream": "stdout", "data": ...}  (repeated, as output is produced)
+#   daemon -> {"done": true, "ok": true|false, "error": ..., "env": {...}}
+DAEMON_SOCKET_ENV = 'LIPI_SOCKET'
+_stdout_target = contextvars.ContextVar('lipi_stdout_target', default=None)
+
+
+def default_socket_path():
+    """Socket path from $LIPI_SOCKET, else a per-user path in the temp directory"""
+    return os.environ.get(DAEMON_SOCKET_ENV) or os.path.join(
+        tempfile.gettempdir(), f"lipi-{os.getuid()}.sock")
+
+
+class ContextStdout:
+    """sys.stdout replacement that routes writes to the current daemon job's stream"""
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def write(self, text):
+        target = _stdout_target.get()
+        if target is None:
+            return self.fallback.write(text)
+        return target.write(text)
+
+    def flush(self):
+        target = _stdout_target.get()
+        (self.fallback if target is None else target).flush()
+
+    def __getattr__(self, name):
+        return getattr(self.fallback, name)
+
+
+class DaemonJobStream:
+    """Line-buffered stdout for one job, forwarded to the client as stream messages"""
+    def __init__(self, send):
+        self.send = send
+        self.buffer = []
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        with self.lock:
+            self.buffer.append(text)
+            if '\n' in text:
+                self._flush_locked()
+        return len(text)
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self.buffer:
+            data = ''.join(self.buffer)
+            self.buffer = []
+            self.send({'stream': 'stdout', 'data': data})
+
+
+def jsonable_env(env):
+    """Top-level variables that can be sent back to the client as JSON"""
+    result = {}
+    for name, value in env.items():
+        if name.startswith('__'):
+            continue
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        result[name] = value
+    return result
+
+
+class LipiDaemon:
+    """
+    Pool of pre-warmed runtimes serving script requests over a Unix socket.
+    Whitelisted Python modules are imported once and --preload Lipi modules are
+    executed into a template runtime; each job gets a fresh clone of it, so jobs
+    never see each other's state. pool_size bounds concurrent jobs.
+    Anyone who can connect to the socket can run code as the daemon's user, so
+    the socket is private to that user; requests that send a path without
+    source may only read scripts under root (default: the working directory).
+    """
+    def __init__(self, socket_path=None, pool_size=4, preload=(), error_language=None, root=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.root = os.path.realpath(root or os.getcwd())
+        self.server = None
+        self.template = self.warm_template(preload, error_language)
+        self.pool = queue.Queue()
+        for _ in range(pool_size):
+            self.pool.put(self.clone_template())
+
+    def warm_template(self, preload, error_language):
+        template = LipiRuntime(error_language=error_language)
+        for module_name in template.whitelist_modules:
+            importlib.import_module(module_name)
+        with use_runtime(template):
+            for module_path in preload:
+                if not module_path.endswith('.lipi.py'):
+                    module_path += '.lipi.py'
+                load_lipi_module(os.path.abspath(module_path), template, {})
+        return template
+
+    def clone_template(self):
+        rt = LipiRuntime(module_cache=self.template.module_cache,
+                         error_language=self.template.error_language)
+        # Function definitions are copied so memoized results stay per job;
+        # a definition shared by functions and module exports is copied once
+        copies = {}
+
+        def fresh(func_def):
+            if id(func_def) not in copies:
+                copies[id(func_def)] = fresh_function_def(func_def)
+            return copies[id(func_def)]
+
+        rt.functions.update({name: fresh(func_def) for name, func_def in self.template.functions.items()})
+        rt.classes.update(self.template.classes)
+        for module_path, exports in self.template.loaded_modules.items():
+            rt.loaded_modules[module_path] = {
+                name: (fresh(value) if isinstance(value, dict) and 'body' in value else value)
+                for name, value in exports.items()
+            }
+        return rt
+
+    def bind(self):
+        """Create the listening socket (removes a stale socket file first)"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        daemon = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                daemon.handle_connection(self.request)
+
+        # Create the socket file as 0600 rather than tightening it after bind
+        old_umask = os.umask(0o177)
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        self.server.daemon_threads = True
+
+    def serve_forever(self):
+        if self.server is None:
+            self.bind()
+        original_stdout = sys.stdout
+        if not isinstance(sys.stdout, ContextStdout):
+            sys.stdout = ContextStdout(sys.stdout)
+        try:
+            self.server.serve_forever()
+        finally:
+            sys.stdout = original_stdout
+            self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self):
+        if self.server is not None:
+            self.server.shutdown()
+
+    def handle_connection(self, conn):
+        send_lock = threading.Lock()
+
+        def send(message):
+            data = (json.dumps(message, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+            with send_lock:
+                conn.sendall(data)
+
+        with conn.makefile('r', encoding='utf-8') as reader:
+            line = reader.readline()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            send({'done': True, 'ok': False, 'error': 'Invalid daemon request', 'env': {}})
+            return
+
+        rt = self.pool.get()
+        try:
+            send(self.run_job(rt, request, send))
+        finally:
+            rt.close()
+            self.pool.put(self.clone_template())
+
+    def run_job(self, rt, request, send):
+        """Run one request in rt with stdout streamed to the client. Returns the final message."""
+        if request.get('lang') in ('en', 'te'):
+            rt.error_language = request['lang']
+        env = dict(request.get('env') or {})
+        path = request.get('path')
+        stream = DaemonJobStream(send)
+        token = _stdout_target.set(stream)
+        try:
+            source = request.get('source')
+            if source is None:
+                path = self.script_path(path)
+                source = read_text_file(path)
+            rt.run_source(source, env, path=path)
+            ok, error = True, None
+        except Exception as e:
+            with use_runtime(rt):
+                ok, error = False, get_error_message('runtime_error', str(e))
+        finally:
+            stream.flush()
+            _stdout_target.reset(token)
+        return {'done': True, 'ok': ok, 'error': error, 'env': jsonable_env(env)}
+
+    def script_path(self, path):
+        """Resolve a requested script path, refusing files outside the daemon root"""
+        if not path:
+            raise LipiException(get_error_message('file_error', "request has neither source nor path"))
+        real_path = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([self.root, real_path]) != self.root:
+            raise LipiException(get_error_message('file_error', f"{path} is outside the daemon root {self.root}"))
+        return real_path
+
+
+def run_via_daemon(path, socket_path=None, env=None, lang=None, out=None):
+    """Send a script to a running daemon and echo its output. Returns the final message."""
+    out = out or sys.stdout
+    request = {'path': os.path.abspath(path), 'source': read_text_file(path), 'env': env or {}}
+    if lang:
+        request['lang'] = lang
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall((json.dumps(request, ensure_ascii=False) + '\n').encode('utf-8'))
+        with sock.makefile('r', encoding='utf-8') as reader:
+            for line in reader:
+                message = json.loads(line)
+                if message.get('done'):
+                    return message
+                out.write(message.get('data', ''))
+                out.flush()
+    raise LipiException(get_error_message('connection_error', 'daemon closed the connection'))
+
+
+# ---------------------------
+# Command Line
+# ---------------------------
+def add_profiling_arguments(parser):
+    # The profilers each run the script themselves, so only one can be chosen
+    profilers = parser.add_mutually_exclusive_group()
+    profilers.add_argument('--profile', action='store_true',
+                           help='Time every Lipi line and function; report to stderr')
+    parser.add_argument('--profile-output', default='lipi-profile.json',
+                        help='JSON file for --profile results. Default: lipi-profile.json')
+    profilers.add_argument('--sample', action='store_true',
+                           help='Sample Lipi call stacks; write folded stacks for flame graphs')
+    parser.add_argument('--sample-rate', type=float, default=DEFAULT_SAMPLE_RATE,
+                        help=f'Samples per second for --sample. Default: {DEFAULT_SAMPLE_RATE}')
+    parser.add_argument('--sample-output', default='lipi-samples.folded',
+                        help='Folded-stack file for --sample. Default: lipi-samples.folded')
+    profilers.add_argument('--memprofile', action='store_true',
+                           help='Attribute memory growth to Lipi lines with tracemalloc; report to stderr')
+    parser.add_argument('--memprofile-output', default='lipi-memprofile.json',
+                        help='JSON file for --memprofile results. Default: lipi-memprofile.json')
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument('--record', metavar='CASSETTE',
+                          help='Record http, database and file-read results to a JSON Lines cassette')
+    cassette.add_argument('--replay', metavar='CASSETTE',
+                          help='Serve http, database and file-read results from a recorded cassette')
+    parser.add_argument('--stats', action='store_true',
+                        help='Count interpreter and I/O work; report to stderr at exit')
+    parser.add_argument('--stats-output', help='Also write --stats counters to this JSON file')
+
+
+def run_with_profiling(args):
+    """Run args.file, under the profilers selected on the command line"""
+    rt = get_runtime()
+    if args.stats:
+        rt.stats = RuntimeStats()
+    if args.record or args.replay:
+        rt.cassette = LipiCassette(args.record or args.replay, 'record' if args.record else 'replay')
+    try:
+        if args.profile:
+            profile_lipi_file(args.file, args.profile_output, args.lang)
+        elif args.memprofile:
+            memprofile_lipi_file(args.file, args.memprofile_output, args.lang)
+        elif args.sample:
+            sample_lipi_file(args.file, args.sample_output, args.sample_rate)
+        else:
+            run_lipi_file(args.file)
+    finally:
+        if rt.cassette is not None:
+            rt.cassette.close()
+            rt.cassette = None
+        if args.stats:
+            stats, rt.stats = rt.stats, None
+            print(stats.report(args.lang), file=sys.stderr)
+            if args.stats_output:
+                with open(args.stats_output, 'w', encoding='utf-8') as f:
+                    json.dump(stats.as_dict(), f, indent=2)
+
+
+def main(argv=None):
+    """Command-line entry point: run a script, start the REPL, or use the daemon"""
     import argparse
+    argv = sys.argv[1:] if argv is None else argv
+    lang_help = 'Error message language: en (English) or te (Telugu). Default: en'
+
+    if argv and argv[0] == 'serve':
+        parser = argparse.ArgumentParser(prog='lipi serve',
+                                         description='Serve Lipi scripts from pre-warmed interpreters')
+        parser.add_argument('--socket', help=f'Unix socket path (default: ${DAEMON_SOCKET_ENV} or a temp path)')
+        parser.add_argument('--workers', type=int, default=4, help='Number of warm interpreters. Default: 4')
+        parser.add_argument('--preload', nargs='*', default=[], help='Lipi modules to load into every interpreter')
+        parser.add_argument('--root', help='Directory requests may read scripts from by path. Default: current directory')
+        parser.add_argument('--lang', choices=['en', 'te'], default='en', help=lang_help)
+        args = parser.parse_args(argv[1:])
+        ERROR_LANGUAGE[0] = args.lang
+        daemon = LipiDaemon(args.socket, max(1, args.workers), args.preload, root=args.root)
+        print(f"Lipi daemon listening on {daemon.socket_path}", file=sys.stderr)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if argv and argv[0] == 'map':
+        parser = argparse.ArgumentParser(prog='lipi map',
+                                         description='Run a Lipi script over every record of a JSONL file')
+        parser.add_argument('file', help='Lipi script defining the entry function')
+        parser.add_argument('--input', required=True, help='JSONL file with one input record per line')
+        parser.add_argument('--output', help='JSONL file for results (default: stdout)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes (default: CPU count)')
+        parser.add_argument('--entry', default='main', help='Function called with each record. Default: main')
+        parser.add_argument('--unordered', action='store_true', help='Write results in completion order')
+        parser.add_argument('--chunksize', type=int, default=64, help='Records sent to a worker at a time')
+        parser.add_argument('--lang', choices=['en', 'te'], default='en', help=lang_help)
+        args = parser.parse_args(argv[1:])
+        ERROR_LANGUAGE[0] = args.lang
+        try:
+            output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+            try:
+                records, errors = map_records(args.file, args.input, output, max(1, args.workers),
+                                              args.entry, not args.unordered, args.chunksize)
+            finally:
+                if args.output:
+                    output.close()
+        except (LipiException, OSError) as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"{records} records, {errors} errors", file=sys.stderr)
+        return 1 if errors else 0
+
+    if argv and argv[0] == 'bench':
+        parser = argparse.ArgumentParser(prog='lipi bench',
+                                         description='Run the interpreter benchmark suite')
+        parser.add_argument('--filter', help='Only run benchmarks whose name contains this text')
+        parser.add_argument('--repeat', type=int, default=DEFAULT_BENCH_REPEAT,
+                            help=f'Timed runs per benchmark. Default: {DEFAULT_BENCH_REPEAT}')
+        parser.add_argument('--warmup', type=int, default=1, help='Untimed runs first. Default: 1')
+        parser.add_argument('--dir', help='Benchmark directory (default: benchmarks/ next to src/)')
+        parser.add_argument('--baseline', help='Baseline JSON to compare against')
+        parser.add_argument('--threshold', type=float, default=DEFAULT_BENCH_THRESHOLD,
+                            help='Allowed median slowdown before failing, as a fraction. Default: 0.10')
+        parser.add_argument('--save', help='Write results as a baseline JSON file')
+        parser.add_argument('--lang', choices=['en', 'te'], default='en', help=lang_help)
+        parser.add_argument('--worker', help=argparse.SUPPRESS)
+        args = parser.parse_args(argv[1:])
+        if args.worker:
+            print(json.dumps(bench_worker(args.worker, max(1, args.repeat), max(0, args.warmup))))
+            return 0
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        results, regressions = run_benchmarks(args.dir, args.filter, max(1, args.repeat), max(0, args.warmup),
+                                              baseline, args.threshold, args.lang)
+        if args.save:
+            with open(args.save, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+        if regressions:
+            print(f"{len(regressions)} regressed or failed: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+        return 0
+
+    if argv and argv[0] == 'run':
+        parser = argparse.ArgumentParser(prog='lipi run', description='Run a Lipi script')
+        parser.add_argument('file', help='Lipi script file to run')
+        parser.add_argument('--daemon', action='store_true', help='Run on a `lipi serve` daemon')
+        parser.add_argument('--socket', help='Daemon socket path')
+        parser.add_argument('--lang', choices=['en', 'te'], default='en', help=lang_help)
+        add_profiling_arguments(parser)
+        args = parser.parse_args(argv[1:])
+        ERROR_LANGUAGE[0] = args.lang
+        if not args.daemon:
+            run_with_profiling(args)
+            return 0
+        result = run_via_daemon(args.file, args.socket, lang=args.lang)
+        if not result['ok']:
+            print(result['error'], file=sys.stderr)
+            return 1
+        return 0
+
+    # Parse command-line arguments
     parser = argparse.ArgumentParser(
         description='Lipi Language v3.0 - Bilingual (Telugu + English) Programming',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1851,19 +5755,29 @@ Examples:
   python lipi.py script.lipi.py --lang te # Run script with Telugu errors
   python lipi.py --lang te                # Start REPL with Telugu errors
   python lipi.py                          # Start REPL with English errors
+  python lipi.py serve --workers 8        # Start a warm daemon
+  python lipi.py run --daemon script.lipi.py  # Run a script on the daemon
+  python lipi.py map rules.lipi.py --input records.jsonl --workers 8
+  python lipi.py bench --save baseline.json      # Record a benchmark baseline
+  python lipi.py bench --baseline baseline.json  # Compare against it
         """
     )
     parser.add_argument('file', nargs='?', help='Lipi script file to run')
-    parser.add_argument('--lang', choices=['en', 'te'], default='en',
-                        help='Error message language: en (English) or te (Telugu). Default: en')
+    parser.add_argument('--lang', choices=['en', 'te'], default='en', help=lang_help)
+    add_profiling_arguments(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set error language preference
     ERROR_LANGUAGE[0] = args.lang
 
     # Run file or REPL
     if args.file:
-        run_lipi_file(args.file)
+        run_with_profiling(args)
     else:
         repl()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 numeric arrays
+Tests array() elementwise operators, masks, slicing, reductions and sorting
+on both the NumPy backend and the array-module fallback
+"""
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.lipi as lipi
+from src.lipi import execute_block, eval_lipi_expr, LipiException, LipiArray
+
+
+class ArrayBehaviour:
+    """Tests shared by both backends"""
+
+    def setUp(self):
+        self.env = {}
+        execute_block([
+            'a = array([1, 2, 3, 4, 5])',
+            'b = శ్రేణి([0.5, 1.5, 2.5, 3.5, 4.5])',
+        ], self.env)
+
+    def values(self, expr):
+        result = eval_lipi_expr(expr, self.env)
+        self.assertIsInstance(result, LipiArray)
+        return result.to_list()
+
+    def test_construction(self):
+        self.assertEqual(self.env['a'].kind, 'int')
+        self.assertEqual(self.env['b'].kind, 'float')
+        self.assertEqual(eval_lipi_expr('array([1, 2], "float")', self.env).kind, 'float')
+        self.assertEqual(self.values('array(map(lambda x: x * 10, [1, 2]))'), [10, 20])
+        for bad in ['array([1, "x"])', 'array([1.5], "int")', 'array([1], "text")', 'array(5)']:
+            with self.assertRaises(LipiException):
+                eval_lipi_expr(bad, self.env)
+
+    def test_elementwise_operators(self):
+        self.assertEqual(self.values('a + b'), [1.5, 3.5, 5.5, 7.5, 9.5])
+        self.assertEqual(self.values('a * 2'), [2, 4, 6, 8, 10])
+        self.assertEqual(self.values('2 * a'), [2, 4, 6, 8, 10])
+        self.assertEqual(self.values('10 - a'), [9, 8, 7, 6, 5])
+        self.assertEqual(self.values('a / 2'), [0.5, 1.0, 1.5, 2.0, 2.5])
+        self.assertEqual(self.values('a % 2'), [1, 0, 1, 0, 1])
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('a / 0', self.env)
+        self.env['short'] = eval_lipi_expr('array([1, 2])', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('a + short', self.env)
+
+    def test_integer_overflow_raises(self):
+        """Both backends refuse results that do not fit in an int array"""
+        self.env['big'] = eval_lipi_expr('array([4611686018427387904])', self.env)
+        for expr in ['big * 4', '4 * big', 'big + big + big', 'a ** 40', 'big * 100000000000000000000']:
+            with self.assertRaises(LipiException):
+                eval_lipi_expr(expr, self.env)
+        self.env['edge'] = eval_lipi_expr('big - 1', self.env)
+        self.assertEqual(self.values('edge + big'), [9223372036854775807])
+        self.assertEqual(self.values('a ** 27'), [n ** 27 for n in range(1, 6)])
+
+    def test_masks_and_slicing(self):
+        execute_block(['mask = a > 2', 'big = a[mask]'], self.env)
+        self.assertEqual(self.env['mask'].to_list(), [False, False, True, True, True])
+        self.assertEqual(self.env['big'].to_list(), [3, 4, 5])
+        self.assertEqual(eval_lipi_expr('mask.sum()', self.env), 3)
+        self.assertEqual(self.values('a[1:3]'), [2, 3])
+        self.assertEqual(self.values('a[:2]'), [1, 2])
+        self.assertEqual(self.values('a.ఖండం(3)'), [4, 5])
+        self.assertEqual(eval_lipi_expr('a[0]', self.env), 1)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('a[10]', self.env)
+
+    def test_truth_value_is_ambiguous(self):
+        """`if a == b:` must not silently test a mask"""
+        self.env['c'] = eval_lipi_expr('array([1, 0, 3, 0, 5])', self.env)
+        with self.assertRaises(LipiException):
+            execute_block([
+                'if a == c:',
+                '    same = 1',
+                'end',
+            ], self.env)
+        self.assertNotIn('same', self.env)
+        self.assertFalse(eval_lipi_expr('all(a == c)', self.env))
+        self.assertTrue(eval_lipi_expr('any(a == c)', self.env))
+
+    def test_reductions_and_sorting(self):
+        self.assertEqual(eval_lipi_expr('a.sum()', self.env), 15)
+        self.assertEqual(eval_lipi_expr('b.సగటు()', self.env), 2.5)
+        self.assertEqual(eval_lipi_expr('a.min()', self.env), 1)
+        self.assertEqual(eval_lipi_expr('గరిష్ఠం(a)', self.env), 5)
+        self.assertEqual(eval_lipi_expr('sum(b)', self.env), 12.5)
+        execute_block(['c = array([3, 1, 2])', 'd = c.sort()'], self.env)
+        self.assertEqual(self.env['d'].to_list(), [1, 2, 3])
+        self.assertEqual(self.env['c'].to_list(), [3, 1, 2])
+        self.env['empty'] = eval_lipi_expr('array([])', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('empty.mean()', self.env)
+
+    def test_loops_and_printing(self):
+        execute_block([
+            'total = 0',
+            'for x in a:',
+            '    total = total + x',
+            'end',
+            'n = len(a)',
+        ], self.env)
+        self.assertEqual((self.env['total'], self.env['n']), (15, 5))
+        self.assertEqual(str(self.env['a']), 'array([1, 2, 3, 4, 5])')
+
+
+@unittest.skipUnless(lipi.NUMPY_AVAILABLE, "NumPy not installed")
+class TestNumpyArrays(ArrayBehaviour, unittest.TestCase):
+    """array() backed by NumPy"""
+
+    def test_backend(self):
+        self.assertTrue(self.env['a'].is_numpy)
+
+
+class TestFallbackArrays(ArrayBehaviour, unittest.TestCase):
+    """array() backed by the array module when NumPy is missing"""
+
+    def setUp(self):
+        self.saved = lipi.NUMPY_AVAILABLE
+        lipi.NUMPY_AVAILABLE = False
+        super().setUp()
+
+    def tearDown(self):
+        lipi.NUMPY_AVAILABLE = self.saved
+
+    def test_backend(self):
+        self.assertFalse(self.env['a'].is_numpy)
+
+
+class TestSliceSyntax(unittest.TestCase):
+    """items[start:end] on lists and strings"""
+
+    def test_list_and_string_slices(self):
+        env = {'xs': [1, 2, 3, 4], 'w': 'hello'}
+        self.assertEqual(eval_lipi_expr('xs[1:3]', env), [2, 3])
+        self.assertEqual(eval_lipi_expr('w[1:]', env), 'ello')
+        self.assertEqual(eval_lipi_expr('xs[:len(w) - 2]', env), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 async/await
+Tests async functions, await, gather and the async I/O built-ins
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from io import StringIO
+from contextlib import redirect_stdout
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import runtime, execute_block, eval_lipi_expr, LipiException
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Answers after a short delay so concurrency is observable"""
+    def do_GET(self):
+        time.sleep(0.2)
+        if self.path == '/missing':
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.path == '/old':
+            self.send_response(302)
+            self.send_header('Location', '/new')
+            self.end_headers()
+            return
+        body = f"GET {self.path}".encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        payload = json.loads(self.rfile.read(length))
+        body = json.dumps({'echo': payload}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        self.wfile.write(f"{len(body):x}\r\n".encode() + body + b"\r\n0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncAwait(unittest.TestCase):
+    """Test async function / await / gather"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        runtime.functions.clear()
+        self.env = {'base': self.base_url}
+
+    def test_async_function_returns_awaitable(self):
+        execute_block([
+            'async function double(x):',
+            '    return x * 2',
+            'end',
+            'pending = call double(21)',
+            'result = await pending',
+        ], self.env)
+        self.assertEqual(self.env['result'], 42)
+
+    def test_gather_runs_requests_concurrently(self):
+        execute_block([
+            'async function fetch(path):',
+            '    body = await http_get_async(base + path)',
+            '    return body',
+            'end',
+            'results = await gather(call fetch("/a"), call fetch("/b"), call fetch("/c"), call fetch("/d"))',
+        ], self.env)
+        self.assertEqual(self.env['results'], ['GET /a', 'GET /b', 'GET /c', 'GET /d'])
+
+        start = time.perf_counter()
+        execute_block(['again = await gather([call fetch("/x"), call fetch("/y"), call fetch("/z")])'], self.env)
+        # Three 0.2 s requests overlap instead of taking 0.6 s
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_telugu_syntax_and_control_flow(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            execute_block([
+                'అసమకాలిక పనిచేయి తనిఖీ(paths):',
+                '    సంఖ్య = 0',
+                '    పునరావృతం p in paths:',
+                '        ప్రయత్నించు:',
+                '            పాఠ్యం = వేచి http_పొందు_అసమకాలిక(base + p)',
+                '            సంఖ్య = సంఖ్య + 1',
+                '        పట్టుకో లోపం:',
+                '            చెప్పు "failed " + p',
+                '        ముగింపు',
+                '    ముగింపు',
+                '    యెడల సంఖ్య > 0:',
+                '        చెప్పు వేచి http_పొందు_అసమకాలిక(base + "/done")',
+                '    ముగింపు',
+                '    రిటర్న్ సంఖ్య',
+                'ముగింపు',
+                'ఫలితం = వేచి కాల్ తనిఖీ(["/ok", "/missing"])',
+            ], self.env)
+        self.assertEqual(self.env['ఫలితం'], 1)
+        self.assertEqual(out.getvalue().split('\n')[:2], ['failed /missing', 'GET /done'])
+
+    def test_post_and_redirect(self):
+        execute_block([
+            'posted = await http_post_async(base + "/echo", {name: "Ram"})',
+            'moved = await http_get_async(base + "/old")',
+        ], self.env)
+        self.assertEqual(json.loads(self.env['posted']), {'echo': {'name': 'Ram'}})
+        self.assertEqual(self.env['moved'], 'GET /new')
+
+    def test_http_errors_raise(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('await http_get_async(base + "/missing")', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('await http_get_async("ftp://example.com/x")', self.env)
+
+    def test_http_timeout(self):
+        """A stalled server fails the request instead of hanging gather"""
+        saved = runtime.http_timeout
+        runtime.http_timeout = 0.05
+        try:
+            with self.assertRaises(LipiException) as ctx:
+                eval_lipi_expr('await gather(http_get_async(base + "/slow"), http_get_async(base + "/slow"))',
+                               self.env)
+            self.assertIn('timed out', str(ctx.exception))
+        finally:
+            runtime.http_timeout = saved
+
+    def test_file_and_db_async(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(test_dir, 'note.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('నమస్తే')
+            self.env['path'] = path
+            self.env['db_path'] = os.path.join(test_dir, 'a.db')
+            execute_block([
+                'text = await file_read_async(path)',
+                'db = db_connect(db_path)',
+                'db_query(db, "CREATE TABLE t (x INTEGER)")',
+                'db_query(db, "INSERT INTO t VALUES (7)")',
+                'rows = వేచి డేటాబేస్_ప్రశ్న_అసమకాలిక(db, "SELECT x FROM t")',
+                'db_close(db)',
+            ], self.env)
+            self.assertEqual(self.env['text'], 'నమస్తే')
+            self.assertEqual(self.env['rows'], [{'x': 7}])
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_variable_named_async_in_bodies(self):
+        """A body line like `async = 1` is not a block opener"""
+        execute_block([
+            'function f(x):',
+            '    async = x * 2',
+            '    return async',
+            'end',
+            'class Box:',
+            '    function __init__(self):',
+            '        అసమకాలిక = 5',
+            '        self.n = అసమకాలిక',
+            '    end',
+            'end',
+            'y = call f(3)',
+            'b = Box()',
+            'n = b.n',
+        ], self.env)
+        self.assertEqual((self.env['y'], self.env['n']), (6, 5))
+
+    def test_gather_rejects_plain_values(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('gather(1, 2)', self.env)
+
+    def test_async_method(self):
+        execute_block([
+            'class Client:',
+            '    function __init__(self, root):',
+            '        self.root = root',
+            '    end',
+            '    async function get(self, path):',
+            '        return await http_get_async(self.root + path)',
+            '    end',
+            'end',
+            'c = Client(base)',
+            'r = await call c.get("/m")',
+        ], self.env)
+        self.assertEqual(self.env['r'], 'GET /m')
+
+
+if __name__ == '__main__':
+    unittest.main()
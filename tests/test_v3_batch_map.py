@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the Lipi v3.0 batch executor
+Tests lipi map: one script over a JSONL stream of records
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+from io import StringIO
+from contextlib import redirect_stderr
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import map_records, main, LipiException
+
+
+class TestBatchMap(unittest.TestCase):
+    """Test map_records / lipi map"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.script = os.path.join(self.test_dir, 'rules.lipi.py')
+        with open(self.script, 'w', encoding='utf-8') as f:
+            f.write('\n'.join([
+                'bonus = 10',
+                'function main(record):',
+                '    return {id: record.id, score: record.points + bonus}',
+                'end',
+                'పనిచేయి ప్రధాన(record):',
+                '    రిటర్న్ record.name',
+                'ముగింపు',
+            ]) + '\n')
+        self.input = os.path.join(self.test_dir, 'records.jsonl')
+        with open(self.input, 'w', encoding='utf-8') as f:
+            for i in range(50):
+                f.write(json.dumps({'id': i, 'points': i * 2, 'name': f'పేరు{i}'}, ensure_ascii=False) + '\n')
+            f.write('\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def results(self, output):
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_ordered_in_process(self):
+        output = StringIO()
+        self.assertEqual(map_records(self.script, self.input, output, workers=1), (50, 0))
+        self.assertEqual(self.results(output)[:2], [{'id': 0, 'score': 10}, {'id': 1, 'score': 12}])
+
+    def test_ordered_process_pool(self):
+        output = StringIO()
+        self.assertEqual(map_records(self.script, self.input, output, workers=3, chunksize=4), (50, 0))
+        self.assertEqual([r['id'] for r in self.results(output)], list(range(50)))
+
+    def test_unordered_with_telugu_entry(self):
+        output = StringIO()
+        map_records(self.script, self.input, output, workers=2, entry='ప్రధాన', ordered=False)
+        results = self.results(output)
+        self.assertEqual(sorted(r['line'] for r in results), list(range(1, 51)))
+        for r in results:
+            self.assertEqual(r['result'], f"పేరు{r['line'] - 1}")
+
+    def test_unordered_in_process_carries_lines(self):
+        output = StringIO()
+        map_records(self.script, self.input, output, workers=1, ordered=False)
+        self.assertEqual(self.results(output)[0], {'line': 1, 'result': {'id': 0, 'score': 10}})
+
+    def test_bad_records_reported(self):
+        with open(self.input, 'a', encoding='utf-8') as f:
+            f.write('{not json}\n')
+            f.write('{"id": 99}\n')
+        output = StringIO()
+        self.assertEqual(map_records(self.script, self.input, output, workers=2), (52, 2))
+        errors = self.results(output)[-2:]
+        self.assertEqual([e['line'] for e in errors], [52, 53])
+
+    def test_missing_input(self):
+        with self.assertRaises(LipiException):
+            map_records(self.script, os.path.join(self.test_dir, 'none.jsonl'), StringIO(), workers=1)
+
+    def test_cli_missing_input(self):
+        missing = os.path.join(self.test_dir, 'none.jsonl')
+        with redirect_stderr(StringIO()) as err:
+            code = main(['map', self.script, '--input', missing, '--workers', '1'])
+        self.assertEqual(code, 1)
+        self.assertIn('none.jsonl', err.getvalue())
+
+    def test_cli(self):
+        out_path = os.path.join(self.test_dir, 'out.jsonl')
+        with redirect_stderr(StringIO()) as err:
+            code = main(['map', self.script, '--input', self.input, '--output', out_path, '--workers', '2'])
+        self.assertEqual(code, 0)
+        self.assertIn('50 records, 0 errors', err.getvalue())
+        with open(out_path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
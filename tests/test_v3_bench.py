@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 benchmark suite
+Tests benchmark discovery, the in-process worker and the regression gate
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+from io import StringIO
+from contextlib import redirect_stdout, redirect_stderr
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import (BENCHMARK_DIR, discover_benchmarks, percentile, bench_worker, run_benchmarks, main)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test benchmarks/ and lipi bench"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        for lang, text in (('en', 'x = 1 + 2\nfile_write("scratch.txt", "ok")\n'),
+                           ('te', 'చెప్పు "నమస్తే"\n')):
+            os.makedirs(os.path.join(self.test_dir, lang, 'lib'))
+            with open(os.path.join(self.test_dir, lang, 'tiny.lipi.py'), 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_repo_suite_covers_both_languages(self):
+        names = discover_benchmarks()
+        for kind in ('fib', 'loops', 'strings', 'collections', 'oop', 'imports', 'sqlite', 'streaming'):
+            self.assertIn(f'en/{kind}', names)
+            self.assertIn(f'te/{kind}', names)
+        self.assertTrue(os.path.isfile(os.path.join(BENCHMARK_DIR, 'en', 'lib', 'base.lipi.py')))
+        self.assertEqual(list(discover_benchmarks(pattern='te/fib')), ['te/fib'])
+
+    def test_percentile(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 0.5), 3)
+        self.assertEqual(percentile(values, 0.95), 5)
+        self.assertEqual(percentile([7], 0.95), 7)
+
+    def test_worker_runs_in_scratch_directory(self):
+        cwd = os.getcwd()
+        result = bench_worker(os.path.join(self.test_dir, 'en', 'tiny.lipi.py'), repeat=3, warmup=1)
+        self.assertEqual(len(result['times']), 3)
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertFalse(os.path.exists(os.path.join(cwd, 'scratch.txt')))
+
+    def test_regression_gate(self):
+        baseline = {'benchmarks': {'en/tiny': {'median_ms': 0.000001}, 'te/tiny': {'median_ms': 10 ** 6}}}
+        out = StringIO()
+        results, regressions = run_benchmarks(self.test_dir, repeat=2, warmup=0, baseline=baseline, out=out)
+        self.assertEqual(regressions, ['en/tiny'])
+        self.assertEqual(set(results['benchmarks']), {'en/tiny', 'te/tiny'})
+        self.assertEqual(results['benchmarks']['te/tiny']['runs'], 2)
+        self.assertIn('REGRESSED', out.getvalue())
+
+    def test_cli_save_and_failures(self):
+        with open(os.path.join(self.test_dir, 'en', 'broken.lipi.py'), 'w', encoding='utf-8') as f:
+            f.write('x = missing_name\n')
+        saved = os.path.join(self.test_dir, 'baseline.json')
+        err = StringIO()
+        with redirect_stdout(StringIO()) as out, redirect_stderr(err):
+            code = main(['bench', '--dir', self.test_dir, '--repeat', '1', '--save', saved])
+        self.assertEqual(code, 1)
+        self.assertIn('FAILED', out.getvalue())
+        self.assertIn('en/broken', err.getvalue())
+        with open(saved, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(set(data['benchmarks']), {'en/tiny', 'te/tiny'})
+        self.assertGreater(data['benchmarks']['en/tiny']['ops_per_sec'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
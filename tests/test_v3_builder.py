@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 string building
+Tests builder() append / join / to_string and the join built-in
+"""
+
+import unittest
+import os
+import sys
+from io import StringIO
+from contextlib import redirect_stdout
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import execute_block, eval_lipi_expr, LipiException, LipiStringBuilder
+
+
+class TestStringBuilder(unittest.TestCase):
+    """Test builder / నిర్మాత"""
+
+    def test_append_in_loop(self):
+        env = {}
+        execute_block([
+            'sb = builder("Report: ")',
+            'i = 0',
+            'while i < 5:',
+            '    sb.append(i)',
+            '    call sb.append(",")',
+            '    i = i + 1',
+            'end',
+            'text = sb.to_string()',
+            'size = len(sb)',
+        ], env)
+        self.assertIsInstance(env['sb'], LipiStringBuilder)
+        self.assertEqual(env['text'], 'Report: 0,1,2,3,4,')
+        self.assertEqual(env['size'], len(env['text']))
+
+    def test_join_method_and_chaining(self):
+        env = {}
+        execute_block([
+            'sb = builder()',
+            'sb.join(["a", "b", 3], "-")',
+            'same = sb.append("!")',
+            'text = same.to_string()',
+        ], env)
+        self.assertIs(env['same'], env['sb'])
+        self.assertEqual(env['text'], 'a-b-3!')
+
+    def test_telugu_aliases(self):
+        env = {}
+        execute_block([
+            'నివేదిక = నిర్మాత("నమస్తే")',
+            'నివేదిక.జోడించు(" ")',
+            'నివేదిక.కలుపు(["రాము", "సీత"], ", ")',
+            'ఫలితం = నివేదిక.పాఠ్యం()',
+        ], env)
+        self.assertEqual(env['ఫలితం'], 'నమస్తే రాము, సీత')
+
+    def test_print_and_clear(self):
+        env = {}
+        out = StringIO()
+        with redirect_stdout(out):
+            execute_block([
+                'sb = builder("x")',
+                'sb.append("y")',
+                'print sb',
+                'sb.clear()',
+                'print len(sb)',
+            ], env)
+        self.assertEqual(out.getvalue().split(), ['xy', '0'])
+
+    def test_unknown_method(self):
+        env = {'sb': LipiStringBuilder()}
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('sb.reverse()', env)
+
+
+class TestJoin(unittest.TestCase):
+    """Test join / కలుపు"""
+
+    def test_join_values(self):
+        self.assertEqual(eval_lipi_expr('join([1, 2, 3], ", ")', {}), '1, 2, 3')
+        self.assertEqual(eval_lipi_expr('కలుపు(["x", "y"])', {}), 'xy')
+        self.assertEqual(eval_lipi_expr('join([])', {}), '')
+
+    def test_join_errors(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('join(5)', {})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('join([1], 2)', {})
+
+
+if __name__ == '__main__':
+    unittest.main()
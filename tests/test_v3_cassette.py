@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 record/replay cassettes
+Tests --record / --replay interception of http, database and file-read built-ins
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from io import StringIO
+from contextlib import redirect_stdout, redirect_stderr
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import LipiRuntime, LipiCassette, LipiException, main
+
+SCRIPT = [
+    'db = db_connect(dir + "/c.db")',
+    'db_query(db, "CREATE TABLE t (x INTEGER)")',
+    'n = db_insert_many(db, "INSERT INTO t VALUES (?)", [[1], [2], [3]])',
+    'rows = db_query(db, "SELECT SUM(x) AS s FROM t")',
+    'exported = db_export_csv(db, "SELECT x FROM t", dir + "/t.csv")',
+    'closed = db_close(db)',
+    'total = 0',
+    'for r in csv_iter(dir + "/t.csv", {x: "int"}):',
+    '    total = total + r.x',
+    'end',
+    'text = file_read(dir + "/t.csv")',
+    'page = http_get(base + "/page")',
+    'posted = http_post(base + "/echo", {name: "రాము"})',
+    'later = await http_get_async(base + "/async")',
+]
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """Echoes the path (GET) or body (POST) and counts requests"""
+    hits = 0
+
+    def reply(self, body):
+        CountingHandler.hits += 1
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.reply(f"GET {self.path}")
+
+    def do_POST(self):
+        self.reply(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCassettes(unittest.TestCase):
+    """Test LipiCassette record / replay"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cassette_path = os.path.join(self.test_dir, 'run.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def run_script(self, mode, lines=SCRIPT):
+        rt = LipiRuntime()
+        rt.cassette = LipiCassette(self.cassette_path, mode)
+        try:
+            return rt.run_source(lines, {'dir': self.test_dir, 'base': self.base_url})
+        finally:
+            rt.cassette.close()
+            rt.close()
+
+    def results(self, env):
+        return {name: env[name] for name in
+                ('n', 'rows', 'exported', 'closed', 'total', 'text', 'page', 'posted', 'later')}
+
+    def test_replay_matches_recording_without_io(self):
+        recorded = self.results(self.run_script('record'))
+        self.assertEqual(recorded['rows'], [{'s': 6}])
+        self.assertEqual(recorded['total'], 6)
+        self.assertEqual(json.loads(recorded['posted']), {'name': 'రాము'})
+
+        # Replay with the data files gone and the server unused
+        os.remove(os.path.join(self.test_dir, 'c.db'))
+        os.remove(os.path.join(self.test_dir, 't.csv'))
+        hits = CountingHandler.hits
+        replayed = self.run_script('replay')
+        self.assertEqual(self.results(replayed), recorded)
+        self.assertEqual(CountingHandler.hits, hits)
+        self.assertEqual(sorted(os.listdir(self.test_dir)), ['run.jsonl', 't.csv'])
+
+    def test_replayed_export_writes_file(self):
+        """Code that reads an exported file works under replay"""
+        lines = [
+            'db = db_connect(dir + "/c.db")',
+            'db_query(db, "CREATE TABLE t (x INTEGER, name TEXT)")',
+            'n = db_insert_many(db, "INSERT INTO t VALUES (?, ?)", [[1, "రాము"], [2, "a,b"]])',
+            'exported = db_export_jsonl(db, "SELECT * FROM t", dir + "/t.jsonl")',
+            'closed = db_close(db)',
+        ]
+        self.run_script('record', lines)
+        out = os.path.join(self.test_dir, 't.jsonl')
+        with open(out, encoding='utf-8') as f:
+            recorded = f.read()
+        os.remove(out)
+        os.remove(os.path.join(self.test_dir, 'c.db'))
+        env = self.run_script('replay', lines)
+        self.assertEqual(env['exported'], 2)
+        with open(out, encoding='utf-8') as f:
+            self.assertEqual(f.read(), recorded)
+
+    def test_cassette_entries(self):
+        self.run_script('record')
+        with open(self.cassette_path, encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f]
+        kinds = [entry['kind'] for entry in entries]
+        self.assertEqual(kinds, ['db_connect', 'db_query', 'db_insert_many', 'db_query', 'db_export', 'db_close',
+                                 'file_stream', 'file_read', 'http_get', 'http_post', 'http_get'])
+        self.assertEqual(entries[0]['request']['driver'], 'sqlite')
+
+    def test_errors_are_replayed(self):
+        lines = ['text = file_read(dir + "/missing.txt")']
+        with self.assertRaises(LipiException):
+            self.run_script('record', lines)
+        with self.assertRaises(LipiException) as ctx:
+            self.run_script('replay', lines)
+        self.assertIn('missing.txt', str(ctx.exception))
+
+    def test_unrecorded_call_fails(self):
+        self.run_script('record', ['a = file_read(dir + "/run.jsonl")'])
+        with self.assertRaises(LipiException) as ctx:
+            self.run_script('replay', ['a = file_read(dir + "/run.jsonl")', 'b = file_read(dir + "/run.jsonl")'])
+        self.assertIn('Cassette has no recorded result', str(ctx.exception))
+
+    def test_cli_record_and_replay(self):
+        path = os.path.join(self.test_dir, 'note.lipi.py')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'print file_read("{path}")\n')
+        for flag in ('--record', '--replay'):
+            out = StringIO()
+            with redirect_stdout(out):
+                main([path, flag, self.cassette_path])
+            self.assertIn('file_read', out.getvalue())
+        with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+            main([path, '--record', self.cassette_path, '--replay', self.cassette_path])
+
+
+if __name__ == '__main__':
+    unittest.main()
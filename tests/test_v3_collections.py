@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 native collections
+Tests set literals, the in / లో operator, sorted, bisect, heaps,
+counter, group_by and unique
+"""
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import runtime, execute_block, eval_lipi_expr, LipiException
+
+
+class TestSetsAndMembership(unittest.TestCase):
+    """Test set literals and the in / not in / లో operator"""
+
+    def test_set_literal(self):
+        self.assertEqual(eval_lipi_expr('{1, 2, 3, 2}', {}), {1, 2, 3})
+        self.assertEqual(eval_lipi_expr('{"a:b", "c"}', {}), {'a:b', 'c'})
+        self.assertEqual(eval_lipi_expr('{a: 1}', {}), {'a': 1})
+        self.assertEqual(eval_lipi_expr('సమితి([1, 1, 2])', {}), {1, 2})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('{[1, 2]}', {})
+
+    def test_membership_operator(self):
+        env = {'s': {1, 2}, 'names': ['రాము', 'సీత'], 'd': {'k': 1}}
+        self.assertIs(eval_lipi_expr('2 in s', env), True)
+        self.assertIs(eval_lipi_expr('3 not in s', env), True)
+        self.assertIs(eval_lipi_expr('"సీత" లో names', env), True)
+        self.assertIs(eval_lipi_expr('"k" in d', env), True)
+        self.assertIs(eval_lipi_expr('"ell" in "hello"', env), True)
+        self.assertIs(eval_lipi_expr('1 + 1 in s', env), True)
+        self.assertEqual(eval_lipi_expr('"log in here"', env), 'log in here')
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('1 in 5', env)
+
+    def test_dedupe_loop(self):
+        env = {}
+        execute_block([
+            'seen = set()',
+            'fresh = 0',
+            'for t in ["x", "y", "x", "z", "y"]:',
+            '    if t not in seen:',
+            '        set_add(seen, t)',
+            '        fresh = fresh + 1',
+            '    end',
+            'end',
+            'సమితి_తొలగించు(seen, "z")',
+        ], env)
+        self.assertEqual(env['fresh'], 3)
+        self.assertEqual(env['seen'], {'x', 'y'})
+
+
+class TestCollectionBuiltins(unittest.TestCase):
+    """Test sorted / bisect / heaps / counter / group_by / unique"""
+
+    def setUp(self):
+        runtime.functions.clear()
+        self.env = {}
+        execute_block([
+            'rows = [{name: "a", dept: "x"}, {name: "b", dept: "y"}, {name: "c", dept: "x"}]',
+            'function neg(n):',
+            '    return 0 - n',
+            'end',
+        ], self.env)
+
+    def test_sorted(self):
+        self.assertEqual(eval_lipi_expr('sorted([3, 1, 2])', self.env), [1, 2, 3])
+        self.assertEqual(eval_lipi_expr('sorted([3, 1, 2], neg)', self.env), [3, 2, 1])
+        self.assertEqual(eval_lipi_expr('క్రమీకరించు([3, 1, 2], null, true)', self.env), [3, 2, 1])
+        names = eval_lipi_expr('sorted(rows, "name", true)', self.env)
+        self.assertEqual([r['name'] for r in names], ['c', 'b', 'a'])
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('sorted(rows, "missing")', self.env)
+
+    def test_bisect_and_heap(self):
+        execute_block([
+            'xs = [1, 3, 5]',
+            'i = bisect(xs, 4)',
+            'ద్విభాగ_చేర్చు(xs, 4)',
+            'h = []',
+            'heap_push(h, 5)',
+            'heap_push(h, 1)',
+            'కుప్ప_చేర్చు(h, 3)',
+            'first = heap_pop(h)',
+            'second = కుప్ప_తీయి(h)',
+        ], self.env)
+        self.assertEqual(self.env['i'], 2)
+        self.assertEqual(self.env['xs'], [1, 3, 4, 5])
+        self.assertEqual((self.env['first'], self.env['second']), (1, 3))
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('heap_pop([])', self.env)
+
+    def test_counter_group_by_unique(self):
+        self.assertEqual(eval_lipi_expr('counter(["x", "y", "x"])', self.env), {'x': 2, 'y': 1})
+        self.assertEqual(eval_lipi_expr('లెక్కించు(rows, "dept")', self.env), {'x': 2, 'y': 1})
+        groups = eval_lipi_expr('group_by(rows, "dept")', self.env)
+        self.assertEqual({k: [r['name'] for r in v] for k, v in groups.items()}, {'x': ['a', 'c'], 'y': ['b']})
+        self.assertEqual(list(eval_lipi_expr('సమూహపరచు([1, 2, 3], neg)', self.env)), [-1, -2, -3])
+        self.assertEqual(eval_lipi_expr('ప్రత్యేకం([3, 1, 3, 2, 1])', self.env), [3, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
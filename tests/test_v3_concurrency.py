@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 concurrency features
+Tests parallel_map over a process pool and parallel for loops on a thread pool
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import runtime, execute_block, eval_lipi_expr, LipiException, snapshot_for_workers
+
+
+class TestParallelMap(unittest.TestCase):
+    """Test parallel_map / సమాంతర_పటం"""
+
+    def setUp(self):
+        runtime.functions.clear()
+        runtime.classes.clear()
+        runtime.python_modules.clear()
+        self.env = {}
+        execute_block([
+            'import_python("math")',
+            'offset = 100',
+            'function score(x):',
+            '    return x * x',
+            'end',
+            'function shift(x):',
+            '    return x + offset',
+            'end',
+            'పనిచేయి మూలం(x):',
+            '    రిటర్న్ math.sqrt(x)',
+            'ముగింపు',
+            'function fail(x):',
+            '    return missing_variable',
+            'end',
+        ], self.env)
+
+    def test_results_in_order(self):
+        result = eval_lipi_expr('parallel_map(score, [1, 2, 3, 4, 5], 2)', self.env)
+        self.assertEqual(result, [1, 4, 9, 16, 25])
+
+    def test_workers_see_global_variables(self):
+        result = eval_lipi_expr('parallel_map(shift, [1, 2, 3], 3)', self.env)
+        self.assertEqual(result, [101, 102, 103])
+
+    def test_telugu_alias_and_python_modules(self):
+        """Workers re-import modules loaded with import_python"""
+        result = eval_lipi_expr('సమాంతర_పటం("మూలం", [4, 9, 16])', self.env)
+        self.assertEqual(result, [2.0, 3.0, 4.0])
+
+    def test_empty_items(self):
+        self.assertEqual(eval_lipi_expr('parallel_map(score, [])', self.env), [])
+
+    def test_worker_errors_surface(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('parallel_map(fail, [1, 2], 2)', self.env)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('parallel_map(undefined_func, [1])', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('parallel_map(score, [1], 0)', self.env)
+
+    def test_snapshot_skips_unpicklable_values(self):
+        snapshot = snapshot_for_workers(self.env)
+        self.assertIn('score', snapshot['functions'])
+        self.assertEqual(snapshot['env']['offset'], 100)
+        self.assertNotIn('math', snapshot['env'])
+        self.assertEqual(snapshot['python_modules'], ['math'])
+
+
+class TestParallelFor(unittest.TestCase):
+    """Test parallel for / సమాంతర పునరావృతం"""
+
+    def setUp(self):
+        runtime.functions.clear()
+
+    def tearDown(self):
+        for conn in runtime.db_connections.values():
+            conn.close()
+        runtime.db_connections.clear()
+
+    def test_results_collected(self):
+        env = {'items': list(range(20))}
+        execute_block([
+            'results = accumulator()',
+            'parallel for n in items:',
+            '    sq = n * n',
+            '    accumulate(results, sq)',
+            'end',
+            'total = len(results)',
+        ], env)
+        self.assertEqual(env['total'], 20)
+        self.assertEqual(sorted(env['results']), [n * n for n in range(20)])
+        # Iteration scopes are private copies
+        self.assertNotIn('sq', env)
+        self.assertNotIn('n', env)
+
+    def test_telugu_syntax_with_nested_blocks(self):
+        env = {}
+        execute_block([
+            'ఫలితాలు = సంచయం()',
+            'సమాంతర పునరావృతం x in [1, 2, 3, 4]:',
+            '    యెడల x > 2:',
+            '        సంచయించు(ఫలితాలు, x)',
+            '    ముగింపు',
+            'ముగింపు',
+            'చివరి = "done"',
+        ], env)
+        self.assertEqual(sorted(env['ఫలితాలు']), [3, 4])
+        self.assertEqual(env['చివరి'], "done")
+
+    def test_runs_concurrently(self):
+        """Blocking bodies overlap instead of running one after another"""
+        barrier = threading.Barrier(4, timeout=5)
+        runtime.python_modules['sync'] = type('Sync', (), {'wait': staticmethod(barrier.wait)})
+        try:
+            execute_block([
+                'parallel for x in [1, 2, 3, 4]:',
+                '    r = sync.wait()',
+                'end',
+            ], {})
+        finally:
+            del runtime.python_modules['sync']
+
+    def test_parallel_for_inside_function(self):
+        env = {}
+        execute_block([
+            'function squares(items):',
+            '    out = accumulator()',
+            '    parallel for n in items:',
+            '        accumulate(out, n * n)',
+            '    end',
+            '    return len(out)',
+            'end',
+            'count = call squares([1, 2, 3])',
+        ], env)
+        self.assertEqual(env['count'], 3)
+
+    def test_variable_named_parallel_in_bodies(self):
+        """A body line like `parallel = 1` is not a block opener"""
+        env = {}
+        execute_block([
+            'function f(x):',
+            '    parallel = x + 1',
+            '    return parallel',
+            'end',
+            'class Box:',
+            '    function __init__(self):',
+            '        సమాంతర = 2',
+            '        self.n = సమాంతర',
+            '    end',
+            'end',
+            'y = call f(3)',
+            'b = Box()',
+            'n = b.n',
+        ], env)
+        self.assertEqual((env['y'], env['n']), (4, 2))
+
+    def test_errors_propagate(self):
+        with self.assertRaises(Exception):
+            execute_block([
+                'parallel for x in [1, 2]:',
+                '    print undefined_name',
+                'end',
+            ], {})
+        with self.assertRaises(LipiException):
+            execute_block([
+                'function f():',
+                '    parallel for x in [1]:',
+                '        return x',
+                '    end',
+                'end',
+                'y = call f()',
+            ], {})
+
+    def test_sqlite_from_worker_threads(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            env = {'path': os.path.join(test_dir, 'p.db')}
+            execute_block([
+                'db = db_connect(path)',
+                'db_query(db, "CREATE TABLE t (x INTEGER)")',
+                'parallel for x in [1, 2, 3, 4, 5, 6]:',
+                '    db_query(db, "INSERT INTO t VALUES (" + str(x) + ")")',
+                'end',
+                'rows = db_query(db, "SELECT COUNT(*) AS n FROM t")',
+            ], env)
+            self.assertEqual(env['rows'], [{'n': 6}])
+        finally:
+            shutil.rmtree(test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
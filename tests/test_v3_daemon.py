@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the Lipi v3.0 warm daemon
+Tests lipi serve / lipi run --daemon over a Unix socket
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+import threading
+import socket
+import json
+import stat
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import LipiDaemon, run_via_daemon, main
+
+
+class TestDaemon(unittest.TestCase):
+    """Test LipiDaemon and the run_via_daemon client"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.test_dir, 'shared.lipi.py'), 'w', encoding='utf-8') as f:
+            f.write('function greet(name):\n    return "నమస్తే " + name\nend\n'
+                    'cached function square(n):\n    return n * n\nend\nexport greet, square\n')
+        self.socket_path = os.path.join(self.test_dir, 'lipi.sock')
+        self.daemon = LipiDaemon(self.socket_path, pool_size=2,
+                                 preload=[os.path.join(self.test_dir, 'shared')], root=self.test_dir)
+        self.daemon.bind()
+        self.thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.daemon.shutdown()
+        self.thread.join(timeout=5)
+        shutil.rmtree(self.test_dir)
+
+    def write_script(self, name, lines):
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        return path
+
+    def test_stdout_streamed_and_env_returned(self):
+        path = self.write_script('hello.lipi.py', [
+            'import greet from "shared"',
+            'చెప్పు call greet(who)',
+            'parallel for i in [1, 2]:',
+            '    print "worker"',
+            'end',
+            'result = {count: 2}',
+        ])
+        out = StringIO()
+        message = run_via_daemon(path, self.socket_path, env={'who': 'రాము'}, out=out)
+        self.assertTrue(message['ok'])
+        self.assertEqual(out.getvalue().split('\n'), ['నమస్తే రాము', 'worker', 'worker', ''])
+        self.assertEqual(message['env']['result'], {'count': 2})
+        self.assertEqual(message['env']['who'], 'రాము')
+
+    def test_preloaded_module_is_not_reloaded(self):
+        """Preloaded exports come from the warm template, not a fresh file read"""
+        self.assertEqual(len(self.daemon.template.loaded_modules), 1)
+        os.remove(os.path.join(self.test_dir, 'shared.lipi.py'))
+        path = self.write_script('uses.lipi.py', ['import greet from "shared"', 'r = call greet("Sita")'])
+        message = run_via_daemon(path, self.socket_path, out=StringIO())
+        self.assertEqual(message['env']['r'], 'నమస్తే Sita')
+
+    def test_jobs_are_isolated(self):
+        define = self.write_script('define.lipi.py', ['function secret():', '    return 1', 'end'])
+        use = self.write_script('use.lipi.py', ['r = call secret()'])
+        self.assertTrue(run_via_daemon(define, self.socket_path, out=StringIO())['ok'])
+        for _ in range(3):
+            message = run_via_daemon(use, self.socket_path, out=StringIO())
+            self.assertFalse(message['ok'])
+
+    def test_memoized_results_are_per_job(self):
+        """A preloaded cached function starts every job with an empty cache"""
+        path = self.write_script('memo.lipi.py', [
+            'import square from "shared"',
+            'a = call square(7)',
+            'b = call square(7)',
+            'info = cache_info(square)',
+        ])
+        for _ in range(3):
+            message = run_via_daemon(path, self.socket_path, out=StringIO())
+            self.assertTrue(message['ok'], message.get('error'))
+            self.assertEqual(message['env']['a'], 49)
+            self.assertEqual(message['env']['info'], {'hits': 1, 'misses': 1, 'maxsize': 128, 'currsize': 1})
+        self.assertEqual(self.daemon.template.functions['square']['cache'].info()['currsize'], 0)
+
+    def test_errors_in_requested_language(self):
+        path = self.write_script('bad.lipi.py', ['print missing_name'])
+        message = run_via_daemon(path, self.socket_path, lang='te', out=StringIO())
+        self.assertFalse(message['ok'])
+        self.assertTrue(message['error'].startswith('[లోపం]'))
+
+    def test_concurrent_clients(self):
+        path = self.write_script('echo.lipi.py', ['print n', 'twice = n * 2'])
+
+        def run(n):
+            out = StringIO()
+            message = run_via_daemon(path, self.socket_path, env={'n': n}, out=out)
+            return out.getvalue().strip(), message['env']['twice']
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(run, range(12)))
+        self.assertEqual(results, [(str(n), n * 2) for n in range(12)])
+
+    def send_request(self, request):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall((json.dumps(request) + '\n').encode('utf-8'))
+            with sock.makefile('r', encoding='utf-8') as reader:
+                return json.loads(reader.readlines()[-1])
+
+    def test_socket_is_private(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+        umask = os.umask(0o022)
+        os.umask(umask)
+        self.assertNotEqual(umask, 0o177)
+
+    def test_path_requests_stay_under_root(self):
+        self.write_script('inside.lipi.py', ['x = 1'])
+        message = self.send_request({'path': 'inside.lipi.py'})
+        self.assertTrue(message['ok'], message['error'])
+        self.assertEqual(message['env'], {'x': 1})
+        outside_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, outside_dir)
+        outside = os.path.join(outside_dir, 'outside.lipi.py')
+        with open(outside, 'w', encoding='utf-8') as f:
+            f.write('x = 2\n')
+        for path in [outside, os.path.join(self.test_dir, '..', os.path.basename(outside_dir), 'outside.lipi.py')]:
+            message = self.send_request({'path': path})
+            self.assertFalse(message['ok'])
+            self.assertIn('outside the daemon root', message['error'])
+        self.assertFalse(self.send_request({})['ok'])
+
+    def test_cli_client(self):
+        path = self.write_script('cli.lipi.py', ['print "from daemon"'])
+        from contextlib import redirect_stdout
+        out = StringIO()
+        with redirect_stdout(out):
+            code = main(['run', '--daemon', '--socket', self.socket_path, path])
+        self.assertEqual(code, 0)
+        self.assertEqual(out.getvalue(), 'from daemon\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
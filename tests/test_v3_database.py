@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 SQLite database features
+Tests connection profiles (PRAGMA presets and options) and streaming export
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+import csv
+import json
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import runtime, eval_lipi_expr, run_lipi_line, LipiException, open_sqlite_connection
+
+
+class TestSQLiteProfiles(unittest.TestCase):
+    """Test db_connect performance profiles"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.test_dir, 'profile.db')
+
+    def tearDown(self):
+        for conn in runtime.db_connections.values():
+            conn.close()
+        runtime.db_connections.clear()
+        shutil.rmtree(self.test_dir)
+
+    def pragma(self, conn_id, name):
+        return runtime.db_connections[conn_id].execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_default_connection_unchanged(self):
+        """db_connect(path) keeps SQLite defaults"""
+        conn_id = eval_lipi_expr(f'db_connect("{self.db_path}")', {})
+        self.assertEqual(self.pragma(conn_id, 'journal_mode'), 'delete')
+
+    def test_bulk_load_preset(self):
+        """Preset name applies WAL and relaxed sync"""
+        conn_id = eval_lipi_expr(f'db_connect("{self.db_path}", "bulk_load")', {})
+        self.assertEqual(self.pragma(conn_id, 'journal_mode'), 'wal')
+        self.assertEqual(self.pragma(conn_id, 'synchronous'), 0)
+        self.assertEqual(self.pragma(conn_id, 'temp_store'), 2)
+
+    def test_options_object(self):
+        """Options object sets individual PRAGMAs (Telugu builtin)"""
+        env = {'path': self.db_path}
+        conn_id = eval_lipi_expr(
+            'డేటాబేస్_కనెక్ట్(path, {journal_mode: "wal", synchronous: "normal", cache_size: -8000})', env)
+        self.assertEqual(self.pragma(conn_id, 'journal_mode'), 'wal')
+        self.assertEqual(self.pragma(conn_id, 'synchronous'), 1)
+        self.assertEqual(self.pragma(conn_id, 'cache_size'), -8000)
+
+    def test_preset_with_override(self):
+        """Explicit options override the preset"""
+        conn = open_sqlite_connection(self.db_path, {'preset': 'durable', 'synchronous': 'extra'})
+        try:
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 3)
+        finally:
+            conn.close()
+
+    def test_read_only_mode(self):
+        """read_only opens the file via a read-only URI"""
+        conn = open_sqlite_connection(self.db_path)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.close()
+
+        conn_id = eval_lipi_expr(f'db_connect("{self.db_path}", {{read_only: true}})', {})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr(f'db_query("{conn_id}", "INSERT INTO t VALUES (1)")', {})
+
+    def test_read_only_in_memory_rejected(self):
+        cwd = os.getcwd()
+        os.chdir(os.path.dirname(self.db_path))
+        try:
+            for path in (':memory:', ''):
+                with self.assertRaises(LipiException):
+                    open_sqlite_connection(path, {'read_only': True})
+            self.assertFalse(os.path.exists(':memory:'))
+        finally:
+            os.chdir(cwd)
+
+    def test_invalid_options_rejected(self):
+        """Unknown presets, options and values are rejected"""
+        with self.assertRaises(LipiException):
+            eval_lipi_expr(f'db_connect("{self.db_path}", "turbo")', {})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr(f'db_connect("{self.db_path}", {{page_size: 4096}})', {})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr(f'db_connect("{self.db_path}", {{journal_mode: "wal; DROP TABLE t"}})', {})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr(f'db_connect("{self.db_path}", {{mmap_size: "big"}})', {})
+
+
+class TestStreamingExport(unittest.TestCase):
+    """Test db_export_csv / db_export_jsonl"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.env = {}
+        run_lipi_line(f'db = db_connect("{os.path.join(self.test_dir, "export.db")}")', self.env)
+        run_lipi_line('db_query(db, "CREATE TABLE users (id INTEGER, name TEXT)")', self.env)
+        run_lipi_line('db_query(db, "INSERT INTO users VALUES (1, \'రాము\'), (2, \'Sita, Devi\'), (3, \'Lakshman\')")',
+                      self.env)
+
+    def tearDown(self):
+        for conn in runtime.db_connections.values():
+            conn.close()
+        runtime.db_connections.clear()
+        shutil.rmtree(self.test_dir)
+
+    def test_export_csv(self):
+        """Rows are written with a header and CSV quoting"""
+        path = os.path.join(self.test_dir, 'users.csv')
+        self.env['path'] = path
+        count = eval_lipi_expr('db_export_csv(db, "SELECT * FROM users ORDER BY id", path)', self.env)
+        self.assertEqual(count, 3)
+        with open(path, encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['id', 'name'])
+        self.assertEqual(rows[1], ['1', 'రాము'])
+        self.assertEqual(rows[2], ['2', 'Sita, Devi'])
+
+    def test_export_jsonl_with_params(self):
+        """Telugu alias, parameters and one JSON object per line"""
+        path = os.path.join(self.test_dir, 'users.jsonl')
+        self.env['path'] = path
+        run_lipi_line('డేటాబేస్_ఎగుమతి_jsonl(db, "SELECT * FROM users WHERE id > ?", path, [1])', self.env)
+        with open(path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records, [{'id': 2, 'name': 'Sita, Devi'}, {'id': 3, 'name': 'Lakshman'}])
+
+    def test_export_in_batches(self):
+        """Exports larger than one batch are complete"""
+        import src.lipi as lipi_module
+        path = os.path.join(self.test_dir, 'batched.csv')
+        self.env['path'] = path
+        old_batch = lipi_module.EXPORT_BATCH_SIZE
+        lipi_module.EXPORT_BATCH_SIZE = 2
+        try:
+            count = eval_lipi_expr('db_export_csv(db, "SELECT * FROM users", path)', self.env)
+        finally:
+            lipi_module.EXPORT_BATCH_SIZE = old_batch
+        self.assertEqual(count, 3)
+        with open(path, encoding='utf-8', newline='') as f:
+            self.assertEqual(len(list(csv.reader(f))), 4)
+
+    def test_empty_result_writes_header(self):
+        path = os.path.join(self.test_dir, 'empty.csv')
+        self.env['path'] = path
+        count = eval_lipi_expr('db_export_csv(db, "SELECT * FROM users WHERE id > 99", path)', self.env)
+        self.assertEqual(count, 0)
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(f.read().strip(), 'id,name')
+
+    def test_invalid_connection(self):
+        self.env['path'] = os.path.join(self.test_dir, 'x.csv')
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('db_export_csv("db_missing", "SELECT 1", path)', self.env)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the Lipi v3.0 embedding API
+Tests compile_program() / run() / call() with compiled, reusable programs
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.lipi as lipi
+from src.lipi import LipiRuntime, LipiProgram, LipiException
+
+RULES = '''
+# Discount rules
+threshold = 100
+
+function discount(order):
+    if order.total > threshold:
+        return order.total / 10
+    end
+    return 0
+end
+
+పనిచేయి స్థాయి(order):
+    రిటర్న్ order.customer + ":" + str(call discount(order))
+ముగింపు
+
+async function slow_double(x):
+    return x * 2
+end
+'''
+
+
+class TestEmbeddingAPI(unittest.TestCase):
+    """Test lipi.compile_program / lipi.run / lipi.call"""
+
+    def setUp(self):
+        self.program = lipi.compile_program(RULES, 'rules.lipi')
+        self.rt = LipiRuntime()
+
+    def tearDown(self):
+        self.rt.close()
+
+    def test_compile_returns_immutable_program(self):
+        self.assertIsInstance(self.program, LipiProgram)
+        self.assertIsInstance(self.program.lines, tuple)
+        self.assertNotIn('# Discount rules', self.program.lines)
+        self.assertNotIn('', self.program.lines)
+        with self.assertRaises(AttributeError):
+            self.program.lines = ()
+        with self.assertRaises(LipiException):
+            lipi.compile_program(['not', 'text'])
+
+    def test_run_with_fresh_inputs(self):
+        program = lipi.compile_program('total = price * qty')
+        for qty in range(1, 4):
+            env = lipi.run(program, {'price': 5, 'qty': qty}, runtime=self.rt)
+            self.assertEqual(env['total'], 5 * qty)
+
+    def test_call_reuses_top_level(self):
+        self.assertEqual(lipi.call(self.program, 'discount', {'total': 250}, runtime=self.rt), 25)
+        self.assertEqual(lipi.call(self.program, 'discount', {'total': 50}, runtime=self.rt), 0)
+        self.assertEqual(lipi.call(self.program, 'స్థాయి', {'customer': 'రాము', 'total': 500}, runtime=self.rt),
+                         'రాము:50.0')
+        self.assertEqual(len(self.rt.program_envs), 1)
+
+    def test_programs_keep_their_own_functions(self):
+        """Two programs defining the same function name share a runtime"""
+        a = lipi.compile_program('function main():\n    return "A"\nend')
+        b = lipi.compile_program('function main():\n    return "B"\nend')
+        for rt in (self.rt, None):
+            self.assertEqual(lipi.call(a, 'main', runtime=rt), 'A')
+            self.assertEqual(lipi.call(b, 'main', runtime=rt), 'B')
+            self.assertEqual(lipi.call(a, 'main', runtime=rt), 'A')
+        self.assertNotIn('main', self.rt.functions)
+
+    def test_call_awaits_async_functions(self):
+        self.assertEqual(lipi.call(self.program, 'slow_double', 21, runtime=self.rt), 42)
+
+    def test_call_errors(self):
+        with self.assertRaises(LipiException):
+            lipi.call(self.program, 'missing', runtime=self.rt)
+        with self.assertRaises(LipiException):
+            lipi.call(self.program, 'discount', runtime=self.rt)
+
+    def test_one_program_many_runtimes(self):
+        def evaluate(total):
+            rt = LipiRuntime()
+            try:
+                return lipi.call(self.program, 'discount', {'total': total}, runtime=rt)
+            finally:
+                rt.close()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(evaluate, [50, 200, 300, 1000]))
+        self.assertEqual(results, [0, 20, 30, 100])
+
+    def test_filename_resolves_imports(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(test_dir, 'tax.lipi.py'), 'w', encoding='utf-8') as f:
+                f.write('function tax(x):\n    return x / 5\nend\nexport tax\n')
+            program = lipi.compile_program('import tax from "tax"\nfunction net(x):\n    return x - call tax(x)\nend',
+                                   os.path.join(test_dir, 'main.lipi.py'))
+            self.assertEqual(lipi.call(program, 'net', 100, runtime=self.rt), 80)
+        finally:
+            shutil.rmtree(test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
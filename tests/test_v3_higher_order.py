@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 higher-order built-ins
+Tests lambdas and map / filter / reduce / sum / min / max / any / all
+over lists and streaming iterators
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import runtime, execute_block, eval_lipi_expr, LipiException, LipiLambda
+
+
+class TestLambdas(unittest.TestCase):
+    """Test lambda / లాంబ్డా"""
+
+    def test_lambda_values(self):
+        env = {'factor': 3}
+        execute_block([
+            'triple = lambda x: x * factor',
+            'add = lambda(a, b): a + b',
+            'కూడిక = లాంబ్డా x: x + 1',
+            'r1 = call triple(4)',
+            'r2 = call add(2, 5)',
+            'r3 = కాల్ కూడిక(1)',
+            'lambda_count = 7',
+        ], env)
+        self.assertIsInstance(env['triple'], LipiLambda)
+        self.assertEqual((env['r1'], env['r2'], env['r3']), (12, 7, 2))
+        self.assertEqual(env['lambda_count'], 7)
+        # Parameters do not leak into the defining scope
+        self.assertNotIn('x', env)
+
+    def test_invalid_lambdas(self):
+        for bad in ['lambda x', 'lambda x:', 'lambda 1: 2']:
+            with self.assertRaises(LipiException):
+                eval_lipi_expr(bad, {})
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('lambda x: x', {})(1, 2)
+
+
+class TestHigherOrderBuiltins(unittest.TestCase):
+    """Test map / filter / reduce and the aggregations"""
+
+    def setUp(self):
+        runtime.functions.clear()
+        self.env = {'xs': [1, 2, 3, 4, 5], 'rows': [{'n': 'a', 'v': 3}, {'n': 'b', 'v': 9}]}
+        execute_block([
+            'function add(a, b):',
+            '    return a + b',
+            'end',
+            'function is_odd(x):',
+            '    return x % 2 == 1',
+            'end',
+        ], self.env)
+
+    def test_map_filter_reduce(self):
+        self.assertEqual(eval_lipi_expr('map(lambda x: x * x, xs)', self.env), [1, 4, 9, 16, 25])
+        self.assertEqual(eval_lipi_expr('filter(is_odd, xs)', self.env), [1, 3, 5])
+        self.assertEqual(eval_lipi_expr('వడపోత("is_odd", xs)', self.env), [1, 3, 5])
+        self.assertEqual(eval_lipi_expr('reduce(add, xs)', self.env), 15)
+        self.assertEqual(eval_lipi_expr('కుదించు(lambda(a, b): a * b, xs, 10)', self.env), 1200)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('reduce(add, [])', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('map(undefined_function, xs)', self.env)
+
+    def test_aggregations(self):
+        self.assertEqual(eval_lipi_expr('sum(xs)', self.env), 15)
+        self.assertEqual(eval_lipi_expr('మొత్తం(rows, "v")', self.env), 12)
+        self.assertEqual(eval_lipi_expr('sum(rows, lambda r: r.v * 2)', self.env), 24)
+        self.assertEqual(eval_lipi_expr('min(xs)', self.env), 1)
+        self.assertEqual(eval_lipi_expr('గరిష్ఠం(rows, "v")', self.env), {'n': 'b', 'v': 9})
+        self.assertIs(eval_lipi_expr('any(xs, lambda x: x > 4)', self.env), True)
+        self.assertIs(eval_lipi_expr('అన్నీ(xs, lambda x: x > 4)', self.env), False)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('max([])', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('sum(["a", "b"])', self.env)
+
+    def test_lazy_over_iterators(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(test_dir, 'sales.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('item,qty\n' + ''.join(f'i{n},{n}\n' for n in range(1, 101)))
+            self.env['path'] = path
+            execute_block([
+                'big = filter(lambda r: r.qty > 90, csv_iter(path, {qty: "int"}))',
+                'doubled = map(lambda r: r.qty * 2, big)',
+                'total = sum(doubled)',
+                'first = any(csv_iter(path, {qty: "int"}), lambda r: r.qty < 2)',
+            ], self.env)
+            self.assertEqual(self.env['total'], 2 * sum(range(91, 101)))
+            self.assertIs(self.env['first'], True)
+            # Iterator inputs give lazy iterators, not lists
+            lazy = eval_lipi_expr('map(lambda r: r, csv_iter(path))', self.env)
+            self.assertNotIsInstance(lazy, list)
+            self.assertEqual(next(lazy)['item'], 'i1')
+        finally:
+            shutil.rmtree(test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
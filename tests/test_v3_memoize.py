@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 memoization
+Tests cached function / స్మృతి పనిచేయి, memoize, cache_info and cache_clear
+"""
+
+import unittest
+import os
+import sys
+import pickle
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import (runtime, execute_block, eval_lipi_expr, LipiException, LipiFunctionCache,
+                      snapshot_for_workers)
+
+
+class TestMemoization(unittest.TestCase):
+    """Test cached functions and the memoize built-ins"""
+
+    def setUp(self):
+        runtime.functions.clear()
+        self.env = {}
+
+    def test_cached_recursive_function(self):
+        execute_block([
+            'cached function fib(n):',
+            '    if n < 2:',
+            '        return n',
+            '    end',
+            '    a = call fib(n - 1)',
+            '    b = call fib(n - 2)',
+            '    return a + b',
+            'end',
+            'x = call fib(60)',
+            'info = cache_info(fib)',
+        ], self.env)
+        self.assertEqual(self.env['x'], 1548008755920)
+        # Each subproblem is computed once
+        self.assertEqual(self.env['info'], {'hits': 58, 'misses': 61, 'maxsize': 128, 'currsize': 61})
+
+    def test_telugu_syntax_and_aliases(self):
+        execute_block([
+            'స్మృతి పనిచేయి చతురస్రం(n):',
+            '    రిటర్న్ n * n',
+            'ముగింపు',
+            'a = కాల్ చతురస్రం(4)',
+            'b = కాల్ చతురస్రం(4)',
+            'సమాచారం = కాష్_సమాచారం("చతురస్రం")',
+        ], self.env)
+        self.assertEqual((self.env['a'], self.env['b']), (16, 16))
+        self.assertEqual(self.env['సమాచారం']['hits'], 1)
+        eval_lipi_expr('కాష్_తుడువు(చతురస్రం)', self.env)
+        self.assertEqual(eval_lipi_expr('cache_info(చతురస్రం)', self.env)['currsize'], 0)
+
+    def test_memoize_lru_eviction(self):
+        execute_block([
+            'calls = accumulator()',
+            'function slow(n):',
+            '    accumulate(calls, n)',
+            '    return n + 1',
+            'end',
+            'memoize(slow, 2)',
+        ], self.env)
+        for n in [1, 2, 1, 3, 2, 1]:
+            eval_lipi_expr(f'call slow({n})', self.env)
+        # 3 evicts 2 (1 was used more recently); 2 then evicts 1
+        self.assertEqual(self.env['calls'], [1, 2, 3, 2, 1])
+        info = eval_lipi_expr('cache_info(slow)', self.env)
+        self.assertEqual((info['hits'], info['misses'], info['currsize']), (1, 5, 2))
+        eval_lipi_expr('cache_clear(slow)', self.env)
+        self.assertEqual(eval_lipi_expr('cache_info(slow)', self.env)['hits'], 0)
+
+    def test_unhashable_arguments_bypass_cache(self):
+        execute_block([
+            'cached function total(xs):',
+            '    return len(xs)',
+            'end',
+            'a = call total([1, 2])',
+            'b = call total([1, 2, 3])',
+        ], self.env)
+        self.assertEqual((self.env['a'], self.env['b']), (2, 3))
+        self.assertEqual(eval_lipi_expr('cache_info(total)', self.env)['currsize'], 0)
+
+    def test_variable_named_cached_in_bodies(self):
+        """A body line like `cached = x * 2` is not a block opener"""
+        execute_block([
+            'function f(x):',
+            '    cached = x * 2',
+            '    return cached',
+            'end',
+            'class Box:',
+            '    function __init__(self):',
+            '        స్మృతి = 7',
+            '        self.n = స్మృతి',
+            '    end',
+            'end',
+            'y = call f(3)',
+            'b = Box()',
+            'n = b.n',
+        ], self.env)
+        self.assertEqual((self.env['y'], self.env['n']), (6, 7))
+
+    def test_errors(self):
+        execute_block(['function plain(x):', '    return x', 'end'], self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('cache_info(plain)', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('memoize(plain, -1)', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('memoize(missing)', self.env)
+        with self.assertRaises(LipiException):
+            execute_block(['cached async function f():', '    return 1', 'end'], self.env)
+        with self.assertRaises(LipiException):
+            execute_block(['class C:', '    cached function m(self):', '        return 1', '    end', 'end'], self.env)
+
+    def test_cache_pickles_empty(self):
+        cache = LipiFunctionCache(None)
+        cache.call([1], lambda: 2)
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(copy.info(), {'hits': 0, 'misses': 0, 'maxsize': None, 'currsize': 0})
+        execute_block(['cached function f(x):', '    return x', 'end'], self.env)
+        pickle.dumps(snapshot_for_workers(self.env))
+
+
+if __name__ == '__main__':
+    unittest.main()
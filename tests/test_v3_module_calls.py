@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 Python module call sites
+Tests the per-call-site function cache, argument splitting and the
+dunder guard for calls on modules loaded with import_python
+"""
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import (runtime, LipiRuntime, execute_block, eval_lipi_expr, LipiException,
+                      MODULE_CALL_CACHE)
+
+
+class TestModuleCallSites(unittest.TestCase):
+    """Test math.sqrt(x)-style calls"""
+
+    def setUp(self):
+        runtime.python_modules.clear()
+        MODULE_CALL_CACHE.clear()
+        self.env = {'xs': [4.0, 9.0], 'x': 16}
+        execute_block(['import_python("math")', 'import_python("json")'], self.env)
+
+    def test_calls_and_arguments(self):
+        self.assertEqual(eval_lipi_expr('math.sqrt(x)', self.env), 4.0)
+        self.assertEqual(eval_lipi_expr('math.sqrt(math.pow(2, 2))', self.env), 2.0)
+        self.assertEqual(eval_lipi_expr('math.sqrt(xs[1])', self.env), 3.0)
+        self.assertEqual(eval_lipi_expr('json.dumps({a: "x, y"})', self.env), '{"a": "x, y"}')
+        self.assertEqual(eval_lipi_expr('math.pi', self.env), eval_lipi_expr('math.acos(-1)', self.env))
+
+    def test_call_inside_larger_expression(self):
+        self.assertEqual(eval_lipi_expr('math.sqrt(x) + 1', self.env), 5.0)
+        self.assertEqual(eval_lipi_expr('2 * math.floor(2.5)', self.env), 4)
+
+    def test_call_site_cached(self):
+        execute_block([
+            'total = 0',
+            'for v in [1, 4, 9]:',
+            '    r = math.sqrt(v)',
+            '    total = total + r',
+            'end',
+        ], self.env)
+        self.assertEqual(self.env['total'], 6.0)
+        module_name, module, func, arg_exprs = MODULE_CALL_CACHE['math.sqrt(v)']
+        self.assertEqual((module_name, func.__name__, arg_exprs), ('math', 'sqrt', ('v',)))
+
+    def test_other_runtime_must_import(self):
+        eval_lipi_expr('math.sqrt(x)', self.env)
+        rt = LipiRuntime()
+        with self.assertRaises(Exception):
+            rt.run_source('r = math.sqrt(4)')
+        self.assertEqual(rt.run_source(['import_python("math")', 'r = math.sqrt(4)'])['r'], 2.0)
+
+    def test_guards(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('math.__import__(x)', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('math.no_such_function(x)', self.env)
+
+
+if __name__ == '__main__':
+    unittest.main()
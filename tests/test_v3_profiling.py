@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 profiling and instrumentation
+Tests the exact line/function profiler (--profile), the memory profiler
+(--memprofile), the sampler, trace hooks and runtime statistics
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+from io import StringIO
+from contextlib import redirect_stdout, redirect_stderr
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import (LipiRuntime, LipiProfiler, LipiSampler, LipiMemoryProfiler, RuntimeStats, SourceLine, ERROR_LANGUAGE,
+                      compile_program, run, main, LipiException)
+
+SCRIPT = '\n'.join([
+    'function fib(n):',
+    '    if n < 2:',
+    '        return n',
+    '    end',
+    '    a = call fib(n - 1)',
+    '    b = call fib(n - 2)',
+    '    return a + b',
+    'end',
+    'class Greeter:',
+    '    function hello(self, name):',
+    '        return "నమస్తే " + name',
+    '    end',
+    'end',
+    'g = Greeter()',
+    'x = call fib(8)',
+    'msg = call g.hello("రాము")',
+])
+
+
+class TestLineProfiler(unittest.TestCase):
+    """Test LipiProfiler / --profile"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, 'fib.lipi.py')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(SCRIPT + '\n')
+
+    def tearDown(self):
+        ERROR_LANGUAGE[0] = 'en'
+        shutil.rmtree(self.test_dir)
+
+    def profile(self):
+        rt = LipiRuntime()
+        rt.profiler = LipiProfiler()
+        env = rt.run_source(SCRIPT, path=self.path)
+        self.assertEqual(env['x'], 21)
+        return rt.profiler.to_dict()
+
+    def test_source_lines_keep_location(self):
+        line = SourceLine('    x = 1', 'a.lipi.py', 3)
+        self.assertEqual(line.strip(), 'x = 1')
+        self.assertEqual((line.strip().filename, line.strip().lineno), ('a.lipi.py', 3))
+        program = compile_program('\n# note\ny = 2', 'b.lipi')
+        self.assertEqual(program.lines[0].lineno, 3)
+
+    def test_line_hits_and_locations(self):
+        data = self.profile()
+        by_line = {entry['line']: entry for entry in data['lines']}
+        self.assertEqual(by_line[2]['hits'], 67)  # fib(8) makes 67 calls
+        self.assertEqual(by_line[5]['hits'], 33)
+        self.assertEqual(by_line[3]['source'], 'return n')
+        self.assertEqual(by_line[15]['file'], self.path)
+        # Block lines include their body, so the caller line dominates
+        self.assertEqual(data['lines'][0]['line'], 15)
+
+    def test_function_and_method_totals(self):
+        data = self.profile()
+        by_name = {entry['name']: entry for entry in data['functions']}
+        self.assertEqual(by_name['fib']['calls'], 67)
+        self.assertEqual(by_name['Greeter.hello']['calls'], 1)
+        # Recursive time is counted once per outermost call
+        line_15 = next(e for e in data['lines'] if e['line'] == 15)
+        self.assertLessEqual(by_name['fib']['seconds'], line_15['seconds'])
+
+    def test_program_lines_profiled(self):
+        rt = LipiRuntime()
+        rt.profiler = LipiProfiler()
+        run(compile_program('a = 1\nb = a + 1', 'inline.lipi'), runtime=rt)
+        self.assertEqual({e['line'] for e in rt.profiler.to_dict()['lines']}, {1, 2})
+
+    def test_cli_bilingual_report_and_json(self):
+        output = os.path.join(self.test_dir, 'profile.json')
+        err = StringIO()
+        with redirect_stdout(StringIO()), redirect_stderr(err):
+            main([self.path, '--profile', '--profile-output', output, '--lang', 'te'])
+        self.assertIn('లైన్ ప్రొఫైల్', err.getvalue())
+        self.assertIn('fib.lipi.py:15', err.getvalue())
+        with open(output, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['functions'][0]['name'], 'fib')
+
+    def test_cli_profilers_are_exclusive(self):
+        for flags in (['--profile', '--memprofile'], ['--profile', '--sample'], ['--memprofile', '--sample']):
+            with redirect_stderr(StringIO()) as err, self.assertRaises(SystemExit):
+                main([self.path] + flags)
+            self.assertIn('not allowed with argument', err.getvalue())
+
+
+BUSY_SCRIPT = '\n'.join([
+    'function work(n):',
+    '    s = 0',
+    '    i = 0',
+    '    while i < n:',
+    '        s = s + i',
+    '        i = i + 1',
+    '    end',
+    '    return s',
+    'end',
+    'function outer():',
+    '    return call work(3000)',
+    'end',
+    'x = call outer()',
+])
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    """Test LipiMemoryProfiler / --memprofile"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        ERROR_LANGUAGE[0] = 'en'
+        shutil.rmtree(self.test_dir)
+
+    def write(self, name, text):
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_attributes_growth_to_module_lines(self):
+        module_path = self.write('store.lipi.py', '\n'.join([
+            'function fill(n):',
+            '    items = accumulator()',
+            '    i = 0',
+            '    while i < n:',
+            '        accumulate(items, "record number " + str(i))',
+            '        i = i + 1',
+            '    end',
+            '    return items',
+            'end',
+            'export fill',
+        ]) + '\n')
+        rt = LipiRuntime()
+        profiler = rt.profiler = LipiMemoryProfiler()
+        profiler.start()
+        try:
+            env = rt.run_source([
+                'import fill from "store"',
+                'kept = call fill(2000)',
+                'marker = memory_snapshot("filled")',
+                'size = len(kept)',
+            ], path=os.path.join(self.test_dir, 'main.lipi.py'))
+        finally:
+            profiler.stop()
+        self.assertEqual(env['size'], 2000)
+        self.assertIsInstance(env['marker'], int)
+        data = profiler.to_dict()
+        top = data['lines'][0]
+        self.assertEqual((top['file'], top['line'], top['hits']), (module_path, 5, 2000))
+        self.assertGreater(top['bytes'], 2000 * 50)
+        self.assertEqual(data['functions'][0]['name'], 'fill')
+        self.assertGreater(data['functions'][0]['bytes'], 2000 * 50)
+        self.assertEqual([(g['from'], g['to']) for g in data['growth']], [('start', 'filled'), ('filled', 'end')])
+        self.assertTrue(data['growth'][0]['sites'])
+
+    def test_snapshot_is_noop_when_off(self):
+        env = LipiRuntime().run_source('m = మెమరీ_చిత్రం("x")')
+        self.assertIsNone(env['m'])
+
+    def test_cli_report_and_json(self):
+        path = self.write('m.lipi.py', 'text = ""\nfor x in [1, 2, 3]:\n    text = text + "abc"\nend\n')
+        output = os.path.join(self.test_dir, 'mem.json')
+        err = StringIO()
+        with redirect_stderr(err):
+            main([path, '--memprofile', '--memprofile-output', output, '--lang', 'te'])
+        self.assertIn('నిలిచిన మెమరీ ప్రకారం Lipi లైన్లు', err.getvalue())
+        with open(output, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual({entry['line'] for entry in data['lines']}, {1, 2, 3})
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test LipiSampler / --sample"""
+
+    def test_stack_frames_and_folding(self):
+        sampler = LipiSampler()
+        sampler.push('main.lipi.py')
+        sampler.set_line(SourceLine('x = call f()', 'main.lipi.py', 4))
+        sampler.push('f')
+        sampler.set_line(SourceLine('y = 1', 'main.lipi.py', 2))
+        sampler.take_sample()
+        sampler.take_sample()
+        sampler.pop()
+        sampler.take_sample()
+        self.assertEqual(sampler.folded(), 'main.lipi.py:4;f:2 2\nmain.lipi.py:4 1\n')
+
+    def test_samples_running_program(self):
+        rt = LipiRuntime()
+        sampler = LipiSampler(rate=1000)
+        rt.sampler = sampler
+        sampler.push('busy.lipi.py')
+        sampler.start()
+        try:
+            rt.run_source(BUSY_SCRIPT)
+        finally:
+            sampler.stop()
+            sampler.pop()
+        heaviest = max(sampler.samples, key=sampler.samples.get)
+        self.assertTrue(heaviest.startswith('busy.lipi.py:13;outer:11;work:'), heaviest)
+        for stack in sampler.samples:
+            self.assertTrue(stack.startswith('busy.lipi.py:'), stack)
+
+    def test_parallel_for_workers_sampled(self):
+        rt = LipiRuntime()
+        sampler = LipiSampler()
+        rt.sampler = sampler
+        seen = []
+        rt.python_modules['probe'] = type('Probe', (), {'snap': staticmethod(
+            lambda: seen.append(list(map(list, sampler.local.stack))) or 0)})
+        rt.run_source(['parallel for x in [1]:', '    r = probe.snap()', 'end'])
+        self.assertEqual(seen, [[['<parallel for>', 2]]])
+        # Finished worker stacks are unregistered, so they are neither kept nor sampled
+        self.assertEqual(sampler.stacks, {})
+        rt.run_source(['parallel for x in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:', '    r = x', 'end'])
+        self.assertEqual(sampler.stacks, {})
+        sampler.take_sample()
+        self.assertEqual(sampler.samples, {})
+
+    def test_invalid_rate(self):
+        with self.assertRaises(LipiException):
+            LipiSampler(rate=0)
+
+    def test_cli_writes_folded_file(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(test_dir, 'busy.lipi.py')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(BUSY_SCRIPT + '\n')
+            output = os.path.join(test_dir, 'out.folded')
+            with redirect_stderr(StringIO()):
+                main([path, '--sample', '--sample-rate', '1000', '--sample-output', output])
+            with open(output, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.assertTrue(lines)
+            stack, count = lines[0].rsplit(' ', 1)
+            self.assertTrue(stack.startswith('busy.lipi.py:13;outer:11;work:'))
+            self.assertGreater(int(count), 0)
+        finally:
+            shutil.rmtree(test_dir)
+
+
+class TestTraceHook(unittest.TestCase):
+    """Test LipiRuntime.set_trace"""
+
+    def setUp(self):
+        self.rt = LipiRuntime()
+        self.events = []
+        self.rt.set_trace(lambda event, target, value: self.events.append((event, target, value)))
+
+    def test_line_call_return_events(self):
+        self.rt.run_source('\n'.join([
+            'function add(a, b):',
+            '    return a + b',
+            'end',
+            'class Box:',
+            '    function size(self):',
+            '        return 3',
+            'end',
+            'end',
+            'x = call add(1, 2)',
+            'b = Box()',
+            'n = call b.size()',
+        ]), path='trace.lipi.py')
+        calls = [(e, t, v) for e, t, v in self.events if e in ('call', 'return')]
+        self.assertEqual([(e, t) for e, t, _ in calls],
+                         [('call', 'add'), ('return', 'add'), ('call', 'Box.size'), ('return', 'Box.size')])
+        self.assertEqual(calls[0][2]['a'], 1)
+        self.assertEqual(calls[1][2], 3)
+        line_numbers = [t.lineno for e, t, _ in self.events if e == 'line']
+        self.assertEqual(line_numbers, [1, 4, 9, 2, 10, 11, 6])
+        self.assertTrue(all(t.filename.endswith('trace.lipi.py') for e, t, _ in self.events if e == 'line'))
+
+    def test_exception_reported_once_at_source(self):
+        self.rt.run_source('\n'.join([
+            'function boom():',
+            '    if true:',
+            '        x = missing_name',
+            '    end',
+            'end',
+            'try:',
+            '    y = call boom()',
+            'catch err:',
+            '    handled = true',
+            'end',
+        ]))
+        exceptions = [(t, v) for e, t, v in self.events if e == 'exception']
+        self.assertEqual(len(exceptions), 1)
+        self.assertEqual(exceptions[0][0].lineno, 3)
+        self.assertIn(('return', 'boom', None), self.events)
+
+    def test_trace_removed(self):
+        self.rt.set_trace(None)
+        self.rt.run_source('x = 1')
+        self.assertEqual(self.events, [])
+        with self.assertRaises(LipiException):
+            self.rt.set_trace('not callable')
+
+
+class TestRuntimeStats(unittest.TestCase):
+    """Test RuntimeStats / --stats"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        ERROR_LANGUAGE[0] = 'en'
+        shutil.rmtree(self.test_dir)
+
+    def test_counters(self):
+        with open(os.path.join(self.test_dir, 'helper.lipi.py'), 'w', encoding='utf-8') as f:
+            f.write('function inc(x):\n    return x + 1\nend\nexport inc\n')
+        rt = LipiRuntime()
+        rt.stats = RuntimeStats()
+        env = {'dir': self.test_dir}
+        try:
+            rt.run_source([
+                'import inc from "helper"',
+                'import inc from "helper"',
+                'class P:',
+                '    function get(self):',
+                '        return 1',
+                '    end',
+                'end',
+                'p = P()',
+                'a = call inc(1)',
+                'b = call p.get()',
+                'db = db_connect(dir + "/s.db")',
+                'db_query(db, "CREATE TABLE t (x INTEGER)")',
+                'db_query(db, "INSERT INTO t VALUES (1), (2)")',
+                'rows = db_query(db, "SELECT * FROM t")',
+                'file_write(dir + "/out.txt", "నమస్తే")',
+                'text = file_read(dir + "/out.txt")',
+            ], env, path=os.path.join(self.test_dir, 'main.lipi.py'))
+        finally:
+            rt.close()
+        data = rt.stats.as_dict()
+        self.assertEqual(data['function_calls'], 1)
+        self.assertEqual(data['method_calls'], 1)
+        self.assertEqual(data['statements'], 12 + 3)  # top level + module def + two function bodies
+        self.assertGreater(data['expressions'], data['statements'])
+        self.assertEqual(data['module_cache_hits'], 1)
+        self.assertEqual(data['db_queries'], 3)
+        self.assertEqual(data['db_rows'], 2)
+        self.assertEqual(data['file_writes'], 1)
+        self.assertEqual(data['file_reads'], 1 + 1)  # module source + file_read
+        self.assertGreaterEqual(data['env_copies'], 4)
+
+    def test_disabled_by_default(self):
+        rt = LipiRuntime()
+        rt.run_source('x = 1')
+        self.assertIsNone(rt.stats)
+
+    def test_cli_report_and_json(self):
+        path = os.path.join(self.test_dir, 's.lipi.py')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('x = 1 + 2\n')
+        output = os.path.join(self.test_dir, 'stats.json')
+        err = StringIO()
+        with redirect_stderr(err):
+            main([path, '--stats', '--stats-output', output, '--lang', 'te'])
+        self.assertIn('రన్‌టైమ్ గణాంకాలు', err.getvalue())
+        with open(output, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['statements'], 1)
+        self.assertIn('cpu_seconds', data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 regular expression built-ins
+Tests regex_match / regex_find_all / regex_iter / regex_sub / regex_split
+and the compiled pattern cache
+"""
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import execute_block, eval_lipi_expr, LipiException, compile_regex
+
+
+class TestRegexBuiltins(unittest.TestCase):
+    """Test the regex built-ins and their Telugu aliases"""
+
+    def setUp(self):
+        self.env = {'line': '2024-01-05 ERROR [db] timeout after 30s, user=ram'}
+
+    def test_match(self):
+        execute_block([
+            'm = regex_match("(?P<date>\\d+-\\d+-\\d+) (\\w+)", line)',
+            'level = m.groups[1]',
+            'date = m.date',
+            'missing = నమూనా_సరిపోలు("zzz", line)',
+        ], self.env)
+        self.assertEqual(self.env['m']['text'], '2024-01-05 ERROR')
+        self.assertEqual((self.env['m']['start'], self.env['m']['end']), (0, 16))
+        self.assertEqual((self.env['level'], self.env['date']), ('ERROR', '2024-01-05'))
+        self.assertIsNone(self.env['missing'])
+
+    def test_find_all_and_iter(self):
+        self.assertEqual(eval_lipi_expr('regex_find_all("\\d+", line)', self.env), ['2024', '01', '05', '30'])
+        self.assertEqual(eval_lipi_expr('నమూనా_అన్నీ("(\\w+)=(\\w+)", line)', self.env), [['user', 'ram']])
+        hits = eval_lipi_expr('regex_iter("\\[(\\w+)\\]", line)', self.env)
+        self.assertNotIsInstance(hits, list)
+        self.assertEqual([hit['groups'] for hit in hits], [['db']])
+        execute_block([
+            'count = 0',
+            'for hit in నమూనా_ప్రవాహం("\\d+", line):',
+            '    count = count + 1',
+            'end',
+        ], self.env)
+        self.assertEqual(self.env['count'], 4)
+
+    def test_sub_and_split(self):
+        self.assertEqual(eval_lipi_expr('regex_sub("\\d", "#", "a1b22")', self.env), 'a#b##')
+        self.assertEqual(eval_lipi_expr('regex_sub("\\d", "#", "a1b22", 1)', self.env), 'a#b22')
+        self.assertEqual(eval_lipi_expr('నమూనా_మార్చు("(\\w+)=(\\w+)", "\\2:\\1", "k=v")', self.env), 'v:k')
+        self.assertEqual(eval_lipi_expr('regex_split(",\\s*", "a, b,c")', self.env), ['a', 'b', 'c'])
+        self.assertEqual(eval_lipi_expr('నమూనా_విభజించు(" ", line, 2)', self.env)[:2], ['2024-01-05', 'ERROR'])
+
+    def test_patterns_compiled_once(self):
+        compile_regex.cache_clear()
+        for _ in range(5):
+            eval_lipi_expr('regex_find_all("[a-z]+=", line)', self.env)
+        info = compile_regex.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 4))
+
+    def test_errors(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('regex_match("(unclosed", line)', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('regex_match(5, line)', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('regex_find_all("a", 5)', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('regex_sub("a", "\\9", "a")', self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('regex_split("a")', self.env)
+
+    def test_count_arguments_validated(self):
+        for bad in ['regex_sub("a", "b", "aaa", "x")', 'regex_sub("a", "b", "aaa", -1)',
+                    'regex_sub("a", "b", "aaa", 1.5)', 'regex_split(",", "a,b", true)',
+                    'నమూనా_విభజించు(",", "a,b", "2")']:
+            with self.assertRaises(LipiException):
+                eval_lipi_expr(bad, self.env)
+        self.assertEqual(eval_lipi_expr('regex_split(",", "a,b,c", 1)', self.env), ['a', 'b,c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
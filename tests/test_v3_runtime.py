@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 instance-scoped runtimes
+Tests isolation between LipiRuntime instances, per-runtime error language
+and the shared module source cache
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import (runtime, LipiRuntime, ModuleSourceCache, get_runtime, use_runtime,
+                      get_error_message, eval_lipi_expr, LipiException)
+
+
+class TestRuntimeIsolation(unittest.TestCase):
+    """Test LipiRuntime instances bound with use_runtime / run_source"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_functions_do_not_leak(self):
+        rt_a, rt_b = LipiRuntime(), LipiRuntime()
+        rt_a.run_source('function greet():\n    return "A"\nend')
+        rt_b.run_source('function greet():\n    return "B"\nend')
+        self.assertEqual(rt_a.run_source('r = call greet()')['r'], 'A')
+        self.assertEqual(rt_b.run_source('r = call greet()')['r'], 'B')
+        self.assertNotIn('greet', get_runtime().functions)
+
+    def test_use_runtime_binds_module_proxy(self):
+        rt = LipiRuntime()
+        with use_runtime(rt):
+            self.assertIs(get_runtime(), rt)
+            runtime.functions['marker'] = {'params': [], 'body': []}
+        self.assertIn('marker', rt.functions)
+        self.assertIsNot(get_runtime(), rt)
+
+    def test_concurrent_scripts_on_thread_pool(self):
+        """Many runtimes run the same names on a thread pool without clobbering"""
+        source = '\n'.join([
+            'class Counter:',
+            '    function __init__(self, start):',
+            '        self.n = start',
+            '    end',
+            'end',
+            'function total(xs):',
+            '    s = 0',
+            '    for x in xs:',
+            '        s = s + x',
+            '    end',
+            '    return s',
+            'end',
+            'c = Counter(tenant)',
+            'parallel for i in [1, 2, 3]:',
+            '    r = call total([i])',
+            'end',
+            'result = call total([c.n, tenant, 1])',
+        ])
+
+        def run_tenant(tenant):
+            rt = LipiRuntime()
+            try:
+                return rt.run_source(source, {'tenant': tenant})['result']
+            finally:
+                rt.close()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run_tenant, range(32)))
+        self.assertEqual(results, [2 * t + 1 for t in range(32)])
+
+    def test_error_language_per_runtime(self):
+        telugu = LipiRuntime(error_language='te')
+        with use_runtime(telugu):
+            self.assertTrue(get_error_message('file_error').startswith('[లోపం]'))
+        self.assertTrue(get_error_message('file_error').startswith('[Error]'))
+
+    def test_executor_threads_see_bound_runtime(self):
+        """Async built-ins running on the loop's thread pool use the bound runtime"""
+        rt = LipiRuntime()
+        try:
+            env = rt.run_source([
+                'db = db_connect(path)',
+                'db_query(db, "CREATE TABLE t (x INTEGER)")',
+                'rows = await db_query_async(db, "SELECT COUNT(*) AS n FROM t")',
+            ], {'path': os.path.join(self.test_dir, 'tenant.db')})
+            self.assertEqual(env['rows'], [{'n': 0}])
+            self.assertNotIn(env['db'], get_runtime().db_connections)
+            with self.assertRaises(LipiException):
+                eval_lipi_expr('await db_query_async(db, "SELECT 1")', env)
+        finally:
+            rt.close()
+
+    def test_module_cache_shared_between_runtimes(self):
+        module_path = os.path.join(self.test_dir, 'util.lipi.py')
+        with open(module_path, 'w', encoding='utf-8') as f:
+            f.write('function twice(x):\n    return x * 2\nend\nexport twice\n')
+
+        cache = ModuleSourceCache()
+        results = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run_tenant():
+            rt = LipiRuntime(module_cache=cache)
+            barrier.wait()
+            env = rt.run_source(['import twice from "util"', 'r = call twice(21)'],
+                                path=os.path.join(self.test_dir, 'main.lipi.py'))
+            results.append((env['r'], list(rt.loaded_modules)))
+
+        threads = [threading.Thread(target=run_tenant) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([r for r, _ in results], [42, 42])
+        self.assertEqual(results[0][1], [module_path])
+        self.assertEqual(list(cache._entries), [module_path])
+
+        # Editing the file invalidates the cached source
+        with open(module_path, 'w', encoding='utf-8') as f:
+            f.write('function twice(x):\n    return x * 20\nend\nexport twice\n')
+        os.utime(module_path, ns=(0, 1))
+        lines, exports = cache.get(module_path)
+        self.assertIn('    return x * 20', lines)
+        self.assertEqual(exports, ('twice',))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 streaming readers
+Tests csv_iter / jsonl_iter typed row iterators and db_insert_many
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+import types
+from io import StringIO
+from contextlib import redirect_stdout
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import runtime, eval_lipi_expr, execute_block, LipiException
+
+
+class TestStreamingReaders(unittest.TestCase):
+    """Test csv_iter / jsonl_iter"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.test_dir, 'people.csv')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write('name,age,score,active\n')
+            f.write('రాము,30,88.5,true\n')
+            f.write('"Sita, Devi",28,,false\n')
+        self.jsonl_path = os.path.join(self.test_dir, 'events.jsonl')
+        with open(self.jsonl_path, 'w', encoding='utf-8') as f:
+            f.write('{"id": "1", "kind": "click", "extra": 5}\n')
+            f.write('\n')
+            f.write('{"id": "2", "kind": "view", "extra": 7}\n')
+        self.env = {'csv_path': self.csv_path, 'jsonl_path': self.jsonl_path}
+
+    def tearDown(self):
+        for conn in runtime.db_connections.values():
+            conn.close()
+        runtime.db_connections.clear()
+        shutil.rmtree(self.test_dir)
+
+    def test_csv_iter_is_lazy(self):
+        rows = eval_lipi_expr('csv_iter(csv_path)', self.env)
+        self.assertIsInstance(rows, types.GeneratorType)
+        self.assertEqual(next(rows), {'name': 'రాము', 'age': '30', 'score': '88.5', 'active': 'true'})
+
+    def test_csv_iter_types_and_columns(self):
+        rows = list(eval_lipi_expr(
+            'csv_ప్రవాహం(csv_path, {age: "int", score: "float", active: "bool"}, ["name", "score"])', self.env))
+        self.assertEqual(rows, [{'name': 'రాము', 'score': 88.5}, {'name': 'Sita, Devi', 'score': None}])
+
+    def test_jsonl_iter(self):
+        rows = list(eval_lipi_expr('jsonl_iter(jsonl_path, {id: "int"}, ["id", "kind"])', self.env))
+        self.assertEqual(rows, [{'id': 1, 'kind': 'click'}, {'id': 2, 'kind': 'view'}])
+
+    def test_for_loop_over_csv_iter(self):
+        lines = [
+            'for row in csv_iter(csv_path, {age: "int"}):',
+            '    print row.age + 1',
+            'end',
+        ]
+        out = StringIO()
+        with redirect_stdout(out):
+            execute_block(lines, self.env)
+        self.assertEqual(out.getvalue().split(), ['31', '29'])
+
+    def test_bad_type_rejected(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('csv_iter(csv_path, {age: "decimal"})', self.env)
+        rows = eval_lipi_expr('csv_iter(csv_path, {name: "int"})', self.env)
+        with self.assertRaises(LipiException):
+            list(rows)
+
+    def test_missing_file(self):
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('jsonl_iter("/nonexistent/file.jsonl")', self.env)
+
+    def test_db_insert_many_from_iterator(self):
+        """Rows stream from csv_iter straight into executemany()"""
+        self.env['db_path'] = os.path.join(self.test_dir, 'bulk.db')
+        lines = [
+            'db = db_connect(db_path, "bulk_load")',
+            'db_query(db, "CREATE TABLE people (name TEXT, age INTEGER)")',
+            'count = డేటాబేస్_బహుళ_చేర్పు(db, "INSERT INTO people VALUES (:name, :age)", csv_iter(csv_path, {age: "int"}))',
+            'people = db_query(db, "SELECT name, age FROM people ORDER BY age")',
+        ]
+        execute_block(lines, self.env)
+        self.assertEqual(self.env['count'], 2)
+        self.assertEqual(self.env['people'], [{'name': 'Sita, Devi', 'age': 28}, {'name': 'రాము', 'age': 30}])
+
+    def test_db_insert_many_rolls_back_on_error(self):
+        self.env['db_path'] = os.path.join(self.test_dir, 'rollback.db')
+        execute_block([
+            'db = db_connect(db_path)',
+            'db_query(db, "CREATE TABLE t (x INTEGER NOT NULL)")',
+        ], self.env)
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('db_insert_many(db, "INSERT INTO t VALUES (?)", [[1], [null]])', self.env)
+        self.assertEqual(eval_lipi_expr('db_query(db, "SELECT * FROM t")', self.env), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for Lipi v3.0 template literals
+Tests f"..." parsing, format specs, escaping and the parsed-template cache
+"""
+
+import unittest
+import os
+import sys
+from io import StringIO
+from contextlib import redirect_stdout
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.lipi import (runtime, execute_block, eval_lipi_expr, LipiException,
+                      parse_template, TEMPLATE_CACHE)
+
+
+class TestTemplateLiterals(unittest.TestCase):
+    """Test f"..." string templates"""
+
+    def setUp(self):
+        runtime.functions.clear()
+        self.env = {'name': 'Ram', 'x': 21, 'tags': ['a', 'b', 'c'], 'd': {'k': 5}}
+
+    def test_fields_and_expressions(self):
+        self.assertEqual(eval_lipi_expr('f"Hello {name}, total {x * 2}"', self.env), 'Hello Ram, total 42')
+        self.assertEqual(eval_lipi_expr("f'{tags[2]}/{d[\"k\"]}'", self.env), 'c/5')
+        self.assertEqual(eval_lipi_expr('f"{len(tags)} items"', self.env), '3 items')
+        self.assertEqual(eval_lipi_expr('f"plain"', self.env), 'plain')
+
+    def test_format_spec_and_braces(self):
+        self.assertEqual(eval_lipi_expr('f"{x:>4}|{3.14159:.2f}|{{x}}"', self.env), '  21|3.14|{x}')
+        with self.assertRaises(LipiException):
+            eval_lipi_expr('f"{name:d}"', self.env)
+
+    def test_concatenation_and_statements(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            execute_block([
+                'function twice(a):',
+                '    return a * 2',
+                'end',
+                'పేరు = "సీత"',
+                'చెప్పు f"నమస్తే {పేరు}!"',
+                'line = f"a {x}" + " / " + f\'{call twice(x)}\'',
+                'print line',
+            ], self.env)
+        self.assertEqual(out.getvalue().split('\n')[:2], ['నమస్తే సీత!', 'a 21 / 42'])
+
+    def test_parsed_once(self):
+        self.assertEqual(parse_template('Hi {name}, {x:>3}!'), ('Hi ', ('name', ''), ', ', ('x', '>3'), '!'))
+        TEMPLATE_CACHE.clear()
+        for _ in range(3):
+            eval_lipi_expr('f"cached {x}"', self.env)
+        self.assertEqual(list(TEMPLATE_CACHE), ['f"cached {x}"'])
+
+    def test_invalid_templates(self):
+        for bad in ['f"{name"', 'f"name}"', 'f"{}"']:
+            with self.assertRaises(LipiException):
+                eval_lipi_expr(bad, self.env)
+
+    def test_template_quote_inside_field(self):
+        """The template's own quote inside {...} is a syntax error, not an unknown expression"""
+        for bad in ['f"{name + "y"}"', "f'{d['k']}'"]:
+            with self.assertRaises(LipiException) as ctx:
+                eval_lipi_expr(bad, self.env)
+            self.assertIn('Invalid syntax', str(ctx.exception))
+        self.assertEqual(eval_lipi_expr('f"{name + \'y\'}"', self.env), 'Ramy')
+        self.assertEqual(eval_lipi_expr('f"{{" + f"{x}"', self.env), '{21')
+
+
+if __name__ == '__main__':
+    unittest.main()